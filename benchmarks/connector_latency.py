@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+"""Compare per-call latency of continue_conversation against ConnectorSession.
+
+Both paths post replies to a local mock Bot Framework connector, so the numbers
+only reflect client side overhead plus the configured mock latency.
+
+    uv run python benchmarks/connector_latency.py --iterations 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from botbuilder.core import BotAdapter, TurnContext
+from botbuilder.integration.aiohttp import (
+    CloudAdapter,
+    ConfigurationBotFrameworkAuthentication,
+)
+from botbuilder.schema import Activity, ActivityTypes
+from botframework.connector.aio import ConnectorClient
+
+from mcp_teams_server.teams import TeamsClient
+from mcp_teams_server.throttling import CONNECTOR, GRAPH, RequestScheduler
+
+# The mock service is shared with the unit tests
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tests.mock_botframework import (  # noqa: E402
+    AnonymousConfiguration,
+    create_app,
+    start,
+)
+
+THREAD_ID = "1743086901347"
+
+
+async def legacy_update_thread(client: TeamsClient, content: str):
+    async def callback(context: TurnContext):
+        # Connector client built by the adapter for this proactive turn
+        connector_client = context.turn_state[BotAdapter.BOT_CONNECTOR_CLIENT_KEY]
+        assert isinstance(connector_client, ConnectorClient)
+        conversations = connector_client.conversations
+        await conversations.send_to_conversation(
+            conversation_id=f"{client.teams_channel_id};messageid={THREAD_ID}",
+            activity=Activity(type=ActivityTypes.message, text=content),
+        )
+
+    await client.adapter.continue_conversation(
+        bot_app_id=client.teams_app_id,
+        reference=client._create_conversation_reference(),
+        callback=callback,
+    )
+
+
+async def session_update_thread(client: TeamsClient, content: str):
+    await client.update_thread(THREAD_ID, content)
+
+
+async def measure(name, operation, client: TeamsClient, iterations: int):
+    # Warm up connections and tokens before timing
+    await operation(client, "warm-up")
+    samples = []
+    for i in range(iterations):
+        start_time = time.perf_counter()
+        await operation(client, f"message {i}")
+        samples.append((time.perf_counter() - start_time) * 1000)
+    samples.sort()
+    p95 = samples[max(0, int(len(samples) * 0.95) - 1)]
+    print(
+        f"{name:<24} n={len(samples):<6} mean={statistics.mean(samples):8.3f}ms "
+        f"p50={statistics.median(samples):8.3f}ms p95={p95:8.3f}ms"
+    )
+
+
+async def run(iterations: int, latency: float):
+    runner, service_url = await start(create_app(latency=latency))
+    try:
+        adapter = CloudAdapter(
+            ConfigurationBotFrameworkAuthentication(AnonymousConfiguration())
+        )
+        client = TeamsClient(
+            adapter,
+            None,  # pyright: ignore
+            "",
+            "team",
+            "19:channel@thread.tacv2",
+            service_url=service_url,
+            # Unlimited, so both paths are timed without client side rate limits
+            scheduler=RequestScheduler({GRAPH: (0, 1), CONNECTOR: (0, 1)}),
+        )
+        await measure("continue_conversation", legacy_update_thread, client, iterations)
+        await measure("connector session", session_update_thread, client, iterations)
+        await client.close()
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Mock connector latency"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations, args.latency_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
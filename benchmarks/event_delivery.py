@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+"""Measure push delivery of channel messages through wait_for_messages.
+
+Starts the server over SSE with the event receiver enabled and activity
+verification disabled. Several agents long poll ``wait_for_messages`` while
+this script posts Teams channel activities to the Bot Framework messaging
+endpoint, standing in for Teams. Reports the latency from post to receipt by
+each agent.
+
+    uv run python benchmarks/event_delivery.py --agents 10 --messages 200
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import aiohttp
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+CHANNEL_ID = "19:benchmark@thread.tacv2"
+THREAD_ID = "1743086901347"
+
+
+def start_server(port: int, store_path: str) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        TEAMS_APP_ID="00000000-0000-0000-0000-000000000000",
+        TEAMS_APP_PASSWORD="secret",
+        TEAMS_APP_TYPE="SingleTenant",
+        TEAMS_APP_TENANT_ID="00000000-0000-0000-0000-000000000000",
+        TEAM_ID="team",
+        TEAMS_CHANNEL_ID=CHANNEL_ID,
+        TEAMS_WARMUP="false",
+        TEAMS_EVENTS="true",
+        TEAMS_EVENTS_VERIFY="false",
+        TEAMS_STORE_PATH=store_path,
+        MCP_TRANSPORT="sse",
+        FASTMCP_PORT=str(port),
+    )
+    return subprocess.Popen(
+        [sys.executable, "-m", "mcp_teams_server"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=env,
+    )
+
+
+async def wait_until_listening(url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                async with session.get(f"{url}/metrics"):
+                    return
+            except aiohttp.ClientError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.1)
+
+
+def activity(index: int) -> dict:
+    return {
+        "type": "message",
+        "id": str(1743086950000 + index),
+        # Time the message was posted, read back by the agents
+        "text": f"{time.perf_counter()}",
+        "conversation": {"id": f"{CHANNEL_ID};messageid={THREAD_ID}"},
+        "channelData": {"channel": {"id": CHANNEL_ID}, "team": {"id": "team"}},
+        "from": {"id": "29:stand-in", "name": "Stand-in"},
+        "serviceUrl": "http://localhost",
+        "channelId": "msteams",
+    }
+
+
+async def agent(url: str, messages: int, ready: asyncio.Event, latencies: list[float]):
+    async with sse_client(f"{url}/sse") as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            result = await session.call_tool("wait_for_messages", {"timeout": 0})
+            cursor = (result.structuredContent or {})["cursor"]
+            ready.set()
+            received = 0
+            while received < messages:
+                result = await session.call_tool(
+                    "wait_for_messages", {"cursor": cursor, "timeout": 10}
+                )
+                events = result.structuredContent or {}
+                now = time.perf_counter()
+                for event in events["items"]:
+                    latencies.append(now - float(event["content"]))
+                received += len(events["items"])
+                cursor = events["cursor"]
+
+
+async def run(args: argparse.Namespace):
+    url = f"http://127.0.0.1:{args.port}"
+    await wait_until_listening(url)
+    latencies: list[float] = []
+    ready = [asyncio.Event() for _ in range(args.agents)]
+    agents = [
+        asyncio.create_task(agent(url, args.messages, event, latencies))
+        for event in ready
+    ]
+    await asyncio.gather(*(event.wait() for event in ready))
+
+    start = time.perf_counter()
+    async with aiohttp.ClientSession() as session:
+        for index in range(args.messages):
+            async with session.post(
+                f"{url}/api/messages", json=activity(index)
+            ) as response:
+                response.raise_for_status()
+            if args.interval > 0:
+                await asyncio.sleep(args.interval)
+    await asyncio.gather(*agents)
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"agents={args.agents} messages={args.messages} "
+        f"deliveries={len(latencies)} in {elapsed:.2f}s"
+    )
+    print(
+        f"delivery latency p50={statistics.median(latencies) * 1000:.1f}ms "
+        f"p99={p99 * 1000:.1f}ms max={latencies[-1] * 1000:.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument("--agents", type=int, default=10)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--interval", type=float, default=0.01)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        server = start_server(args.port, os.path.join(directory, "store.db"))
+        try:
+            asyncio.run(run(args))
+        finally:
+            server.kill()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+"""Drive every MCP tool against the mock Bot Connector and Graph service.
+
+The server runs in process with its tools and application context unchanged.
+The TEAMS_* environment points it at the local mock with anonymous Bot
+Framework authentication, and Graph is reached with a static token. Rate
+limits, retries, pool sizes and delivery settings are read from the usual
+TEAMS_* environment variables. Each tool is called a fixed number of times by
+concurrent workers over one MCP session, and throughput and latency
+percentiles are reported per tool.
+
+    uv run python benchmarks/load_test.py --concurrency 16 --calls 200 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+from mcp import ClientSession
+from mcp.shared.memory import create_connected_server_and_client_session
+
+import mcp_teams_server
+from mcp_teams_server import AppContext, create_app_context
+
+# The mock service is shared with the unit tests
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tests.mock_botframework import (  # noqa: E402
+    CHANNEL,
+    STATS,
+    MockChannel,
+    StaticCredential,
+    create_app,
+    start,
+)
+
+TEAM_ID = "team"
+CHANNEL_ID = "19:channel@thread.tacv2"
+
+# Messages edited and deliveries looked up by the load, posted beforehand
+FIXTURES = 10
+
+
+def configure(service_url: str, store_path: str):
+    """Point the server configuration at the mock service."""
+    os.environ.update(
+        {
+            "TEAMS_APP_ID": "",
+            "TEAMS_APP_PASSWORD": "",
+            "TEAMS_APP_TYPE": "MultiTenant",
+            "TEAMS_APP_TENANT_ID": "",
+            "TEAM_ID": TEAM_ID,
+            "TEAMS_CHANNEL_ID": CHANNEL_ID,
+            "TEAMS_SERVICE_URL": service_url,
+            # The mock speaks plain HTTP/1.1
+            "TEAMS_HTTP2": "false",
+            "TEAMS_STORE_PATH": store_path,
+            # wait_for_messages reads pushed events, which the mock does not sign
+            "TEAMS_EVENTS": "true",
+            "TEAMS_EVENTS_VERIFY": "false",
+        }
+    )
+
+
+def create_lifespan(service_url: str):
+    @asynccontextmanager
+    async def mock_lifespan(server) -> AsyncIterator[AppContext]:
+        async with create_app_context(
+            credentials=StaticCredential(),  # pyright: ignore
+            graph_url=f"{service_url}v1.0",
+        ) as context:
+            yield context
+
+    return mock_lifespan
+
+
+async def post_fixtures(
+    session: ClientSession, channel: MockChannel
+) -> tuple[list[str], list[str]]:
+    """Post the replies edited by edit_message and the deliveries it looks up."""
+    thread_id = next(iter(channel.threads))
+    message_ids = []
+    delivery_ids = []
+    for i in range(FIXTURES):
+        result = await session.call_tool(
+            "update_thread", {"thread_id": thread_id, "content": f"Edited {i}"}
+        )
+        message_ids.append((result.structuredContent or {})["message_id"])
+        result = await session.call_tool(
+            "update_thread",
+            {"thread_id": thread_id, "content": f"Queued {i}", "delivery": "async"},
+        )
+        delivery_ids.append((result.structuredContent or {})["delivery_id"])
+    return message_ids, delivery_ids
+
+
+def tool_calls(
+    channel: MockChannel, message_ids: list[str], delivery_ids: list[str]
+) -> dict[str, Callable[[int], dict[str, Any]]]:
+    """Arguments of the i-th call of each tool, in the order tools are driven."""
+    thread_ids = list(channel.threads)
+
+    def thread(index: int) -> str:
+        return thread_ids[index % len(thread_ids)]
+
+    return {
+        "list_members": lambda i: {},
+        "get_member_by_name": lambda i: {"name": f"Member {i % 10}"},
+        "list_threads": lambda i: {"limit": 20},
+        "list_threads_with_replies": lambda i: {"limit": 10, "replies_limit": 10},
+        "read_thread": lambda i: {"thread_id": thread(i), "limit": 20},
+        "read_threads_replies": lambda i: {
+            "thread_ids": [thread(i + j) for j in range(30)],
+            "limit": 20,
+        },
+        "read_all_thread_replies": lambda i: {
+            "thread_id": thread(i),
+            "max_items": 50,
+            "page_size": 10,
+        },
+        "read_all_threads": lambda i: {"max_items": 100, "page_size": 50},
+        "sync_channel": lambda i: {},
+        "search_messages": lambda i: {"query": f"topic {i % 7}"},
+        "wait_for_messages": lambda i: {"timeout": 0},
+        "start_thread": lambda i: {"title": f"Load {i}", "content": f"Thread {i}"},
+        "update_thread": lambda i: {"thread_id": thread(i), "content": f"Reply {i}"},
+        "edit_message": lambda i: {
+            "message_id": message_ids[i % len(message_ids)],
+            "content": f"Edit {i}",
+        },
+        "post_messages_bulk": lambda i: {
+            "items": [
+                {"thread_id": thread(i), "content": f"Bulk reply {i}.{j}"}
+                for j in range(5)
+            ]
+        },
+        "get_delivery_status": lambda i: {
+            "delivery_id": delivery_ids[i % len(delivery_ids)]
+        },
+    }
+
+
+async def drive(
+    session,
+    name: str,
+    arguments: Callable[[int], dict[str, Any]],
+    calls: int,
+    concurrency: int,
+):
+    latencies: list[float] = []
+    errors = 0
+    indexes = itertools.count()
+
+    async def worker():
+        nonlocal errors
+        while (index := next(indexes)) < calls:
+            start = time.perf_counter()
+            result = await session.call_tool(name, arguments(index))
+            latencies.append(time.perf_counter() - start)
+            if result.isError:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{name:<28} calls={len(latencies):<6} errors={errors:<5} "
+        f"{len(latencies) / elapsed:9.1f}/s "
+        f"p50={statistics.median(latencies) * 1000:9.2f}ms p99={p99 * 1000:9.2f}ms"
+    )
+
+
+async def run(args: argparse.Namespace):
+    app = create_app(
+        latency=args.latency_ms / 1000,
+        threads=args.threads,
+        replies=args.replies,
+        throttle_every=args.throttle_every,
+    )
+    runner, service_url = await start(app)
+    with tempfile.TemporaryDirectory() as directory:
+        configure(service_url, os.path.join(directory, "store.db"))
+        # Swap the lifespan of the MCP server, the application context and every
+        # tool stay the production ones
+        server = mcp_teams_server.mcp._mcp_server
+        server.lifespan = create_lifespan(service_url)
+        try:
+            async with create_connected_server_and_client_session(server) as session:
+                calls = tool_calls(
+                    app[CHANNEL], *await post_fixtures(session, app[CHANNEL])
+                )
+                selected = args.tools.split(",") if args.tools else list(calls)
+                for name in selected:
+                    await drive(
+                        session, name, calls[name], args.calls, args.concurrency
+                    )
+        finally:
+            await runner.cleanup()
+    stats = app[STATS]
+    print(f"mock requests={stats['requests']} throttled={stats['throttled']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--calls", type=int, default=100, help="Calls per tool")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Mock service latency"
+    )
+    parser.add_argument("--threads", type=int, default=100)
+    parser.add_argument("--replies", type=int, default=20)
+    parser.add_argument(
+        "--throttle-every",
+        type=int,
+        default=0,
+        help="Answer every n-th mock request with 429, 0 disables throttling",
+    )
+    parser.add_argument(
+        "--tools", default="", help="Comma separated tools to drive, all by default"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+"""Compare memory and throughput of bulk read results built as models or records.
+
+Both paths turn the same synthetic messages into a tool result the way the
+server does. The models path builds ``TeamsMessage`` models into a
+``PagedTeamsMessages`` page, converted by FastMCP as structured output and
+validated against the output schema. The records path keeps a JSON fragment
+per ``MessageRecord`` and joins them into the page text, returned as
+unstructured output. Peak memory is traced over one conversion, throughput is
+timed over several.
+
+    uv run python benchmarks/message_serialization.py --messages 1000 --runs 20
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import jsonschema
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+
+from mcp_teams_server.models import PagedTeamsMessages, TeamsMessage
+from mcp_teams_server.records import MessageRecord, dump_messages_page
+
+
+def models_result() -> PagedTeamsMessages: ...
+
+
+def records_result() -> str: ...
+
+
+def create_messages(count: int, content_chars: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "thread_id": f"thread-{index // 20}",
+            "message_id": f"message-{index}",
+            # Bytes as read from Graph, decoded per conversion like rendered content
+            "content": (f"Message {index} " * content_chars)[:content_chars].encode(),
+            "sender": f"Member {index % 10}",
+            "created": "2025-01-01T00:00:00Z",
+            "importance": "normal",
+            "mentions": [f"Member {(index + 1) % 10}"] if index % 3 == 0 else None,
+        }
+        for index in range(count)
+    ]
+
+
+def convert_models(messages: list[dict[str, Any]]) -> int:
+    meta = func_metadata(models_result, structured_output=True)
+    items = [
+        TeamsMessage(**{**message, "content": message["content"].decode()})
+        for message in messages
+    ]
+    page = PagedTeamsMessages(
+        cursor=None, limit=len(items), total=len(items), items=items
+    )
+    unstructured, structured = meta.convert_result(page)
+    # The lowlevel server validates structured content against the output schema
+    assert meta.output_schema is not None
+    jsonschema.validate(instance=structured, schema=meta.output_schema)
+    return len(unstructured[0].text)
+
+
+def convert_records(messages: list[dict[str, Any]]) -> int:
+    meta = func_metadata(records_result, structured_output=False)
+    fragments = [
+        MessageRecord(**{**message, "content": message["content"].decode()}).to_json()
+        for message in messages
+    ]
+    unstructured = meta.convert_result(dump_messages_page(fragments, len(fragments)))
+    return len(unstructured[0].text)
+
+
+def measure(
+    name: str,
+    convert: Callable[[list[dict[str, Any]]], int],
+    messages: list[dict[str, Any]],
+    runs: int,
+):
+    tracemalloc.start()
+    size = convert(messages)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        convert(messages)
+        timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+    print(
+        f"{name:<8} output={size / 1024:9.1f}KiB peak={peak / 1024 / 1024:8.2f}MiB "
+        f"median={median * 1000:9.2f}ms {len(messages) / median:10.0f} messages/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--content-chars", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    messages = create_messages(args.messages, args.content_chars)
+    measure("models", convert_models, messages, args.runs)
+    measure("records", convert_records, messages, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+"""Measure import cost and time-to-ready of the server entry point.
+
+Import cost is read from ``python -X importtime`` for the package and for the
+modules it defers, grouped by top level package. Time-to-ready starts
+``python -m mcp_teams_server`` over stdio with dummy credentials and warm-up
+disabled, and times the MCP initialize handshake.
+
+    uv run python benchmarks/startup_time.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+MODULES = [
+    "mcp_teams_server",
+    "mcp_teams_server.teams",
+    "mcp_teams_server.transport",
+]
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "startup-benchmark", "version": "1.0"},
+    },
+}
+
+
+def import_cost(module: str) -> tuple[float, dict[str, float]]:
+    """Import a module in a fresh interpreter.
+
+    Returns:
+        Total import time and cumulative time per top level package, in ms
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0.0
+    packages: dict[str, float] = defaultdict(float)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Nested imports are indented, only count the outermost ones
+        if not name.startswith("  "):
+            milliseconds = int(cumulative) / 1000
+            total += milliseconds
+            packages[name.strip().split(".")[0]] += milliseconds
+    return total, packages
+
+
+def time_to_ready(store_path: str) -> float:
+    """Start the server over stdio and time the initialize response, in ms."""
+    env = dict(
+        os.environ,
+        TEAMS_APP_ID="00000000-0000-0000-0000-000000000000",
+        TEAMS_APP_PASSWORD="secret",
+        TEAMS_APP_TYPE="SingleTenant",
+        TEAMS_APP_TENANT_ID="00000000-0000-0000-0000-000000000000",
+        TEAM_ID="team",
+        TEAMS_CHANNEL_ID="channel",
+        TEAMS_WARMUP="false",
+        MCP_TRANSPORT="stdio",
+        TEAMS_STORE_PATH=store_path,
+    )
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "mcp_teams_server"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env,
+        text=True,
+    )
+    try:
+        assert process.stdin is not None and process.stdout is not None
+        process.stdin.write(json.dumps(INITIALIZE) + "\n")
+        process.stdin.flush()
+        response = process.stdout.readline()
+        elapsed = (time.perf_counter() - start) * 1000
+        if '"result"' not in response:
+            raise RuntimeError(f"Unexpected initialize response: {response!r}")
+        return elapsed
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    for module in MODULES:
+        totals = []
+        packages: dict[str, float] = {}
+        for _ in range(args.runs):
+            total, packages = import_cost(module)
+            totals.append(total)
+        print(
+            f"import {module:<28} median={statistics.median(totals):9.1f}ms "
+            f"min={min(totals):9.1f}ms"
+        )
+        ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+        for package, milliseconds in ranked[: args.top]:
+            print(f"    {package:<32} {milliseconds:9.1f}ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        samples = [
+            time_to_ready(os.path.join(directory, "store.db")) for _ in range(args.runs)
+        ]
+    print(
+        f"{'time-to-ready':<35} median={statistics.median(samples):9.1f}ms "
+        f"min={min(samples):9.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,50 +1,84 @@
 # SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
 # SPDX-License-Identifier: Apache-2.0
+import json
 import logging
 import os
+import secrets
+import sqlite3
 import sys
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import aclosing, asynccontextmanager
 from dataclasses import dataclass
+from datetime import datetime
 from importlib import metadata
+from typing import TYPE_CHECKING, Any
 
-from azure.identity.aio import ClientSecretCredential
-from botbuilder.integration.aiohttp import (
-    CloudAdapter,
-    ConfigurationBotFrameworkAuthentication,
-)
-from dotenv import load_dotenv
 from mcp.server.fastmcp import Context, FastMCP
-from msgraph.graph_service_client import GraphServiceClient
 from pydantic import Field
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
 
 from .config import BotConfiguration
-from .teams import (
+from .delivery import DeliveryMode, DeliveryQueue
+from .events import RECEIVER
+from .filters import Importance, MessageFilter
+from .metrics import METRICS, instrumented
+from .models import (
     PagedTeamsMessages,
-    TeamsClient,
+    PagedTeamsSearchResults,
+    PagedTeamsThreads,
+    TeamsBulkPost,
+    TeamsBulkPostResult,
+    TeamsDelivery,
+    TeamsEvent,
+    TeamsEvents,
     TeamsMember,
     TeamsMessage,
     TeamsThread,
+    TeamsThreadReplies,
 )
+from .pool import TeamsClientPool
+from .records import dump_messages_page
+from .rendering import ContentMode, MessageField
+from .shared import SharedResource
+from .store import DEFAULT_SYNC_CONSUMER, SEARCH_SYNC_CONSUMER
+from .warmup import READINESS
+
+# The Bot Framework, Graph and Azure identity stacks take seconds to import,
+# they are imported when the server starts instead of with the package
+if TYPE_CHECKING:
+    from azure.core.credentials_async import AsyncTokenCredential
+
+    from .teams import TeamsClient
 
 try:
     __version__ = metadata.version("mcp-teams-server")
 except metadata.PackageNotFoundError:
     __version__ = "unknown"
 
-# Load .env
-load_dotenv()
+LOGGER = logging.getLogger(__name__)
+
+_configured = False
 
-# Config logging
-logging.basicConfig(
-    level=os.environ.get("MCP_LOGLEVEL", "ERROR"),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stderr),
-    ],
-)
 
-LOGGER = logging.getLogger(__name__)
+def _configure():
+    """Load .env and configure logging, only the first time it is called."""
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    logging.basicConfig(
+        level=os.environ.get("MCP_LOGLEVEL", "ERROR"),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.StreamHandler(sys.stderr),
+        ],
+    )
+
 
 REQUIRED_ENV_VARS = [
     "TEAMS_APP_ID",
@@ -58,32 +92,274 @@ REQUIRED_ENV_VARS = [
 
 @dataclass
 class AppContext:
-    client: TeamsClient
+    pool: TeamsClientPool
+    deliveries: DeliveryQueue | None = None
+    delivery_mode: str = "sync"
 
 
 @asynccontextmanager
-async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
-    """Manage application lifecycle with type-safe context"""
+async def create_app_context(
+    credentials: "AsyncTokenCredential | None" = None,
+    graph_url: str | None = None,
+) -> AsyncIterator[AppContext]:
+    """Build the clients, caches and workers shared by every MCP session.
+
+    Args:
+        credentials: Credentials requesting Graph tokens, the app client secret
+            by default
+        graph_url: Graph endpoint, the global v1.0 endpoint by default
+    """
+    from azure.core.pipeline.transport import AioHttpTransport
+    from azure.identity.aio import ClientSecretCredential
+    from botbuilder.integration.aiohttp import (
+        CloudAdapter,
+        ConfigurationBotFrameworkAuthentication,
+    )
+
+    from .cache import ReadCache
+    from .connector import ConnectorSession
+    from .events import ChannelSubscription
+    from .roster import TeamsRoster
+    from .singleflight import SingleFlight, merge_stats
+    from .store import SUPPORTS_DELIVERIES, TeamsStore
+    from .teams import TeamsClient
+    from .throttling import CONNECTOR, GRAPH, RequestScheduler
+    from .transport import SharedTransport
+    from .warmup import TokenWarmer
+
+    # Servers started without main(), e.g. by the mcp CLI, load .env here
+    _configure()
 
     # Bot adapter construction
     bot_config = BotConfiguration()
     adapter = CloudAdapter(ConfigurationBotFrameworkAuthentication(bot_config))
 
-    # Graph client construction
-    credentials = ClientSecretCredential(
-        bot_config.APP_TENANTID, bot_config.APP_ID, bot_config.APP_PASSWORD
+    # Graph client construction over pooled keep-alive connections
+    transport = SharedTransport(
+        pool_size=bot_config.HTTP_POOL_SIZE,
+        keepalive_expiry=bot_config.HTTP_KEEPALIVE,
+        http2=bot_config.HTTP2,
+        dns_cache_ttl=bot_config.DNS_CACHE_TTL,
     )
+    if credentials is None:
+        credentials = ClientSecretCredential(
+            bot_config.APP_TENANTID,
+            bot_config.APP_ID,
+            bot_config.APP_PASSWORD,
+            transport=AioHttpTransport(
+                session=transport.aiohttp_session(), session_owner=False
+            ),
+        )
     scopes = ["https://graph.microsoft.com/.default"]
-    graph_client = GraphServiceClient(credentials=credentials, scopes=scopes)
+    graph_client = transport.create_graph_client(
+        credentials, scopes, base_url=graph_url
+    )
+
+    store = TeamsStore(bot_config.STORE_PATH)
+    scheduler = RequestScheduler(
+        {
+            GRAPH: (bot_config.GRAPH_RATE_LIMIT, bot_config.GRAPH_CONCURRENCY),
+            CONNECTOR: (
+                bot_config.CONNECTOR_RATE_LIMIT,
+                bot_config.CONNECTOR_CONCURRENCY,
+            ),
+        },
+        max_retries=bot_config.MAX_RETRIES,
+    )
+
+    session = ConnectorSession(
+        adapter, bot_config.APP_ID, bot_config.SERVICE_URL, scheduler=scheduler
+    )
 
-    client = TeamsClient(
-        adapter,
-        graph_client,
-        bot_config.APP_ID,
+    # Channels of the same team share the member roster, and every client and
+    # session shares the cached and in-flight reads
+    rosters: dict[str, TeamsRoster] = {}
+    read_cache = ReadCache(
+        max_size=bot_config.READ_CACHE_SIZE, ttl=bot_config.READ_CACHE_TTL
+    )
+    single_flight = SingleFlight()
+
+    def create_client(team_id: str, channel_id: str) -> TeamsClient:
+        client = TeamsClient(
+            adapter,
+            graph_client,
+            bot_config.APP_ID,
+            team_id,
+            channel_id,
+            members_cache_ttl=bot_config.MEMBERS_CACHE_TTL,
+            service_url=bot_config.SERVICE_URL,
+            session=session,
+            store=store,
+            scheduler=scheduler,
+            roster=rosters.get(team_id),
+            content_mode=bot_config.CONTENT_MODE,  # pyright: ignore
+            max_content_chars=bot_config.MAX_CONTENT_CHARS,
+            max_response_bytes=bot_config.MAX_RESPONSE_BYTES,
+            read_cache=read_cache,
+            single_flight=single_flight,
+            coalesce_window=bot_config.COALESCE_WINDOW,
+            coalesce_max_messages=bot_config.COALESCE_MAX_MESSAGES,
+            coalesce_max_chars=bot_config.COALESCE_MAX_CHARS,
+            edit_debounce=bot_config.EDIT_DEBOUNCE,
+        )
+        rosters.setdefault(team_id, client.roster)
+        return client
+
+    pool = TeamsClientPool(
+        create_client,
         bot_config.TEAM_ID,
         bot_config.TEAMS_CHANNEL_ID,
+        max_size=bot_config.CLIENT_POOL_SIZE,
+        allowed_channels=bot_config.ALLOWED_CHANNELS,
+    )
+    METRICS.register_collector("scheduler", scheduler.stats)
+    METRICS.register_collector("pool", pool.stats)
+    METRICS.register_collector("transport", transport.stats)
+    METRICS.register_collector(
+        "roster", lambda: {team: roster.stats() for team, roster in rosters.items()}
+    )
+    METRICS.register_collector(
+        "single_flight",
+        lambda: merge_stats(
+            single_flight.stats(),
+            *(roster.single_flight.stats() for roster in rosters.values()),
+        ),
+    )
+    METRICS.register_collector("read_cache", read_cache.stats)
+
+    METRICS.register_collector(
+        "coalescing",
+        lambda: {
+            f"{client.team_id}/{client.teams_channel_id}": client.coalescer.stats()
+            for client in pool.clients()
+            if client.coalescer is not None
+        },
+    )
+    METRICS.register_collector(
+        "edits",
+        lambda: {
+            f"{client.team_id}/{client.teams_channel_id}": client.edit_debouncer.stats()
+            for client in pool.clients()
+        },
     )
-    yield AppContext(client=client)
+
+    # Posts spooled to the store and sent in the background
+    deliveries = None
+    if bot_config.DELIVERY_WORKERS > 0 and not SUPPORTS_DELIVERIES:
+        LOGGER.warning(
+            f"Asynchronous delivery disabled, SQLite {sqlite3.sqlite_version} "
+            "is older than 3.35"
+        )
+    elif bot_config.DELIVERY_WORKERS > 0:
+        deliveries = DeliveryQueue(
+            store,
+            pool,
+            workers=bot_config.DELIVERY_WORKERS,
+            max_attempts=bot_config.DELIVERY_MAX_ATTEMPTS,
+            retry_delay=bot_config.DELIVERY_RETRY_DELAY,
+        )
+        METRICS.register_collector("delivery", deliveries.stats)
+
+    # Acquire tokens and resolve the service url before the first request
+    READINESS.reset()
+    warmer = TokenWarmer(
+        credentials,
+        scopes,
+        session,
+        refresh_margin=bot_config.TOKEN_REFRESH_MARGIN,
+    )
+    METRICS.register_collector("tokens", warmer.stats)
+    if bot_config.WARMUP:
+        await warmer.warm_up(
+            await pool.get(),
+            warm_roster=bot_config.WARMUP_ROSTER,
+            timeout=bot_config.WARMUP_TIMEOUT,
+        )
+        warmer.start()
+    else:
+        READINESS.finish()
+
+    # Push delivery of channel messages to wait_for_messages
+    subscription = None
+
+    def invalidate_cached_reads(event: TeamsEvent):
+        for client in pool.clients():
+            if client.teams_channel_id == event.channel_id and event.thread_id:
+                client.invalidate_reads(event.thread_id, event.message_id)
+
+    if bot_config.EVENTS:
+        client_state = bot_config.NOTIFICATION_CLIENT_STATE or secrets.token_urlsafe(32)
+        RECEIVER.start(
+            adapter,
+            client_state,
+            verify_activities=bot_config.EVENTS_VERIFY,
+            buffer_size=bot_config.EVENT_BUFFER_SIZE,
+        )
+        RECEIVER.buffer.subscribe(invalidate_cached_reads)
+        METRICS.register_collector("events", RECEIVER.stats)
+        if bot_config.NOTIFICATION_URL:
+            subscription = ChannelSubscription(
+                graph_client,
+                scheduler,
+                bot_config.TEAM_ID,
+                bot_config.TEAMS_CHANNEL_ID,
+                bot_config.NOTIFICATION_URL,
+                client_state,
+            )
+            subscription.start()
+    # In sync mode the workers start with the first asynchronous post, or now
+    # to send the messages still queued when the server stopped
+    if deliveries is not None and (
+        bot_config.DELIVERY_MODE == "async" or await store.has_unfinished_deliveries()
+    ):
+        deliveries.start()
+    try:
+        yield AppContext(
+            pool=pool,
+            deliveries=deliveries,
+            delivery_mode=bot_config.DELIVERY_MODE,
+        )
+    finally:
+        METRICS.unregister_collector("scheduler")
+        METRICS.unregister_collector("pool")
+        METRICS.unregister_collector("roster")
+        METRICS.unregister_collector("transport")
+        METRICS.unregister_collector("tokens")
+        METRICS.unregister_collector("read_cache")
+        METRICS.unregister_collector("single_flight")
+        METRICS.unregister_collector("coalescing")
+        METRICS.unregister_collector("edits")
+        METRICS.unregister_collector("events")
+        METRICS.unregister_collector("delivery")
+        if bot_config.EVENTS:
+            RECEIVER.buffer.unsubscribe(invalidate_cached_reads)
+            RECEIVER.stop()
+        if subscription is not None:
+            await subscription.close()
+        await warmer.close()
+        if deliveries is not None:
+            await deliveries.close()
+        await pool.close()
+        await session.close()
+        await credentials.close()
+        await transport.close()
+        store.close()
+
+
+APP_CONTEXT = SharedResource(create_app_context)
+
+
+@asynccontextmanager
+async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
+    """Borrow the server wide application context for an MCP session.
+
+    FastMCP enters the lifespan once per client connection, so SSE clients
+    would each build their own clients, caches and workers. They share the
+    context instead, built by the first session and held by ``main`` for the
+    whole process.
+    """
+    async with APP_CONTEXT.hold() as context:
+        yield context
 
 
 mcp = FastMCP(
@@ -101,13 +377,72 @@ mcp = FastMCP(
 )
 
 
-def _get_teams_client(ctx: Context) -> TeamsClient:
-    return ctx.request_context.lifespan_context.client
+async def _get_teams_client(ctx: Context, channel: str | None = None) -> "TeamsClient":
+    return await ctx.request_context.lifespan_context.pool.get(channel)
+
+
+def _get_delivery_queue(
+    ctx: Context, delivery: DeliveryMode | None
+) -> DeliveryQueue | None:
+    """Queue posts are spooled to, None when they are sent right away."""
+    context = ctx.request_context.lifespan_context
+    if (delivery or context.delivery_mode) != "async":
+        return None
+    if context.deliveries is None:
+        raise ValueError(
+            "Asynchronous delivery requires TEAMS_DELIVERY_WORKERS above 0 "
+            "and SQLite 3.35 or later"
+        )
+    context.deliveries.start()
+    return context.deliveries
+
+
+def _create_message_filter(
+    since: datetime | None,
+    sender: str | None,
+    has_mention: bool | None,
+    importance: Importance | None,
+) -> MessageFilter | None:
+    message_filter = MessageFilter(since, sender, has_mention, importance)
+    return None if message_filter.empty else message_filter
+
+
+CHANNEL_DESCRIPTION = (
+    "Channel as 'team_id/channel_id' or as a channel ID of the default team, "
+    "defaults to the configured channel"
+)
+
+CONTENT_MODE_DESCRIPTION = (
+    "Message content format: raw Teams HTML, text, markdown or a short summary, "
+    "defaults to the configured mode"
+)
+MAX_CONTENT_CHARS_DESCRIPTION = (
+    "Maximum characters of content per message, 0 for no limit, defaults to the "
+    "configured limit"
+)
+FIELDS_DESCRIPTION = (
+    "Extra message fields to include: sender, created, modified, importance or mentions"
+)
+SINCE_DESCRIPTION = "Only return messages modified at or after this ISO 8601 timestamp"
+SENDER_DESCRIPTION = "Only return messages sent by this display name or user ID"
+HAS_MENTION_DESCRIPTION = (
+    "Only return messages with mentions when true, or without mentions when false"
+)
+DELIVERY_DESCRIPTION = (
+    "sync waits until Teams accepts the message, async queues it and returns a "
+    "delivery ID at once, defaults to the configured mode"
+)
+IMPORTANCE_DESCRIPTION = "Only return messages of this importance"
+MAX_RESPONSE_BYTES_DESCRIPTION = (
+    "Maximum bytes of message content in the whole response, later messages are "
+    "truncated or left empty, 0 for no limit, defaults to the configured limit"
+)
 
 
 @mcp.tool(
     name="start_thread", description="Start a new thread with a given title and content"
 )
+@instrumented("tool")
 async def start_thread(
     ctx: Context,
     title: str = Field(description="The thread title"),
@@ -115,15 +450,28 @@ async def start_thread(
     member_name: str | None = Field(
         description="Member name to mention in the thread", default=None
     ),
+    delivery: DeliveryMode | None = Field(
+        description=DELIVERY_DESCRIPTION, default=None
+    ),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
 ) -> TeamsThread:
     await ctx.debug(f"start_thread with title={title} and content={content}")
-    client = _get_teams_client(ctx)
+    client = await _get_teams_client(ctx, channel)
+    deliveries = _get_delivery_queue(ctx, delivery)
+    if deliveries is not None:
+        queued = await deliveries.enqueue(
+            client.team_id, client.teams_channel_id, None, title, content, member_name
+        )
+        return TeamsThread(
+            thread_id="", title=title, content=content, delivery_id=queued.delivery_id
+        )
     return await client.start_thread(title, content, member_name)
 
 
 @mcp.tool(
     name="update_thread", description="Update an existing thread with new content"
 )
+@instrumented("tool")
 async def update_thread(
     ctx: Context,
     thread_id: str = Field(
@@ -133,25 +481,273 @@ async def update_thread(
     member_name: str | None = Field(
         description="Member name to mention in the thread", default=None
     ),
+    delivery: DeliveryMode | None = Field(
+        description=DELIVERY_DESCRIPTION, default=None
+    ),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
 ) -> TeamsMessage:
     await ctx.debug(f"update_thread with thread_id={thread_id} and content={content}")
-    client = _get_teams_client(ctx)
+    client = await _get_teams_client(ctx, channel)
+    deliveries = _get_delivery_queue(ctx, delivery)
+    if deliveries is not None:
+        queued = await deliveries.enqueue(
+            client.team_id,
+            client.teams_channel_id,
+            thread_id,
+            None,
+            content,
+            member_name,
+        )
+        return TeamsMessage(
+            thread_id=thread_id,
+            message_id="",
+            content=content,
+            delivery_id=queued.delivery_id,
+        )
     return await client.update_thread(thread_id, content, member_name)
 
 
-@mcp.tool(name="read_thread", description="Read replies in a thread")
+@mcp.tool(
+    name="edit_message",
+    description="Replace the content of a thread or reply posted by this server, "
+    "to keep a single status message up to date instead of adding replies",
+)
+@instrumented("tool")
+async def edit_message(
+    ctx: Context,
+    message_id: str = Field(
+        description="ID of the thread or reply to edit, as returned by start_thread "
+        "or update_thread"
+    ),
+    content: str = Field(description="The new message content"),
+    member_name: str | None = Field(
+        description="Member name to mention in the message", default=None
+    ),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
+) -> TeamsMessage:
+    await ctx.debug(f"edit_message with message_id={message_id} and content={content}")
+    client = await _get_teams_client(ctx, channel)
+    return await client.edit_message(message_id, content, member_name)
+
+
+@mcp.tool(
+    name="post_messages_bulk",
+    description="Post many replies or new threads at once, keeping order per thread",
+)
+@instrumented("tool")
+async def post_messages_bulk(
+    ctx: Context,
+    items: list[TeamsBulkPost] = Field(
+        description="Messages to post, replies when thread_id is set, new threads "
+        "when only title is set"
+    ),
+    concurrency: int = Field(
+        description="Maximum number of threads posted to at the same time", default=8
+    ),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
+) -> list[TeamsBulkPostResult]:
+    await ctx.debug(f"post_messages_bulk with {len(items)} items")
+    client = await _get_teams_client(ctx, channel)
+    return await client.post_messages_bulk(items, concurrency)
+
+
+@mcp.tool(
+    name="get_delivery_status",
+    description="Get the status of a message queued for asynchronous delivery",
+)
+@instrumented("tool")
+async def get_delivery_status(
+    ctx: Context,
+    delivery_id: str = Field(
+        description="Delivery ID returned by start_thread or update_thread"
+    ),
+) -> TeamsDelivery:
+    await ctx.debug(f"get_delivery_status with delivery_id={delivery_id}")
+    deliveries = ctx.request_context.lifespan_context.deliveries
+    if deliveries is None:
+        raise ValueError(
+            "Asynchronous delivery requires TEAMS_DELIVERY_WORKERS above 0 "
+            "and SQLite 3.35 or later"
+        )
+    delivery = await deliveries.get(delivery_id)
+    if delivery is None:
+        raise ValueError(f"Delivery {delivery_id} not found")
+    return TeamsDelivery(
+        delivery_id=delivery.delivery_id,
+        status=delivery.status,
+        attempts=delivery.attempts,
+        channel=f"{delivery.team_id}/{delivery.channel_id}",
+        thread_id=delivery.thread_id,
+        message_id=delivery.message_id,
+        error=delivery.error,
+        created=delivery.created_at,
+        updated=delivery.updated_at,
+    )
+
+
+@mcp.tool(name="read_thread", description="Read replies in a thread with pagination")
+@instrumented("tool")
 async def read_thread(
     ctx: Context,
     thread_id: str = Field(
         description="The thread ID as a string in the format '1743086901347'"
     ),
+    limit: int = Field(
+        description="Maximum number of items to retrieve or page size", default=50
+    ),
+    cursor: str | None = Field(
+        description="Pagination cursor for the next page of results", default=None
+    ),
+    since: datetime | None = Field(description=SINCE_DESCRIPTION, default=None),
+    sender: str | None = Field(description=SENDER_DESCRIPTION, default=None),
+    has_mention: bool | None = Field(description=HAS_MENTION_DESCRIPTION, default=None),
+    importance: Importance | None = Field(
+        description=IMPORTANCE_DESCRIPTION, default=None
+    ),
+    content_mode: ContentMode | None = Field(
+        description=CONTENT_MODE_DESCRIPTION, default=None
+    ),
+    max_content_chars: int | None = Field(
+        description=MAX_CONTENT_CHARS_DESCRIPTION, default=None
+    ),
+    max_response_bytes: int | None = Field(
+        description=MAX_RESPONSE_BYTES_DESCRIPTION, default=None
+    ),
+    fields: list[MessageField] | None = Field(
+        description=FIELDS_DESCRIPTION, default=None
+    ),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
 ) -> PagedTeamsMessages:
-    await ctx.debug(f"read_thread with thread_id={thread_id}")
-    client = _get_teams_client(ctx)
-    return await client.read_thread_replies(thread_id, 50)
+    await ctx.debug(
+        f"read_thread with thread_id={thread_id}, cursor={cursor} and limit={limit}"
+    )
+    client = await _get_teams_client(ctx, channel)
+    renderer = client.create_renderer(
+        content_mode, max_content_chars, max_response_bytes, fields
+    )
+    message_filter = _create_message_filter(since, sender, has_mention, importance)
+    return await client.read_thread_replies(
+        thread_id, limit, cursor, renderer, message_filter
+    )
+
+
+@mcp.tool(
+    name="read_threads_replies",
+    description="Read replies of many threads at once, with a result or an error "
+    "per thread",
+)
+@instrumented("tool")
+async def read_threads_replies(
+    ctx: Context,
+    thread_ids: list[str] = Field(
+        description="The thread IDs as strings in the format '1743086901347'"
+    ),
+    limit: int = Field(
+        description="Maximum number of replies to retrieve per thread", default=50
+    ),
+    since: datetime | None = Field(description=SINCE_DESCRIPTION, default=None),
+    sender: str | None = Field(description=SENDER_DESCRIPTION, default=None),
+    has_mention: bool | None = Field(description=HAS_MENTION_DESCRIPTION, default=None),
+    importance: Importance | None = Field(
+        description=IMPORTANCE_DESCRIPTION, default=None
+    ),
+    content_mode: ContentMode | None = Field(
+        description=CONTENT_MODE_DESCRIPTION, default=None
+    ),
+    max_content_chars: int | None = Field(
+        description=MAX_CONTENT_CHARS_DESCRIPTION, default=None
+    ),
+    max_response_bytes: int | None = Field(
+        description=MAX_RESPONSE_BYTES_DESCRIPTION, default=None
+    ),
+    fields: list[MessageField] | None = Field(
+        description=FIELDS_DESCRIPTION, default=None
+    ),
+    concurrency: int = Field(
+        description="Maximum number of threads read at the same time", default=8
+    ),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
+) -> list[TeamsThreadReplies]:
+    await ctx.debug(
+        f"read_threads_replies with {len(thread_ids)} threads and limit={limit}"
+    )
+    client = await _get_teams_client(ctx, channel)
+    renderer = client.create_renderer(
+        content_mode, max_content_chars, max_response_bytes, fields
+    )
+    message_filter = _create_message_filter(since, sender, has_mention, importance)
+    return await client.read_threads_replies(
+        thread_ids, limit, renderer, message_filter, concurrency
+    )
+
+
+# Bulk reads return their JSON text built in one pass from message fragments,
+# without structured output FastMCP would serialize, dump and validate again
+@mcp.tool(
+    name="read_all_thread_replies",
+    description="Read every reply in a thread following pagination, returns a "
+    "JSON page of messages",
+    structured_output=False,
+)
+@instrumented("tool")
+async def read_all_thread_replies(
+    ctx: Context,
+    thread_id: str = Field(
+        description="The thread ID as a string in the format '1743086901347'"
+    ),
+    max_items: int = Field(
+        description="Maximum number of replies to retrieve", default=2000
+    ),
+    since: datetime | None = Field(description=SINCE_DESCRIPTION, default=None),
+    page_size: int = Field(description="Page size used on each request", default=50),
+    sender: str | None = Field(description=SENDER_DESCRIPTION, default=None),
+    has_mention: bool | None = Field(description=HAS_MENTION_DESCRIPTION, default=None),
+    importance: Importance | None = Field(
+        description=IMPORTANCE_DESCRIPTION, default=None
+    ),
+    content_mode: ContentMode | None = Field(
+        description=CONTENT_MODE_DESCRIPTION, default=None
+    ),
+    max_content_chars: int | None = Field(
+        description=MAX_CONTENT_CHARS_DESCRIPTION, default=None
+    ),
+    max_response_bytes: int | None = Field(
+        description=MAX_RESPONSE_BYTES_DESCRIPTION, default=None
+    ),
+    fields: list[MessageField] | None = Field(
+        description=FIELDS_DESCRIPTION, default=None
+    ),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
+) -> str:
+    await ctx.debug(
+        f"read_all_thread_replies with thread_id={thread_id} and max_items={max_items}"
+    )
+    client = await _get_teams_client(ctx, channel)
+    renderer = client.create_renderer(
+        content_mode, max_content_chars, max_response_bytes, fields
+    )
+    message_filter = _create_message_filter(since, sender, has_mention, importance)
+    fragments = []
+    replies = client.stream_thread_replies(
+        thread_id,
+        page_size=page_size,
+        max_items=max_items,
+        renderer=renderer,
+        message_filter=message_filter,
+    )
+    async with aclosing(replies):
+        async for reply in replies:
+            fragments.append(reply.to_json())
+            # Stop reading pages once the response budget is spent
+            if renderer.exhausted:
+                break
+            if len(fragments) % page_size == 0:
+                await ctx.report_progress(len(fragments), max_items)
+    return dump_messages_page(fragments, limit=max_items)
 
 
 @mcp.tool(name="list_threads", description="List threads in channel with pagination")
+@instrumented("tool")
 async def list_threads(
     ctx: Context,
     limit: int = Field(
@@ -160,28 +756,386 @@ async def list_threads(
     cursor: str | None = Field(
         description="Pagination cursor for the next page of results", default=None
     ),
+    since: datetime | None = Field(description=SINCE_DESCRIPTION, default=None),
+    sender: str | None = Field(description=SENDER_DESCRIPTION, default=None),
+    has_mention: bool | None = Field(description=HAS_MENTION_DESCRIPTION, default=None),
+    importance: Importance | None = Field(
+        description=IMPORTANCE_DESCRIPTION, default=None
+    ),
+    content_mode: ContentMode | None = Field(
+        description=CONTENT_MODE_DESCRIPTION, default=None
+    ),
+    max_content_chars: int | None = Field(
+        description=MAX_CONTENT_CHARS_DESCRIPTION, default=None
+    ),
+    max_response_bytes: int | None = Field(
+        description=MAX_RESPONSE_BYTES_DESCRIPTION, default=None
+    ),
+    fields: list[MessageField] | None = Field(
+        description=FIELDS_DESCRIPTION, default=None
+    ),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
 ) -> PagedTeamsMessages:
     await ctx.debug(f"list_threads with cursor={cursor} and limit={limit}")
-    client = _get_teams_client(ctx)
-    return await client.read_threads(limit, cursor)
+    client = await _get_teams_client(ctx, channel)
+    renderer = client.create_renderer(
+        content_mode, max_content_chars, max_response_bytes, fields
+    )
+    message_filter = _create_message_filter(since, sender, has_mention, importance)
+    return await client.read_threads(limit, cursor, renderer, message_filter)
+
+
+@mcp.tool(
+    name="list_threads_with_replies",
+    description="List threads in channel including their replies with pagination",
+)
+@instrumented("tool")
+async def list_threads_with_replies(
+    ctx: Context,
+    limit: int = Field(
+        description="Maximum number of threads to retrieve or page size", default=50
+    ),
+    cursor: str | None = Field(
+        description="Pagination cursor for the next page of results", default=None
+    ),
+    replies_limit: int = Field(
+        description="Maximum number of replies to retrieve per thread", default=50
+    ),
+    since: datetime | None = Field(description=SINCE_DESCRIPTION, default=None),
+    sender: str | None = Field(description=SENDER_DESCRIPTION, default=None),
+    has_mention: bool | None = Field(description=HAS_MENTION_DESCRIPTION, default=None),
+    importance: Importance | None = Field(
+        description=IMPORTANCE_DESCRIPTION, default=None
+    ),
+    content_mode: ContentMode | None = Field(
+        description=CONTENT_MODE_DESCRIPTION, default=None
+    ),
+    max_content_chars: int | None = Field(
+        description=MAX_CONTENT_CHARS_DESCRIPTION, default=None
+    ),
+    max_response_bytes: int | None = Field(
+        description=MAX_RESPONSE_BYTES_DESCRIPTION, default=None
+    ),
+    fields: list[MessageField] | None = Field(
+        description=FIELDS_DESCRIPTION, default=None
+    ),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
+) -> PagedTeamsThreads:
+    await ctx.debug(
+        f"list_threads_with_replies with cursor={cursor}, limit={limit} "
+        f"and replies_limit={replies_limit}"
+    )
+    client = await _get_teams_client(ctx, channel)
+    renderer = client.create_renderer(
+        content_mode, max_content_chars, max_response_bytes, fields
+    )
+    message_filter = _create_message_filter(since, sender, has_mention, importance)
+    return await client.read_threads_with_replies(
+        limit, cursor, replies_limit, renderer, message_filter
+    )
+
+
+@mcp.tool(
+    name="sync_channel",
+    description="Get threads and replies created or changed since the previous sync",
+)
+@instrumented("tool")
+async def sync_channel(
+    ctx: Context,
+    since: datetime | None = Field(
+        description="ISO 8601 lower bound used when there is no previous sync",
+        default=None,
+    ),
+    reset: bool = Field(
+        description="Forget the previous sync and read the whole channel", default=False
+    ),
+    consumer: str = Field(
+        description="Name of the caller, each consumer continues its own previous "
+        "sync and callers sharing a name share their sync",
+        default=DEFAULT_SYNC_CONSUMER,
+    ),
+    content_mode: ContentMode | None = Field(
+        description=CONTENT_MODE_DESCRIPTION, default=None
+    ),
+    max_content_chars: int | None = Field(
+        description=MAX_CONTENT_CHARS_DESCRIPTION, default=None
+    ),
+    max_response_bytes: int | None = Field(
+        description=MAX_RESPONSE_BYTES_DESCRIPTION, default=None
+    ),
+    fields: list[MessageField] | None = Field(
+        description=FIELDS_DESCRIPTION, default=None
+    ),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
+) -> PagedTeamsThreads:
+    await ctx.debug(
+        f"sync_channel with since={since}, reset={reset} and consumer={consumer}"
+    )
+    client = await _get_teams_client(ctx, channel)
+    renderer = client.create_renderer(
+        content_mode, max_content_chars, max_response_bytes, fields
+    )
+    return await client.sync_channel(since, reset, renderer, consumer)
+
+
+@mcp.tool(
+    name="read_all_threads",
+    description="Read every thread in channel following pagination up to a bound, "
+    "returns a JSON page of messages",
+    structured_output=False,
+)
+@instrumented("tool")
+async def read_all_threads(
+    ctx: Context,
+    max_items: int = Field(
+        description="Maximum number of threads to retrieve", default=500
+    ),
+    since: datetime | None = Field(
+        description="Only return threads modified at or after this ISO 8601 timestamp",
+        default=None,
+    ),
+    page_size: int = Field(description="Page size used on each request", default=50),
+    sender: str | None = Field(description=SENDER_DESCRIPTION, default=None),
+    has_mention: bool | None = Field(description=HAS_MENTION_DESCRIPTION, default=None),
+    importance: Importance | None = Field(
+        description=IMPORTANCE_DESCRIPTION, default=None
+    ),
+    content_mode: ContentMode | None = Field(
+        description=CONTENT_MODE_DESCRIPTION, default=None
+    ),
+    max_content_chars: int | None = Field(
+        description=MAX_CONTENT_CHARS_DESCRIPTION, default=None
+    ),
+    max_response_bytes: int | None = Field(
+        description=MAX_RESPONSE_BYTES_DESCRIPTION, default=None
+    ),
+    fields: list[MessageField] | None = Field(
+        description=FIELDS_DESCRIPTION, default=None
+    ),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
+) -> str:
+    await ctx.debug(f"read_all_threads with max_items={max_items} and since={since}")
+    client = await _get_teams_client(ctx, channel)
+    renderer = client.create_renderer(
+        content_mode, max_content_chars, max_response_bytes, fields
+    )
+    message_filter = _create_message_filter(since, sender, has_mention, importance)
+    fragments = []
+    threads = client.stream_threads(
+        page_size=page_size,
+        max_items=max_items,
+        renderer=renderer,
+        message_filter=message_filter,
+    )
+    async with aclosing(threads):
+        async for thread in threads:
+            fragments.append(thread.to_json())
+            # Stop reading pages once the response budget is spent
+            if renderer.exhausted:
+                break
+            if len(fragments) % page_size == 0:
+                await ctx.report_progress(len(fragments), max_items)
+    return dump_messages_page(fragments, limit=max_items)
+
+
+@mcp.tool(
+    name="wait_for_messages",
+    description="Wait for new, edited or deleted messages pushed to the server and "
+    "return them, instead of polling list_threads",
+)
+@instrumented("tool")
+async def wait_for_messages(
+    ctx: Context,
+    cursor: str | None = Field(
+        description="Cursor returned by the previous call, omit it to wait for "
+        "messages received from now on",
+        default=None,
+    ),
+    timeout: float = Field(
+        description="Seconds to wait for a message before returning no events",
+        default=30.0,
+        ge=0,
+        le=300,
+    ),
+    limit: int = Field(description="Maximum number of events to return", default=50),
+    content_mode: ContentMode | None = Field(
+        description=CONTENT_MODE_DESCRIPTION, default=None
+    ),
+    max_content_chars: int | None = Field(
+        description=MAX_CONTENT_CHARS_DESCRIPTION, default=None
+    ),
+    max_response_bytes: int | None = Field(
+        description=MAX_RESPONSE_BYTES_DESCRIPTION, default=None
+    ),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
+) -> TeamsEvents:
+    await ctx.debug(f"wait_for_messages with cursor={cursor} and timeout={timeout}")
+    if not RECEIVER.enabled:
+        raise ValueError("wait_for_messages requires TEAMS_EVENTS to be enabled")
+    client = await _get_teams_client(ctx, channel)
+    renderer = client.create_renderer(
+        content_mode, max_content_chars, max_response_bytes
+    )
+    result = await RECEIVER.buffer.wait(
+        cursor, timeout, limit, channel_id=client.teams_channel_id
+    )
+    items = []
+    for event in result.items:
+        if event.content is not None:
+            content, truncated = renderer.render(event.content)
+            event = event.model_copy(
+                update={"content": content, "truncated": truncated}
+            )
+        items.append(event)
+    result.items = items
+    return result
+
+
+@mcp.tool(
+    name="search_messages",
+    description="Search channel messages already read or synced, best matches first",
+)
+@instrumented("tool")
+async def search_messages(
+    ctx: Context,
+    query: str = Field(description="Search terms, all of them must match"),
+    since: datetime | None = Field(
+        description="Only match messages created at or after this ISO 8601 timestamp",
+        default=None,
+    ),
+    until: datetime | None = Field(
+        description="Only match messages created before this ISO 8601 timestamp",
+        default=None,
+    ),
+    limit: int = Field(description="Maximum number of results to retrieve", default=20),
+    cursor: str | None = Field(
+        description="Pagination cursor for the next page of results", default=None
+    ),
+    refresh: bool = Field(
+        description="Sync the channel before searching to include recent messages",
+        default=False,
+    ),
+    content_mode: ContentMode | None = Field(
+        description=CONTENT_MODE_DESCRIPTION, default=None
+    ),
+    max_content_chars: int | None = Field(
+        description=MAX_CONTENT_CHARS_DESCRIPTION, default=None
+    ),
+    max_response_bytes: int | None = Field(
+        description=MAX_RESPONSE_BYTES_DESCRIPTION, default=None
+    ),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
+) -> PagedTeamsSearchResults:
+    await ctx.debug(f"search_messages with query={query} and cursor={cursor}")
+    client = await _get_teams_client(ctx, channel)
+    if refresh:
+        await client.sync_channel(consumer=SEARCH_SYNC_CONSUMER)
+    renderer = client.create_renderer(
+        content_mode, max_content_chars, max_response_bytes
+    )
+    return await client.search_messages(query, since, until, limit, cursor, renderer)
 
 
 @mcp.tool(name="get_member_by_name", description="Get a member by its name")
+@instrumented("tool")
 async def get_member_by_name(
-    ctx: Context, name: str = Field(description="Member name")
+    ctx: Context,
+    name: str = Field(description="Member name"),
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
 ):
     await ctx.debug(f"get_member_by_name with name={name}")
-    client = _get_teams_client(ctx)
+    client = await _get_teams_client(ctx, channel)
     return await client.get_member_by_name(name)
 
 
 @mcp.tool(name="list_members", description="List all members in the team")
-async def list_members(ctx: Context) -> list[TeamsMember]:
+@instrumented("tool")
+async def list_members(
+    ctx: Context,
+    channel: str | None = Field(description=CHANNEL_DESCRIPTION, default=None),
+) -> list[TeamsMember]:
     await ctx.debug("list_members")
-    client = _get_teams_client(ctx)
+    client = await _get_teams_client(ctx, channel)
     return await client.list_members()
 
 
+@mcp.resource(
+    "metrics://teams",
+    name="metrics",
+    description="Latency, call, error and outbound request metrics of the server",
+    mime_type="application/json",
+)
+def metrics_resource() -> str:
+    return json.dumps(METRICS.snapshot())
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> Response:
+    return PlainTextResponse(
+        METRICS.render_prometheus(), media_type="text/plain; version=0.0.4"
+    )
+
+
+@mcp.resource(
+    "readiness://teams",
+    name="readiness",
+    description="Startup readiness of the server and the result of each warm-up step",
+    mime_type="application/json",
+)
+def readiness_resource() -> str:
+    return json.dumps(READINESS.as_dict())
+
+
+@mcp.custom_route("/ready", methods=["GET"])
+async def ready_endpoint(request: Request) -> Response:
+    status_code = 200 if READINESS.ready else 503
+    return JSONResponse(READINESS.as_dict(), status_code=status_code)
+
+
+async def _read_json_object(request: Request) -> dict[str, Any] | None:
+    """Read a JSON object request body, None when it is malformed."""
+    try:
+        body = await request.json()
+    except ValueError:
+        return None
+    return body if isinstance(body, dict) else None
+
+
+@mcp.custom_route("/api/messages", methods=["POST"])
+async def messages_endpoint(request: Request) -> Response:
+    """Bot Framework messaging endpoint feeding wait_for_messages."""
+    if not RECEIVER.enabled:
+        return Response(status_code=404)
+    body = await _read_json_object(request)
+    if body is None:
+        return Response(status_code=400)
+    try:
+        response = await RECEIVER.process_activity(
+            body, request.headers.get("Authorization", "")
+        )
+    except PermissionError:
+        return Response(status_code=401)
+    if response is not None:
+        return JSONResponse(response.body, status_code=response.status)
+    return Response(status_code=200)
+
+
+@mcp.custom_route("/api/notifications", methods=["POST"])
+async def notifications_endpoint(request: Request) -> Response:
+    """Graph change notification endpoint feeding wait_for_messages."""
+    if not RECEIVER.enabled:
+        return Response(status_code=404)
+    # Graph validates the notification url by asking to echo a token back
+    validation_token = request.query_params.get("validationToken")
+    if validation_token is not None:
+        return PlainTextResponse(validation_token)
+    payload = await _read_json_object(request)
+    if payload is None:
+        return Response(status_code=400)
+    await RECEIVER.process_notifications(payload)
+    return Response(status_code=202)
+
+
 def _check_required_environment():
     exit_code = None
     for var in REQUIRED_ENV_VARS:
@@ -193,9 +1147,22 @@ def _check_required_environment():
         sys.exit(exit_code)
 
 
+async def _serve(transport: str):
+    # Held for the whole process, so SSE sessions coming and going reuse it
+    async with APP_CONTEXT.hold():
+        if transport == "sse":
+            await mcp.run_sse_async()
+        else:
+            await mcp.run_stdio_async()
+
+
 def main() -> None:
     import argparse
 
+    import anyio
+
+    _configure()
+
     parser = argparse.ArgumentParser(
         description="MCP Teams Server to allow Microsoft Teams interaction"
     )
@@ -205,7 +1172,6 @@ def main() -> None:
     parser.add_argument(
         "-t",
         "--transport",
-        nargs=1,
         type=str,
         help="MCP Server Transport: stdio or sse",
         default=default_transport,
@@ -218,7 +1184,7 @@ def main() -> None:
         f'Starting MCP Teams Server "{__version__}" with transport "{args.transport}"'
     )
     _check_required_environment()
-    mcp.run(transport=args.transport)
+    anyio.run(_serve, args.transport)
 
 
 if __name__ == "__main__":
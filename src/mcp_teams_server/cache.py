@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class CacheEntry:
+    def __init__(self, value: Any, now: float):
+        self.value = value
+        self.stored_at = now
+
+
+class ReadCache:
+    """Bounded LRU cache of Graph read responses.
+
+    Entries are served as they are for ``ttl`` seconds after they were stored,
+    expired entries are dropped and read again. Graph offers no conditional
+    request on channel messages that would be cheaper than the read itself.
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float = 30.0):
+        """
+        Args:
+            max_size: Maximum number of entries, zero disables the cache
+            ttl: Seconds an entry is served after it was stored
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> CacheEntry | None:
+        """Return the entry of a key, None on a miss or when it expired."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry.stored_at >= self.ttl:
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Hashable, value: Any):
+        if not self.enabled:
+            return
+        self._entries[key] = CacheEntry(value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def invalidate_prefix(self, *prefix: Hashable):
+        """Drop every tuple key starting with the given items."""
+        size = len(prefix)
+        keys = [
+            key
+            for key in self._entries
+            if isinstance(key, tuple) and key[:size] == prefix
+        ]
+        for key in keys:
+            del self._entries[key]
+        self.invalidations += len(keys)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,232 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Batch:
+    key: str
+    member_name: str | None
+    future: asyncio.Future
+    contents: list[str] = field(default_factory=list)
+    chars: int = 0
+    timer: asyncio.TimerHandle | None = None
+
+
+class _WindowedSender(ABC, Generic[T]):
+    """Collect calls per key for ``window`` seconds and send them as one.
+
+    Batches of the same key are sent one after the other, in order, and every
+    caller of a batch gets the result, or the exception, of its send.
+    """
+
+    def __init__(
+        self, send: Callable[[str, str, str | None], Awaitable[T]], window: float
+    ):
+        self._send = send
+        self.window = window
+        self._batches: dict[str, _Batch] = {}
+        # Last send of each key, awaited by the next one to keep order
+        self._tails: dict[str, asyncio.Task] = {}
+        self.messages = 0
+
+    def _open(
+        self, key: str, member_name: str | None, delay: float | None = None
+    ) -> _Batch:
+        loop = asyncio.get_running_loop()
+        batch = _Batch(key, member_name, loop.create_future())
+        delay = self.window if delay is None else delay
+        batch.timer = loop.call_later(delay, self._flush, batch)
+        self._batches[key] = batch
+        return batch
+
+    @abstractmethod
+    def _content(self, batch: _Batch) -> str:
+        """Content sent for a batch."""
+
+    def _flush(self, batch: _Batch):
+        if self._batches.get(batch.key) is not batch:
+            return
+        del self._batches[batch.key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        previous = self._tails.get(batch.key)
+        task = asyncio.ensure_future(self._send_batch(batch, previous))
+        self._tails[batch.key] = task
+        task.add_done_callback(lambda done: self._forget(batch.key, done))
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._tails.get(key) is task:
+            del self._tails[key]
+
+    async def _send_batch(self, batch: _Batch, previous: asyncio.Task | None):
+        if previous is not None:
+            await asyncio.wait([previous])
+        self.messages += 1
+        try:
+            result = await self._send(
+                batch.key, self._content(batch), batch.member_name
+            )
+        except Exception as e:
+            batch.future.set_exception(e)
+            # Mark the exception as retrieved when every caller was cancelled
+            batch.future.exception()
+        else:
+            batch.future.set_result(result)
+
+    async def _wait(self, batch: _Batch) -> T:
+        # A cancelled caller leaves the batch to the other callers
+        return await asyncio.shield(batch.future)
+
+    def pending(self) -> int:
+        return sum(len(batch.contents) for batch in self._batches.values())
+
+    async def close(self):
+        """Send the open batches right away and wait for every send to finish."""
+        for batch in list(self._batches.values()):
+            self._flush(batch)
+        await asyncio.gather(*self._tails.values(), return_exceptions=True)
+
+
+class UpdateCoalescer(_WindowedSender[T]):
+    """Merge updates to the same thread arriving within a short window.
+
+    The first update to a thread opens a batch that is sent ``window`` seconds
+    later as a single message, later updates to the thread join it until then.
+    A batch is sent early when it reaches ``max_messages`` updates, and an
+    update that would take it past ``max_chars``, or that mentions a different
+    member, starts a new batch.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, str, str | None], Awaitable[T]],
+        window: float,
+        max_messages: int = 20,
+        max_chars: int = 20000,
+        separator: str = "\n\n",
+    ):
+        """
+        Args:
+            send: Sends the merged content of a batch to a thread, mentioning
+                the member name when given
+            window: Seconds updates to a thread are collected for
+            max_messages: Maximum number of updates merged into one message
+            max_chars: Maximum characters of merged content, a single longer
+                update is sent on its own
+            separator: Text placed between merged updates
+        """
+        super().__init__(send, window)
+        self.max_messages = max(1, max_messages)
+        self.max_chars = max_chars
+        self.separator = separator
+        self.updates = 0
+        self.early_flushes = 0
+
+    def _fits(self, batch: _Batch, content: str, member_name: str | None) -> bool:
+        return (
+            batch.member_name == member_name
+            and len(batch.contents) < self.max_messages
+            and batch.chars + len(self.separator) + len(content) <= self.max_chars
+        )
+
+    async def submit(
+        self, thread_id: str, content: str, member_name: str | None = None
+    ) -> T:
+        """Add an update to the thread batch and wait until the batch is sent."""
+        self.updates += 1
+        batch = self._batches.get(thread_id)
+        if batch is not None and not self._fits(batch, content, member_name):
+            self.early_flushes += 1
+            self._flush(batch)
+            batch = None
+        if batch is None:
+            batch = self._open(thread_id, member_name)
+        else:
+            batch.chars += len(self.separator)
+        batch.contents.append(content)
+        batch.chars += len(content)
+        if len(batch.contents) >= self.max_messages:
+            self.early_flushes += 1
+            self._flush(batch)
+        return await self._wait(batch)
+
+    def _content(self, batch: _Batch) -> str:
+        return self.separator.join(batch.contents)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "updates": self.updates,
+            "messages": self.messages,
+            "early_flushes": self.early_flushes,
+            "pending": self.pending(),
+        }
+
+
+class EditDebouncer(_WindowedSender[T]):
+    """Send only the latest of the edits made to a message within a window.
+
+    An edit to a message that was not edited in the last ``window`` seconds is
+    sent right away, together with the edits made in the same event loop
+    iteration. Edits arriving within the window after a send replace each
+    other and only the latest is sent once the window ends, so a status message
+    edited many times a second costs one request per window. Every caller gets
+    the result of the edit that was sent.
+    """
+
+    def __init__(
+        self, send: Callable[[str, str, str | None], Awaitable[T]], window: float
+    ):
+        """
+        Args:
+            send: Sends the latest content of a message, mentioning the member
+                name when given
+            window: Seconds edits to a message are collected for
+        """
+        super().__init__(send, window)
+        self.edits = 0
+        self.superseded = 0
+        # Loop time until which the edits of a recently sent message are held
+        self._held_until: dict[str, float] = {}
+
+    def _flush(self, batch: _Batch):
+        if self._batches.get(batch.key) is batch:
+            now = asyncio.get_running_loop().time()
+            self._held_until = {
+                key: until for key, until in self._held_until.items() if until > now
+            }
+            self._held_until[batch.key] = now + self.window
+        super()._flush(batch)
+
+    async def submit(
+        self, message_id: str, content: str, member_name: str | None = None
+    ) -> T:
+        """Replace the pending edit of the message and wait until it is sent."""
+        self.edits += 1
+        batch = self._batches.get(message_id)
+        if batch is None:
+            now = asyncio.get_running_loop().time()
+            delay = max(0.0, self._held_until.get(message_id, now) - now)
+            batch = self._open(message_id, member_name, delay)
+        else:
+            self.superseded += 1
+            batch.member_name = member_name
+        batch.contents[:] = [content]
+        return await self._wait(batch)
+
+    def _content(self, batch: _Batch) -> str:
+        return batch.contents[-1]
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "edits": self.edits,
+            "messages": self.messages,
+            "superseded": self.superseded,
+            "pending": self.pending(),
+        }
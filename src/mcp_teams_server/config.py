@@ -4,6 +4,35 @@ import os
 from dataclasses import dataclass
 
 
+def parse_channel(
+    channel: str | None, default_team_id: str, default_channel_id: str
+) -> tuple[str, str]:
+    """Resolve a channel argument into a (team id, channel id) pair.
+
+    Accepts ``team_id/channel_id``, a bare channel ID of the default team, or
+    None for the default channel.
+    """
+    if channel is None or not channel.strip():
+        return default_team_id, default_channel_id
+    channel = channel.strip()
+    if "/" in channel:
+        team_id, channel_id = channel.split("/", 1)
+        if not team_id or not channel_id:
+            raise ValueError(f"Invalid channel {channel}, expected team_id/channel_id")
+        return team_id, channel_id
+    return default_team_id, channel
+
+
+def _parse_channels(value: str, default_team_id: str) -> set[tuple[str, str]] | None:
+    """Parse a comma separated list of 'team_id/channel_id' or channel IDs."""
+    channels = {
+        parse_channel(item, default_team_id, "")
+        for item in value.split(",")
+        if item.strip()
+    }
+    return channels or None
+
+
 @dataclass
 class BotConfiguration:
     def __init__(self):
@@ -13,3 +42,75 @@ class BotConfiguration:
         self.APP_TENANTID = os.environ.get("TEAMS_APP_TENANT_ID", "")
         self.TEAM_ID = os.environ.get("TEAM_ID", "")
         self.TEAMS_CHANNEL_ID = os.environ.get("TEAMS_CHANNEL_ID", "")
+        self.SERVICE_URL = os.environ.get(
+            "TEAMS_SERVICE_URL", "https://smba.trafficmanager.net/emea/"
+        )
+        self.MEMBERS_CACHE_TTL = float(os.environ.get("TEAMS_MEMBERS_CACHE_TTL", "300"))
+        self.GRAPH_RATE_LIMIT = float(os.environ.get("TEAMS_GRAPH_RATE_LIMIT", "20"))
+        self.GRAPH_CONCURRENCY = int(os.environ.get("TEAMS_GRAPH_CONCURRENCY", "8"))
+        self.CONNECTOR_RATE_LIMIT = float(
+            os.environ.get("TEAMS_CONNECTOR_RATE_LIMIT", "10")
+        )
+        self.CONNECTOR_CONCURRENCY = int(
+            os.environ.get("TEAMS_CONNECTOR_CONCURRENCY", "8")
+        )
+        self.MAX_RETRIES = int(os.environ.get("TEAMS_MAX_RETRIES", "4"))
+        self.CLIENT_POOL_SIZE = int(os.environ.get("TEAMS_CLIENT_POOL_SIZE", "32"))
+        self.ALLOWED_CHANNELS = _parse_channels(
+            os.environ.get("TEAMS_ALLOWED_CHANNELS", ""), self.TEAM_ID
+        )
+        self.HTTP_POOL_SIZE = int(os.environ.get("TEAMS_HTTP_POOL_SIZE", "100"))
+        self.HTTP_KEEPALIVE = float(os.environ.get("TEAMS_HTTP_KEEPALIVE", "60"))
+        self.HTTP2 = os.environ.get("TEAMS_HTTP2", "true").lower() in ("1", "true")
+        self.DNS_CACHE_TTL = int(os.environ.get("TEAMS_DNS_CACHE_TTL", "300"))
+        self.WARMUP = os.environ.get("TEAMS_WARMUP", "false").lower() in ("1", "true")
+        self.WARMUP_ROSTER = os.environ.get("TEAMS_WARMUP_ROSTER", "false").lower() in (
+            "1",
+            "true",
+        )
+        self.WARMUP_TIMEOUT = float(os.environ.get("TEAMS_WARMUP_TIMEOUT", "30"))
+        self.TOKEN_REFRESH_MARGIN = float(
+            os.environ.get("TEAMS_TOKEN_REFRESH_MARGIN", "240")
+        )
+        self.CONTENT_MODE = os.environ.get("TEAMS_CONTENT_MODE", "raw")
+        self.MAX_CONTENT_CHARS = int(os.environ.get("TEAMS_MAX_CONTENT_CHARS", "0"))
+        self.MAX_RESPONSE_BYTES = int(os.environ.get("TEAMS_MAX_RESPONSE_BYTES", "0"))
+        self.READ_CACHE_SIZE = int(os.environ.get("TEAMS_READ_CACHE_SIZE", "256"))
+        self.READ_CACHE_TTL = float(os.environ.get("TEAMS_READ_CACHE_TTL", "30"))
+        self.EVENTS = os.environ.get("TEAMS_EVENTS", "false").lower() in (
+            "1",
+            "true",
+        )
+        self.EVENT_BUFFER_SIZE = int(os.environ.get("TEAMS_EVENT_BUFFER_SIZE", "1000"))
+        self.EVENTS_VERIFY = os.environ.get("TEAMS_EVENTS_VERIFY", "true").lower() in (
+            "1",
+            "true",
+        )
+        self.NOTIFICATION_URL = os.environ.get("TEAMS_NOTIFICATION_URL")
+        self.NOTIFICATION_CLIENT_STATE = os.environ.get(
+            "TEAMS_NOTIFICATION_CLIENT_STATE"
+        )
+        self.COALESCE_WINDOW = (
+            float(os.environ.get("TEAMS_COALESCE_WINDOW_MS", "0")) / 1000
+        )
+        self.COALESCE_MAX_MESSAGES = int(
+            os.environ.get("TEAMS_COALESCE_MAX_MESSAGES", "20")
+        )
+        self.COALESCE_MAX_CHARS = int(
+            os.environ.get("TEAMS_COALESCE_MAX_CHARS", "20000")
+        )
+        self.EDIT_DEBOUNCE = (
+            float(os.environ.get("TEAMS_EDIT_DEBOUNCE_MS", "1000")) / 1000
+        )
+        self.DELIVERY_MODE = os.environ.get("TEAMS_DELIVERY_MODE", "sync")
+        self.DELIVERY_WORKERS = int(os.environ.get("TEAMS_DELIVERY_WORKERS", "4"))
+        self.DELIVERY_MAX_ATTEMPTS = int(
+            os.environ.get("TEAMS_DELIVERY_MAX_ATTEMPTS", "5")
+        )
+        self.DELIVERY_RETRY_DELAY = float(
+            os.environ.get("TEAMS_DELIVERY_RETRY_DELAY", "2")
+        )
+        self.STORE_PATH = os.environ.get(
+            "TEAMS_STORE_PATH",
+            os.path.join(os.path.expanduser("~"), ".mcp-teams-server", "store.db"),
+        )
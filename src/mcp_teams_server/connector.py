@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from botbuilder.integration.aiohttp import CloudAdapter
+from botbuilder.schema import ChannelAccount, PagedMembersResult
+from botbuilder.schema.teams import TeamsChannelAccount
+from botframework.connector.aio import ConnectorClient
+from botframework.connector.aio.operations_async import ConversationsOperations
+
+from .throttling import CONNECTOR, RequestScheduler
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_SERVICE_URL = "https://smba.trafficmanager.net/emea/"
+
+
+class ConnectorSession:
+    """Long-lived Bot Framework connector client.
+
+    ``CloudAdapter.continue_conversation`` builds a new connector client, and
+    resolves its credentials, on every proactive turn. The session builds the
+    client once for the discovered service url and keeps it, together with the
+    bot token cached by its credentials, so each operation costs a single HTTP
+    request to the Bot Connector.
+    """
+
+    def __init__(
+        self,
+        adapter: CloudAdapter,
+        teams_app_id: str,
+        service_url: str = DEFAULT_SERVICE_URL,
+        scheduler: RequestScheduler | None = None,
+        keep_alive: bool = True,
+    ):
+        self.adapter = adapter
+        self.teams_app_id = teams_app_id
+        self.service_url = service_url
+        self.scheduler = scheduler
+        self.keep_alive = keep_alive
+        self._client: ConnectorClient | None = None
+        self._lock = asyncio.Lock()
+
+    async def get_client(self) -> ConnectorClient:
+        if self._client is None:
+            async with self._lock:
+                if self._client is None:
+                    claims_identity = self.adapter.create_claims_identity(
+                        self.teams_app_id
+                    )
+                    authentication = self.adapter.bot_framework_authentication
+                    connector_factory = authentication.create_connector_factory(
+                        claims_identity
+                    )
+                    client = await connector_factory.create(
+                        self.service_url, authentication.get_originating_audience()
+                    )
+                    # msrest closes its HTTP session after every request unless
+                    # keep-alive is enabled, reusing it keeps TLS connections warm
+                    client.config.keep_alive = self.keep_alive
+                    self._client = client
+        return self._client
+
+    async def conversations(self) -> ConversationsOperations:
+        client = await self.get_client()
+        return client.conversations  # pyright: ignore
+
+    async def set_service_url(self, service_url: str):
+        """Rebind the session to a new service url, dropping the old client."""
+        if service_url != self.service_url:
+            self.service_url = service_url
+            await self.close()
+
+    async def close(self):
+        client, self._client = self._client, None
+        if client is not None:
+            try:
+                # ConnectorClient has no close, exiting it closes the msrest session
+                await client.__aexit__(None, None, None)
+            except Exception as e:
+                LOGGER.error(f"Error closing connector client: {str(e)}")
+
+    async def _run(self, operation: Callable[[], Awaitable[T]]) -> T:
+        if self.scheduler is None:
+            return await operation()
+        return await self.scheduler.run(CONNECTOR, operation)
+
+    @staticmethod
+    def to_teams_account(member: ChannelAccount) -> TeamsChannelAccount:
+        # Same conversion TeamsInfo applies to connector members
+        return TeamsChannelAccount().deserialize(
+            dict(member.serialize(), **member.additional_properties)
+        )
+
+    async def get_team_members(
+        self, team_id: str, page_size: int = 500
+    ) -> list[TeamsChannelAccount]:
+        conversations = await self.conversations()
+        result: list[TeamsChannelAccount] = []
+        continuation_token = None
+        while True:
+            token = continuation_token
+            page = await self._run(
+                lambda: conversations.get_conversation_paged_members(
+                    team_id, page_size=page_size, continuation_token=token
+                )
+            )
+            if not isinstance(page, PagedMembersResult):
+                raise ValueError(f"Unexpected members page for team {team_id}")
+            result.extend(
+                ConnectorSession.to_teams_account(member)
+                for member in page.members or []
+            )
+            continuation_token = page.continuation_token
+            if not continuation_token:
+                return result
+
+    async def get_team_member(
+        self, team_id: str, member_id: str
+    ) -> TeamsChannelAccount:
+        conversations = await self.conversations()
+        member = await self._run(
+            lambda: conversations.get_conversation_member(team_id, member_id)
+        )
+        if not isinstance(member, ChannelAccount):
+            raise ValueError(f"Unexpected member {member_id} for team {team_id}")
+        return ConnectorSession.to_teams_account(member)
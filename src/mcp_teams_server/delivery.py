@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import logging
+import time
+import uuid
+from typing import TYPE_CHECKING, Literal
+
+from .store import Delivery, TeamsStore
+
+if TYPE_CHECKING:
+    from .pool import TeamsClientPool
+
+LOGGER = logging.getLogger(__name__)
+
+DeliveryMode = Literal["sync", "async"]
+
+
+class DeliveryQueue:
+    """Outbound messages acknowledged at once and sent by background workers.
+
+    Posts are spooled to the SQLite store before the tool returns, so they
+    survive restarts, and a pool of workers sends them through the Teams
+    clients. A failed attempt is retried with exponential backoff until
+    ``max_attempts`` is reached. Workers lease the deliveries they send, a
+    delivery whose lease expires, because its process died, is sent again, so
+    delivery is at least once. Replies to the same thread are sent in the order
+    they were queued. Several queues, one per server session or process, can
+    share the same store.
+    """
+
+    def __init__(
+        self,
+        store: TeamsStore,
+        pool: "TeamsClientPool",
+        workers: int = 4,
+        max_attempts: int = 5,
+        retry_delay: float = 2.0,
+        max_retry_delay: float = 300.0,
+        lease: float = 120.0,
+        poll_interval: float = 1.0,
+        retention: float = 7 * 24 * 3600.0,
+    ):
+        """
+        Args:
+            store: Store spooling the deliveries
+            pool: Clients the deliveries are sent through
+            workers: Number of deliveries sent at the same time
+            max_attempts: Attempts before a delivery is marked as failed
+            retry_delay: Delay before the first retry, doubled on each retry
+            max_retry_delay: Upper bound of the retry delay, in seconds
+            lease: Seconds a delivery being sent is reserved to its worker
+            poll_interval: Seconds between checks for deliveries due for a retry
+                or queued by other processes
+            retention: Seconds delivered and failed deliveries are kept for
+        """
+        self.store = store
+        self.pool = pool
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._sending = 0
+        self.enqueued = 0
+        self.delivered = 0
+        self.retried = 0
+        self.failed = 0
+
+    async def enqueue(
+        self,
+        team_id: str,
+        channel_id: str,
+        thread_id: str | None,
+        title: str | None,
+        content: str,
+        member_name: str | None = None,
+    ) -> Delivery:
+        """Spool a reply, or a new thread when thread_id is None, for delivery."""
+        delivery = Delivery(
+            delivery_id=uuid.uuid4().hex,
+            team_id=team_id,
+            channel_id=channel_id,
+            thread_id=thread_id,
+            title=title,
+            content=content,
+            member_name=member_name,
+        )
+        try:
+            await self.store.add_delivery(delivery, time.time())
+        except Exception as e:
+            LOGGER.error(f"Error queueing delivery: {str(e)}")
+            raise
+        self.enqueued += 1
+        self._wakeup.set()
+        return delivery
+
+    async def get(self, delivery_id: str) -> Delivery | None:
+        return await self.store.get_delivery(delivery_id)
+
+    def start(self):
+        """Start the workers, unless they already run."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._run(), name=f"delivery-worker-{index}")
+            for index in range(self.workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._purge(), name="delivery-purge"))
+
+    async def _purge(self):
+        try:
+            await self.store.purge_deliveries(self.retention)
+        except Exception as e:
+            LOGGER.warning(f"Error purging old deliveries: {str(e)}")
+
+    async def _run(self):
+        while True:
+            # Cleared before claiming, so a delivery queued meanwhile wakes it up
+            self._wakeup.clear()
+            try:
+                delivery = await self.store.claim_delivery(time.time(), self.lease)
+            except Exception as e:
+                LOGGER.error(f"Error claiming delivery: {str(e)}")
+                delivery = None
+            if delivery is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await self._deliver(delivery)
+            except Exception as e:
+                # The lease expires and the delivery is claimed again
+                LOGGER.error(
+                    f"Error recording delivery {delivery.delivery_id}: {str(e)}"
+                )
+
+    async def _deliver(self, delivery: Delivery):
+        self._sending += 1
+        try:
+            client = await self.pool.get(f"{delivery.team_id}/{delivery.channel_id}")
+            if delivery.thread_id is None:
+                thread = await client.start_thread(
+                    delivery.title or "", delivery.content, delivery.member_name
+                )
+                thread_id = message_id = thread.thread_id
+            else:
+                message = await client.update_thread(
+                    delivery.thread_id, delivery.content, delivery.member_name
+                )
+                thread_id, message_id = message.thread_id, message.message_id
+        except Exception as e:
+            if delivery.attempts >= self.max_attempts:
+                LOGGER.error(
+                    f"Delivery {delivery.delivery_id} failed after "
+                    f"{delivery.attempts} attempts: {str(e)}"
+                )
+                self.failed += 1
+                await self.store.fail_delivery(delivery.delivery_id, str(e))
+            else:
+                delay = min(
+                    self.max_retry_delay,
+                    self.retry_delay * 2 ** (delivery.attempts - 1),
+                )
+                self.retried += 1
+                await self.store.fail_delivery(
+                    delivery.delivery_id, str(e), retry_at=time.time() + delay
+                )
+            return
+        finally:
+            self._sending -= 1
+        self.delivered += 1
+        await self.store.complete_delivery(delivery.delivery_id, thread_id, message_id)
+
+    async def close(self):
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "workers": self.workers if self._tasks else 0,
+            "sending": self._sending,
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
@@ -0,0 +1,419 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+
+from .models import TeamsEvent, TeamsEvents
+from .throttling import GRAPH, RequestScheduler
+
+if TYPE_CHECKING:
+    from botbuilder.core import TurnContext
+    from botbuilder.integration.aiohttp import CloudAdapter
+    from botbuilder.schema import Activity
+    from msgraph.graph_service_client import GraphServiceClient
+
+LOGGER = logging.getLogger(__name__)
+
+ACTIVITY = "activity"
+NOTIFICATION = "notification"
+
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+
+ACTIVITY_CHANGE_TYPES = {
+    "message": CREATED,
+    "messageUpdate": UPDATED,
+    "messageDelete": DELETED,
+}
+
+RESOURCE_PATTERN = re.compile(
+    r"teams\('(?P<team>[^']+)'\)/channels\('(?P<channel>[^']+)'\)"
+    r"/messages\('(?P<message>[^']+)'\)(?:/replies\('(?P<reply>[^']+)'\))?"
+)
+
+# Conversation IDs of channel replies carry the thread after this marker
+THREAD_MARKER = ";messageid="
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def activity_to_event(activity: "Activity") -> TeamsEvent | None:
+    """Convert a Bot Framework channel activity, None for non message activities."""
+    change_type = ACTIVITY_CHANGE_TYPES.get(activity.type or "")
+    if change_type is None:
+        return None
+    channel_data = activity.channel_data or {}
+    team = channel_data.get("team") or {}
+    channel = channel_data.get("channel") or {}
+    conversation_id = activity.conversation.id if activity.conversation else None
+    conversation, _, thread_id = (conversation_id or "").partition(THREAD_MARKER)
+    return TeamsEvent(
+        event_id="",
+        source=ACTIVITY,
+        change_type=change_type,
+        team_id=team.get("aadGroupId") or team.get("id"),
+        channel_id=channel.get("id") or conversation or None,
+        thread_id=thread_id or activity.id,
+        message_id=activity.id,
+        content=activity.text,
+        sender=activity.from_property.name if activity.from_property else None,
+        received=_now(),
+    )
+
+
+def notification_to_event(notification: dict[str, Any]) -> TeamsEvent | None:
+    """Convert a Graph channel message change notification."""
+    match = RESOURCE_PATTERN.search(notification.get("resource") or "")
+    if match is None:
+        return None
+    message_id = match["reply"] or match["message"]
+    return TeamsEvent(
+        event_id="",
+        source=NOTIFICATION,
+        change_type=notification.get("changeType") or UPDATED,
+        team_id=match["team"],
+        channel_id=match["channel"],
+        thread_id=match["message"],
+        message_id=message_id,
+        received=_now(),
+    )
+
+
+class EventBuffer:
+    """Bounded in-memory buffer of received message events.
+
+    Events are numbered in arrival order and readers keep the number of the last
+    event they saw as a cursor. Readers with nothing new to read wait until an
+    event arrives or their timeout expires, so any number of agents can long
+    poll the buffer instead of polling Graph.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self._events: deque[TeamsEvent] = deque()
+        self._next_id = 1
+        self._condition = asyncio.Condition()
+        self._listeners: list[Callable[[TeamsEvent], None]] = []
+        self.published = 0
+        self.dropped = 0
+        self.waiting = 0
+
+    @property
+    def head(self) -> int:
+        """Number of the last event published."""
+        return self._next_id - 1
+
+    def subscribe(self, listener: Callable[[TeamsEvent], None]):
+        """Call a listener with every event published."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[TeamsEvent], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    async def publish(self, event: TeamsEvent) -> TeamsEvent:
+        event.event_id = str(self._next_id)
+        self._next_id += 1
+        self._events.append(event)
+        self.published += 1
+        while len(self._events) > self.max_size:
+            self._events.popleft()
+            self.dropped += 1
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                LOGGER.error(f"Error notifying event listener: {str(e)}")
+        async with self._condition:
+            self._condition.notify_all()
+        return event
+
+    def _read(
+        self, after: int, limit: int, channel_id: str | None
+    ) -> tuple[list[TeamsEvent], int]:
+        items = []
+        cursor = self.head
+        for event in self._events:
+            event_id = int(event.event_id)
+            if event_id <= after:
+                continue
+            if channel_id is not None and event.channel_id != channel_id:
+                continue
+            if len(items) >= limit:
+                # Resume before the first event left out
+                cursor = event_id - 1
+                break
+            items.append(event)
+        return items, max(cursor, after)
+
+    async def wait(
+        self,
+        cursor: str | None = None,
+        timeout: float = 30.0,
+        limit: int = 50,
+        channel_id: str | None = None,
+    ) -> TeamsEvents:
+        """Return events after a cursor, waiting for them up to timeout seconds.
+
+        Args:
+            cursor: Cursor returned by a previous call, events received from now
+                on when not given
+            timeout: Seconds to wait when there is no event to return yet
+            limit: Maximum number of events returned
+            channel_id: Only return events of this channel
+
+        Returns:
+            Events after the cursor and the cursor to continue from
+        """
+        after = int(cursor) if cursor else self.head
+        missed = bool(self._events) and int(self._events[0].event_id) > after + 1
+        deadline = time.monotonic() + timeout
+        self.waiting += 1
+        try:
+            while True:
+                items, next_cursor = self._read(after, limit, channel_id)
+                remaining = deadline - time.monotonic()
+                if items or remaining <= 0:
+                    return TeamsEvents(
+                        cursor=str(next_cursor), items=items, missed=missed
+                    )
+                async with self._condition:
+                    if self.head > next_cursor:
+                        # Published while the buffer was being read
+                        continue
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            self.waiting -= 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "buffered": len(self._events),
+            "max_size": self.max_size,
+            "published": self.published,
+            "dropped": self.dropped,
+            "waiting": self.waiting,
+        }
+
+
+class EventReceiver:
+    """Feed Bot Framework activities and Graph change notifications to a buffer.
+
+    Activities are authenticated by the bot adapter unless verification is
+    disabled, which is only meant for local stand-ins that cannot sign their
+    requests. Change notifications are checked against the client state given
+    to the Graph subscription.
+
+    The receiver is started and stopped with the app context, which is built
+    once and shared by every client session, so all sessions share its buffer.
+    """
+
+    def __init__(self, buffer: EventBuffer | None = None):
+        self.buffer = buffer or EventBuffer()
+        self.adapter: CloudAdapter | None = None
+        self.client_state: str | None = None
+        self.verify_activities = True
+        self.rejected = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.adapter is not None
+
+    def start(
+        self,
+        adapter: "CloudAdapter",
+        client_state: str | None = None,
+        verify_activities: bool = True,
+        buffer_size: int = 1000,
+    ):
+        """Start receiving events into a new buffer."""
+        self.buffer = EventBuffer(buffer_size)
+        self.adapter = adapter
+        self.client_state = client_state
+        self.verify_activities = verify_activities
+        self.rejected = 0
+
+    def stop(self):
+        self.adapter = None
+
+    async def _publish_activity(self, activity: "Activity"):
+        event = activity_to_event(activity)
+        if event is not None:
+            await self.buffer.publish(event)
+
+    async def process_activity(self, body: dict[str, Any], auth_header: str) -> Any:
+        """Receive a Bot Framework activity posted to the messaging endpoint.
+
+        Returns:
+            The invoke response of the adapter, if any
+
+        Raises:
+            PermissionError: If the request is not authenticated
+        """
+        from botbuilder.schema import Activity
+
+        if self.adapter is None:
+            raise ValueError("The event receiver is not started")
+        activity = Activity().deserialize(body)
+        if not self.verify_activities:
+            await self._publish_activity(activity)
+            return None
+
+        async def on_turn(context: "TurnContext"):
+            await self._publish_activity(context.activity)
+
+        try:
+            return await self.adapter.process_activity(auth_header, activity, on_turn)
+        except PermissionError:
+            self.rejected += 1
+            raise
+
+    async def process_notifications(self, payload: dict[str, Any]) -> int:
+        """Receive a batch of Graph change notifications.
+
+        Returns:
+            Number of events published
+        """
+        published = 0
+        for notification in payload.get("value") or []:
+            if self.client_state and (
+                notification.get("clientState") != self.client_state
+            ):
+                self.rejected += 1
+                LOGGER.warning("Dropped change notification with invalid clientState")
+                continue
+            if "lifecycleEvent" in notification:
+                LOGGER.info(f"Subscription event {notification['lifecycleEvent']}")
+                continue
+            event = notification_to_event(notification)
+            if event is not None:
+                await self.buffer.publish(event)
+                published += 1
+        return published
+
+    def stats(self) -> dict[str, int]:
+        return {**self.buffer.stats(), "rejected": self.rejected}
+
+
+RECEIVER = EventReceiver()
+
+
+class ChannelSubscription:
+    """Graph change notification subscription to the messages of a channel.
+
+    Channel message subscriptions without resource data last at most an hour,
+    the subscription is renewed in the background before it expires and is
+    created again whenever renewing fails.
+    """
+
+    def __init__(
+        self,
+        graph_client: "GraphServiceClient",
+        scheduler: RequestScheduler,
+        team_id: str,
+        channel_id: str,
+        notification_url: str,
+        client_state: str,
+        lifetime: float = 3300.0,
+        retry_interval: float = 30.0,
+    ):
+        """
+        Args:
+            graph_client: Graph client creating the subscription
+            scheduler: Scheduler the Graph requests go through
+            team_id: Team of the channel
+            channel_id: Channel whose messages are watched
+            notification_url: Public URL of the notifications endpoint
+            client_state: Secret Graph sends back with every notification
+            lifetime: Seconds a subscription is requested for
+            retry_interval: Seconds between attempts after a failure
+        """
+        self.graph_client = graph_client
+        self.scheduler = scheduler
+        self.team_id = team_id
+        self.channel_id = channel_id
+        self.notification_url = notification_url
+        self.client_state = client_state
+        self.lifetime = lifetime
+        self.retry_interval = retry_interval
+        self.subscription_id: str | None = None
+        self._task: asyncio.Task | None = None
+
+    def _expiration(self) -> datetime:
+        return datetime.now(timezone.utc) + timedelta(seconds=self.lifetime)
+
+    async def _create(self):
+        from msgraph.generated.models.subscription import Subscription
+
+        subscription = Subscription(
+            change_type=",".join((CREATED, UPDATED, DELETED)),
+            notification_url=self.notification_url,
+            resource=f"/teams/{self.team_id}/channels/{self.channel_id}/messages",
+            expiration_date_time=self._expiration(),
+            client_state=self.client_state,
+        )
+        created = await self.scheduler.run(
+            GRAPH, lambda: self.graph_client.subscriptions.post(subscription)
+        )
+        self.subscription_id = created.id if created is not None else None
+        LOGGER.info(f"Created change notification subscription {self.subscription_id}")
+
+    async def _renew(self):
+        from msgraph.generated.models.subscription import Subscription
+
+        subscription = self.graph_client.subscriptions.by_subscription_id(
+            self.subscription_id  # pyright: ignore
+        )
+        await self.scheduler.run(
+            GRAPH,
+            lambda: subscription.patch(
+                Subscription(expiration_date_time=self._expiration())
+            ),
+        )
+
+    async def _run(self):
+        while True:
+            try:
+                if self.subscription_id is None:
+                    await self._create()
+                else:
+                    await self._renew()
+                # Renew with a tenth of the lifetime to spare
+                await asyncio.sleep(self.lifetime * 0.9)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                LOGGER.error(f"Error subscribing to channel messages: {str(e)}")
+                self.subscription_id = None
+                await asyncio.sleep(self.retry_interval)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self.subscription_id is None:
+            return
+        subscription = self.graph_client.subscriptions.by_subscription_id(
+            self.subscription_id
+        )
+        try:
+            await self.scheduler.run(GRAPH, subscription.delete)
+        except Exception as e:
+            LOGGER.error(f"Error deleting subscription: {str(e)}")
+        self.subscription_id = None
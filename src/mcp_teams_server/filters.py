@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from msgraph.generated.models.chat_message import ChatMessage
+
+Importance = Literal["normal", "high", "urgent"]
+
+IMPORTANCES = ("normal", "high", "urgent")
+
+
+def to_utc(value: datetime) -> datetime:
+    """Treat naive timestamps as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def format_filter_timestamp(value: datetime) -> str:
+    return to_utc(value).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _enum_value(value: Any) -> str | None:
+    if value is None:
+        return None
+    return str(getattr(value, "value", value))
+
+
+def get_sender(message: "ChatMessage") -> tuple[str | None, str | None]:
+    """Return the display name and ID of the user or app that sent a message."""
+    sender = message.from_
+    if sender is None:
+        return None, None
+    for identity in (sender.user, sender.application, sender.device):
+        if identity is not None:
+            return identity.display_name, identity.id
+    return None, None
+
+
+def get_modified(message: "ChatMessage") -> datetime | None:
+    return message.last_modified_date_time or message.created_date_time
+
+
+def get_message_fields(
+    message: "ChatMessage", fields: set[str]
+) -> dict[str, str | list[str] | None]:
+    """Extract the requested metadata fields of a message."""
+    result: dict[str, str | list[str] | None] = {}
+    if "sender" in fields:
+        result["sender"] = get_sender(message)[0]
+    if "created" in fields and message.created_date_time is not None:
+        result["created"] = message.created_date_time.isoformat()
+    if "modified" in fields:
+        modified = get_modified(message)
+        result["modified"] = modified.isoformat() if modified is not None else None
+    if "importance" in fields:
+        result["importance"] = _enum_value(message.importance)
+    if "mentions" in fields:
+        result["mentions"] = [
+            mention.mention_text
+            for mention in message.mentions or []
+            if mention.mention_text
+        ]
+    return result
+
+
+@dataclass
+class MessageFilter:
+    """Criteria messages read from a channel must match.
+
+    Graph only filters channel messages on ``lastModifiedDateTime`` and only in
+    delta queries, so everything else is matched client side, before messages
+    are rendered.
+    """
+
+    since: datetime | None = None
+    sender: str | None = None
+    has_mention: bool | None = None
+    importance: Importance | None = None
+
+    def __post_init__(self):
+        if self.since is not None:
+            self.since = to_utc(self.since)
+        if self.importance is not None:
+            importance = self.importance.lower()
+            if importance not in IMPORTANCES:
+                raise ValueError(
+                    f"Invalid importance {self.importance}, expected one of "
+                    f"{', '.join(IMPORTANCES)}"
+                )
+            self.importance = importance  # pyright: ignore
+
+    @property
+    def empty(self) -> bool:
+        return (
+            self.since is None
+            and not self.sender
+            and self.has_mention is None
+            and self.importance is None
+        )
+
+    def matches(self, message: "ChatMessage") -> bool:
+        if self.since is not None:
+            modified = get_modified(message)
+            if modified is None or to_utc(modified) < self.since:
+                return False
+        if self.sender:
+            name, sender_id = get_sender(message)
+            expected = self.sender.casefold()
+            if expected not in ((name or "").casefold(), (sender_id or "").casefold()):
+                return False
+        if self.has_mention is not None:
+            if bool(message.mentions) != self.has_mention:
+                return False
+        if self.importance is not None:
+            if (_enum_value(message.importance) or "normal") != self.importance:
+                return False
+        return True
+
+    def delta_filter(self) -> str | None:
+        """Graph $filter expression of the criteria delta queries support."""
+        if self.since is None:
+            return None
+        return f"lastModifiedDateTime gt {format_filter_timestamp(self.since)}"
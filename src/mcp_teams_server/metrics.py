@@ -0,0 +1,218 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import functools
+import inspect
+import time
+from collections import Counter
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PREFIX = "mcp_teams"
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "average": self.sum / self.count if self.count else 0.0,
+            "buckets": {str(bound): count for bound, count in self.cumulative()},
+        }
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    values = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + values + "}"
+
+
+class MetricsRegistry:
+    """In-process metrics for client operations, MCP tools and outbound requests.
+
+    Operations are recorded under a kind (``tool``, ``client`` or ``outbound``)
+    and a name. Other components can register collectors, callables returning
+    a possibly nested dict of numbers, that are rendered next to the built-in
+    metrics.
+    """
+
+    def __init__(self):
+        self._latency: dict[tuple[str, str], Histogram] = {}
+        self._calls: Counter[tuple[str, str]] = Counter()
+        self._errors: Counter[tuple[str, str, str]] = Counter()
+        self._requests: Counter[tuple[str, str]] = Counter()
+        self._collectors: dict[str, Callable[[], dict]] = {}
+
+    def observe(
+        self, kind: str, name: str, seconds: float, error: BaseException | None = None
+    ):
+        key = (kind, name)
+        histogram = self._latency.get(key)
+        if histogram is None:
+            histogram = self._latency[key] = Histogram()
+        histogram.observe(seconds)
+        self._calls[key] += 1
+        if error is not None:
+            self._errors[(kind, name, type(error).__name__)] += 1
+
+    def count_request(self, endpoint: str, status: str):
+        self._requests[(endpoint, status)] += 1
+
+    def register_collector(self, name: str, collector: Callable[[], dict]):
+        self._collectors[name] = collector
+
+    def unregister_collector(self, name: str):
+        self._collectors.pop(name, None)
+
+    def reset(self):
+        self._latency.clear()
+        self._calls.clear()
+        self._errors.clear()
+        self._requests.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        operations: dict[str, dict[str, Any]] = {}
+        for (kind, name), histogram in sorted(self._latency.items()):
+            operations.setdefault(kind, {})[name] = {
+                "calls": self._calls[(kind, name)],
+                "errors": {
+                    error_type: count
+                    for (error_kind, error_name, error_type), count in (
+                        self._errors.items()
+                    )
+                    if error_kind == kind and error_name == name
+                },
+                "latency": histogram.as_dict(),
+            }
+        requests: dict[str, dict[str, int]] = {}
+        for (endpoint, status), count in sorted(self._requests.items()):
+            requests.setdefault(endpoint, {})[status] = count
+        result: dict[str, Any] = {"operations": operations, "requests": requests}
+        for name, collector in self._collectors.items():
+            result[name] = collector()
+        return result
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {PREFIX}_latency_seconds Operation latency in seconds",
+            f"# TYPE {PREFIX}_latency_seconds histogram",
+        ]
+        for (kind, name), histogram in sorted(self._latency.items()):
+            for bound, count in histogram.cumulative():
+                labels = _labels(kind=kind, name=name, le=bound)
+                lines.append(f"{PREFIX}_latency_seconds_bucket{labels} {count}")
+            labels = _labels(kind=kind, name=name, le="+Inf")
+            lines.append(f"{PREFIX}_latency_seconds_bucket{labels} {histogram.count}")
+            labels = _labels(kind=kind, name=name)
+            lines.append(f"{PREFIX}_latency_seconds_sum{labels} {histogram.sum}")
+            lines.append(f"{PREFIX}_latency_seconds_count{labels} {histogram.count}")
+
+        lines.append(f"# HELP {PREFIX}_errors_total Failed operations by error type")
+        lines.append(f"# TYPE {PREFIX}_errors_total counter")
+        for (kind, name, error_type), count in sorted(self._errors.items()):
+            labels = _labels(kind=kind, name=name, error_type=error_type)
+            lines.append(f"{PREFIX}_errors_total{labels} {count}")
+
+        lines.append(f"# HELP {PREFIX}_requests_total Outbound HTTP requests")
+        lines.append(f"# TYPE {PREFIX}_requests_total counter")
+        for (endpoint, status), count in sorted(self._requests.items()):
+            labels = _labels(endpoint=endpoint, status=status)
+            lines.append(f"{PREFIX}_requests_total{labels} {count}")
+
+        for collector_name, collector in self._collectors.items():
+            values = collector()
+            for key, value in values.items():
+                if isinstance(value, dict):
+                    for metric, number in value.items():
+                        if isinstance(number, int | float) and not isinstance(
+                            number, bool
+                        ):
+                            labels = _labels(group=key)
+                            lines.append(
+                                f"{PREFIX}_{collector_name}_{metric}{labels} {number}"
+                            )
+                elif isinstance(value, int | float) and not isinstance(value, bool):
+                    lines.append(f"{PREFIX}_{collector_name}_{key} {value}")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+
+
+def instrumented(kind: str, name: str | None = None) -> Callable[[F], F]:
+    """Record latency, calls and errors of a coroutine or async generator function.
+
+    Async generators are timed from the first iteration until they are exhausted
+    or closed, and closing the wrapper closes the wrapped generator.
+    """
+
+    def decorator(function: F) -> F:
+        operation = name or function.__name__.lstrip("_")
+
+        if inspect.isasyncgenfunction(function):
+
+            @functools.wraps(function)
+            async def generator_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                error = None
+                generator = function(*args, **kwargs)
+                try:
+                    async for item in generator:
+                        yield item
+                except GeneratorExit:
+                    # Closed early by the consumer, not a failure
+                    raise
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    # Release the wrapped generator now rather than when collected
+                    await generator.aclose()
+                    METRICS.observe(kind, operation, time.perf_counter() - start, error)
+
+            return generator_wrapper  # pyright: ignore
+
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            error = None
+            try:
+                return await function(*args, **kwargs)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                METRICS.observe(kind, operation, time.perf_counter() - start, error)
+
+        return wrapper  # pyright: ignore
+
+    return decorator
@@ -0,0 +1,193 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, model_serializer
+
+# Message metadata only included on request, left out of responses when unset
+OPTIONAL_MESSAGE_FIELDS = ("sender", "created", "modified", "importance", "mentions")
+
+DELIVERY_ID_DESCRIPTION = (
+    "Delivery ID of a message queued for asynchronous delivery, pass it to "
+    "get_delivery_status to follow the delivery"
+)
+
+
+class TeamsThread(BaseModel):
+    thread_id: str = Field(
+        description="Thread ID as a string in the format '1743086901347'"
+    )
+    title: str = Field(description="Message title")
+    content: str = Field(description="Message content")
+    delivery_id: str | None = Field(description=DELIVERY_ID_DESCRIPTION, default=None)
+
+    # Only asynchronous posts carry a delivery ID
+    @model_serializer(mode="wrap")
+    def _omit_unset_delivery(self, handler: SerializerFunctionWrapHandler):
+        data = handler(self)
+        if isinstance(data, dict) and data.get("delivery_id") is None:
+            data.pop("delivery_id", None)
+        return data
+
+
+class TeamsMessage(BaseModel):
+    thread_id: str = Field(
+        description="Thread ID as a string in the format '1743086901347'"
+    )
+    message_id: str = Field(description="Message ID")
+    content: str = Field(description="Message content")
+    truncated: bool = Field(
+        description="Whether the content was cut to fit the content budget",
+        default=False,
+    )
+    sender: str | None = Field(description="Sender display name", default=None)
+    created: str | None = Field(description="Creation timestamp", default=None)
+    modified: str | None = Field(
+        description="Last modification timestamp", default=None
+    )
+    importance: str | None = Field(
+        description="Message importance: normal, high or urgent", default=None
+    )
+    mentions: list[str] | None = Field(
+        description="Names mentioned in the message", default=None
+    )
+    delivery_id: str | None = Field(description=DELIVERY_ID_DESCRIPTION, default=None)
+
+    # No return annotation, so the JSON schema of the model is kept
+    @model_serializer(mode="wrap")
+    def _omit_unset_fields(self, handler: SerializerFunctionWrapHandler):
+        data = handler(self)
+        if isinstance(data, dict):
+            for field in (*OPTIONAL_MESSAGE_FIELDS, "delivery_id"):
+                if data.get(field) is None:
+                    data.pop(field, None)
+        return data
+
+
+class TeamsMember(BaseModel):
+    name: str = Field(
+        description="Member name used in mentions and user information cards"
+    )
+    email: str = Field(description="Member email")
+
+
+class PagedTeamsMessages(BaseModel):
+    cursor: str | None = Field(
+        description="Cursor to retrieve the next page of messages."
+    )
+    limit: int = Field(description="Page limit, maximum number of items to retrieve")
+    total: int = Field(description="Total items available for retrieval")
+    items: list[TeamsMessage] = Field(description="List of channel messages or threads")
+
+
+class TeamsThreadWithReplies(TeamsMessage):
+    replies: list[TeamsMessage] = Field(description="Thread replies")
+    replies_cursor: str | None = Field(
+        description="Cursor to retrieve more replies with read_thread", default=None
+    )
+
+
+class PagedTeamsThreads(BaseModel):
+    cursor: str | None = Field(
+        description="Cursor to retrieve the next page of threads."
+    )
+    limit: int = Field(description="Page limit, maximum number of items to retrieve")
+    total: int = Field(description="Total items available for retrieval")
+    items: list[TeamsThreadWithReplies] = Field(
+        description="List of channel threads including their replies"
+    )
+
+
+class TeamsSearchResult(TeamsMessage):
+    snippet: str = Field(description="Matching fragment with search terms in bold")
+    created: str | None = Field(description="Message creation timestamp", default=None)
+
+
+class PagedTeamsSearchResults(BaseModel):
+    cursor: str | None = Field(
+        description="Cursor to retrieve the next page of results."
+    )
+    limit: int = Field(description="Page limit, maximum number of items to retrieve")
+    items: list[TeamsSearchResult] = Field(
+        description="Matching messages, best matches first"
+    )
+
+
+class TeamsBulkPost(BaseModel):
+    thread_id: str | None = Field(
+        description="Thread ID to reply to, leave empty to start a new thread",
+        default=None,
+    )
+    title: str | None = Field(
+        description="New thread title, used when thread_id is empty", default=None
+    )
+    content: str = Field(description="Message content")
+    member_name: str | None = Field(
+        description="Member name to mention in the message", default=None
+    )
+
+
+class TeamsBulkPostResult(BaseModel):
+    index: int = Field(description="Position of the item in the request")
+    thread_id: str | None = Field(description="Thread ID the message was posted to")
+    message_id: str | None = Field(description="Posted message ID")
+    error: str | None = Field(description="Error message when the post failed")
+
+
+class TeamsThreadReplies(BaseModel):
+    thread_id: str = Field(description="Thread ID read")
+    replies: PagedTeamsMessages | None = Field(
+        description="First page of thread replies, empty when the read failed"
+    )
+    error: str | None = Field(description="Error message when the read failed")
+
+
+class TeamsDelivery(BaseModel):
+    delivery_id: str = Field(description="Delivery ID")
+    status: str = Field(
+        description="Delivery status: pending, sending, delivered or failed"
+    )
+    attempts: int = Field(description="Number of delivery attempts made")
+    channel: str = Field(description="Channel as 'team_id/channel_id'")
+    thread_id: str | None = Field(
+        description="Thread ID, known for new threads once they are delivered"
+    )
+    message_id: str | None = Field(description="Posted message ID once delivered")
+    error: str | None = Field(description="Error of the last failed attempt")
+    created: str | None = Field(description="Timestamp the message was queued at")
+    updated: str | None = Field(description="Timestamp of the last status change")
+
+
+class TeamsEvent(BaseModel):
+    event_id: str = Field(description="Event ID, events are numbered in arrival order")
+    source: str = Field(
+        description="Origin of the event: activity for Bot Framework activities, "
+        "notification for Graph change notifications"
+    )
+    change_type: str = Field(description="Message change: created, updated or deleted")
+    team_id: str | None = Field(description="Team ID", default=None)
+    channel_id: str | None = Field(description="Channel ID", default=None)
+    thread_id: str | None = Field(
+        description="Thread ID as a string in the format '1743086901347'", default=None
+    )
+    message_id: str | None = Field(description="Message ID", default=None)
+    content: str | None = Field(
+        description="Message content, Graph change notifications do not carry it",
+        default=None,
+    )
+    truncated: bool = Field(
+        description="Whether the content was cut to fit the content budget",
+        default=False,
+    )
+    sender: str | None = Field(description="Sender display name", default=None)
+    received: str = Field(description="Timestamp the server received the event at")
+
+
+class TeamsEvents(BaseModel):
+    cursor: str = Field(
+        description="Cursor to pass to wait_for_messages to receive later events"
+    )
+    items: list[TeamsEvent] = Field(description="Received events, oldest first")
+    missed: bool = Field(
+        description="Whether events after the given cursor were dropped from the "
+        "event buffer before they could be returned",
+        default=False,
+    )
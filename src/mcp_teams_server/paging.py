@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+PageFetcher = Callable[[str | None], Awaitable[tuple[T, str | None]]]
+
+
+class _End:
+    pass
+
+
+class _Failure(Generic[T]):
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+async def prefetch_pages(
+    fetch_page: PageFetcher[T], cursor: str | None = None, prefetch: int = 1
+) -> AsyncGenerator[T, None]:
+    """Iterate over paginated results fetching ahead of the consumer.
+
+    A background task follows the next page cursors while the caller consumes
+    the current page. At most ``prefetch`` pages wait in the buffer, so memory
+    stays bounded no matter how long the collection is. Closing the iterator
+    early cancels any pending fetch.
+
+    Args:
+        fetch_page: Coroutine returning a page and the cursor of the next one
+        cursor: Cursor of the first page, None to start from the beginning
+        prefetch: Number of pages fetched ahead of the consumer
+
+    Returns:
+        Async iterator over pages
+    """
+    queue: asyncio.Queue[T | _End | _Failure] = asyncio.Queue(maxsize=max(1, prefetch))
+
+    async def produce():
+        next_cursor = cursor
+        try:
+            while True:
+                page, next_cursor = await fetch_page(next_cursor)
+                await queue.put(page)
+                if not next_cursor:
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(_Failure(e))
+            return
+        await queue.put(_End())
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if isinstance(item, _End):
+                break
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        if not producer.done():
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
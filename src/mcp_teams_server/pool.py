@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from .config import parse_channel
+
+if TYPE_CHECKING:
+    from .teams import TeamsClient
+
+LOGGER = logging.getLogger(__name__)
+
+ClientFactory = Callable[[str, str], "TeamsClient"]
+
+
+class TeamsClientPool:
+    """Per-channel TeamsClient instances created on demand and evicted LRU.
+
+    Clients are built through ``factory``, which is expected to share the bot
+    adapter, Graph client, connector session and scheduler between them, so an
+    extra channel only costs a lightweight client object.
+    """
+
+    def __init__(
+        self,
+        factory: ClientFactory,
+        default_team_id: str,
+        default_channel_id: str,
+        max_size: int = 32,
+        allowed_channels: set[tuple[str, str]] | None = None,
+    ):
+        self._factory = factory
+        self.default_team_id = default_team_id
+        self.default_channel_id = default_channel_id
+        self.max_size = max(1, max_size)
+        self.allowed_channels = allowed_channels
+        self._clients: OrderedDict[tuple[str, str], TeamsClient] = OrderedDict()
+        self.evictions = 0
+
+    async def get(self, channel: str | None = None) -> "TeamsClient":
+        """Return the client of a channel, creating it on first use.
+
+        Clients evicted to make room are closed, flushing their pending
+        coalesced replies and debounced edits.
+        """
+        key = parse_channel(channel, self.default_team_id, self.default_channel_id)
+        client = self._clients.get(key)
+        if client is not None:
+            self._clients.move_to_end(key)
+            return client
+
+        default_key = (self.default_team_id, self.default_channel_id)
+        if (
+            self.allowed_channels is not None
+            and key != default_key
+            and key not in self.allowed_channels
+        ):
+            raise ValueError(f"Channel {key[0]}/{key[1]} is not allowed")
+
+        client = self._factory(*key)
+        self._clients[key] = client
+        while len(self._clients) > self.max_size:
+            evicted_key, evicted = self._clients.popitem(last=False)
+            self.evictions += 1
+            LOGGER.debug(f"Evicted Teams client for {evicted_key[0]}/{evicted_key[1]}")
+            await evicted.close()
+        return client
+
+    def clients(self) -> list["TeamsClient"]:
+        return list(self._clients.values())
+
+    async def close(self):
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.close()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "clients": len(self._clients),
+            "max_size": self.max_size,
+            "evictions": self.evictions,
+        }
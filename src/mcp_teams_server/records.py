@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+from typing import Any
+
+from pydantic_core import to_json
+
+from .models import OPTIONAL_MESSAGE_FIELDS, TeamsMessage
+
+
+class MessageRecord:
+    """Lean message on the bulk read path.
+
+    Reading thousands of messages into ``TeamsMessage`` models validates and
+    keeps every one of them until the response is serialized. Records skip
+    validation, and serialize to the same JSON object as ``TeamsMessage``,
+    leaving out unset optional fields, so bulk reads can keep JSON fragments
+    instead of messages.
+    """
+
+    __slots__ = (
+        "thread_id",
+        "message_id",
+        "content",
+        "truncated",
+        "sender",
+        "created",
+        "modified",
+        "importance",
+        "mentions",
+    )
+
+    def __init__(
+        self,
+        thread_id: str,
+        message_id: str,
+        content: str,
+        truncated: bool = False,
+        sender: str | None = None,
+        created: str | None = None,
+        modified: str | None = None,
+        importance: str | None = None,
+        mentions: list[str] | None = None,
+    ):
+        self.thread_id = thread_id
+        self.message_id = message_id
+        self.content = content
+        self.truncated = truncated
+        self.sender = sender
+        self.created = created
+        self.modified = modified
+        self.importance = importance
+        self.mentions = mentions
+
+    def __repr__(self) -> str:
+        return (
+            f"MessageRecord(thread_id={self.thread_id!r}, "
+            f"message_id={self.message_id!r}, content={self.content!r})"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "thread_id": self.thread_id,
+            "message_id": self.message_id,
+            "content": self.content,
+            "truncated": self.truncated,
+        }
+        for field in OPTIONAL_MESSAGE_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = value
+        return data
+
+    def to_json(self) -> str:
+        return to_json(self.to_dict()).decode()
+
+    def to_model(self) -> TeamsMessage:
+        return TeamsMessage(**self.to_dict())
+
+
+def dump_messages_page(
+    fragments: list[str], limit: int, cursor: str | None = None
+) -> str:
+    """Join message JSON fragments into a ``PagedTeamsMessages`` JSON document."""
+    head = to_json({"cursor": cursor, "limit": limit, "total": len(fragments)})
+    # One join copies every fragment once into the document text
+    return "".join((head[:-1].decode(), ',"items":[', *_separated(fragments), "]}"))
+
+
+def _separated(fragments: list[str]):
+    for index, fragment in enumerate(fragments):
+        if index:
+            yield ","
+        yield fragment
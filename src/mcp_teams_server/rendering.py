@@ -0,0 +1,284 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import re
+from collections.abc import Iterable
+from html.parser import HTMLParser
+from typing import Literal
+
+from .models import OPTIONAL_MESSAGE_FIELDS
+
+ContentMode = Literal["raw", "text", "markdown", "summary"]
+MessageField = Literal["sender", "created", "modified", "importance", "mentions"]
+
+RAW = "raw"
+TEXT = "text"
+MARKDOWN = "markdown"
+SUMMARY = "summary"
+
+CONTENT_MODES = (RAW, TEXT, MARKDOWN, SUMMARY)
+
+# Character budget of summaries when no explicit budget is given
+SUMMARY_CHARS = 200
+
+ELLIPSIS = "…"
+
+BLOCK_TAGS = {
+    "p",
+    "div",
+    "section",
+    "article",
+    "header",
+    "footer",
+    "table",
+    "ul",
+    "ol",
+    "blockquote",
+}
+SKIPPED_TAGS = {"script", "style", "head", "title", "template"}
+MARKDOWN_MARKERS = {
+    "strong": "**",
+    "b": "**",
+    "em": "_",
+    "i": "_",
+    "s": "~~",
+    "strike": "~~",
+    "del": "~~",
+}
+
+SPACE_PATTERN = re.compile(r"[ \t\r\f\v]+")
+TRAILING_SPACE_PATTERN = re.compile(r" +\n")
+BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
+
+class _HTMLToText(HTMLParser):
+    """Streaming conversion of Teams message HTML into plain text or markdown.
+
+    Only the tags Teams produces are handled, anything else is dropped keeping
+    its text. Attachments and cards are replaced by a short placeholder.
+    """
+
+    def __init__(self, markdown: bool):
+        super().__init__(convert_charrefs=True)
+        self.markdown = markdown
+        self._parts: list[str] = []
+        self._skip = 0
+        self._pre = 0
+        self._lists: list[int] = []
+        self._links: list[str | None] = []
+
+    def _write(self, text: str):
+        if text:
+            self._parts.append(text)
+
+    def _newline(self, count: int = 1):
+        self._write("\n" * count)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        if tag in SKIPPED_TAGS:
+            self._skip += 1
+            return
+        if self._skip:
+            return
+        attributes = dict(attrs)
+        if tag in BLOCK_TAGS:
+            self._newline(2 if tag == "p" else 1)
+            if tag == "blockquote" and self.markdown:
+                self._write("> ")
+            if tag == "ol":
+                self._lists.append(1)
+            elif tag == "ul":
+                self._lists.append(0)
+        elif tag == "br":
+            self._newline()
+        elif tag == "tr":
+            self._newline()
+        elif tag in ("td", "th"):
+            self._write(" | ")
+        elif tag == "li":
+            self._newline()
+            indent = "  " * max(0, len(self._lists) - 1)
+            if self._lists and self._lists[-1]:
+                self._write(f"{indent}{self._lists[-1]}. ")
+                self._lists[-1] += 1
+            else:
+                self._write(f"{indent}- ")
+        elif tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
+            self._newline(2)
+            if self.markdown:
+                self._write("#" * int(tag[1]) + " ")
+        elif tag == "pre":
+            self._pre += 1
+            self._newline()
+            if self.markdown:
+                self._write("```\n")
+        elif tag == "code" and not self._pre and self.markdown:
+            self._write("`")
+        elif tag == "a":
+            self._links.append(attributes.get("href"))
+            if self.markdown and attributes.get("href"):
+                self._write("[")
+        elif tag == "img":
+            alt = attributes.get("alt") or "image"
+            if self.markdown and attributes.get("src"):
+                self._write(f"![{alt}]({attributes['src']})")
+            else:
+                self._write(f"[{alt}]")
+        elif tag == "emoji":
+            self._write(attributes.get("alt") or attributes.get("title") or "")
+        elif tag == "at":
+            self._write("@")
+        elif tag == "attachment":
+            self._write("[attachment]")
+        elif tag == "hr":
+            self._newline()
+            self._write("---" if self.markdown else "")
+            self._newline()
+        elif tag in MARKDOWN_MARKERS and self.markdown:
+            self._write(MARKDOWN_MARKERS[tag])
+
+    def handle_endtag(self, tag: str):
+        if tag in SKIPPED_TAGS:
+            self._skip = max(0, self._skip - 1)
+            return
+        if self._skip:
+            return
+        if tag in BLOCK_TAGS:
+            if tag in ("ul", "ol") and self._lists:
+                self._lists.pop()
+            self._newline(2 if tag == "p" else 1)
+        elif tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
+            self._newline(2)
+        elif tag == "pre":
+            self._pre = max(0, self._pre - 1)
+            if self.markdown:
+                self._write("\n```")
+            self._newline()
+        elif tag == "code" and not self._pre and self.markdown:
+            self._write("`")
+        elif tag == "a":
+            href = self._links.pop() if self._links else None
+            if self.markdown and href:
+                self._write(f"]({href})")
+        elif tag in MARKDOWN_MARKERS and self.markdown:
+            self._write(MARKDOWN_MARKERS[tag])
+
+    def handle_data(self, data: str):
+        if self._skip:
+            return
+        if self._pre:
+            self._write(data)
+            return
+        data = SPACE_PATTERN.sub(" ", data.replace("\n", " "))
+        if not self._parts or self._parts[-1].endswith((" ", "\n")):
+            data = data.lstrip(" ")
+        self._write(data)
+
+    def text(self) -> str:
+        self.close()
+        text = TRAILING_SPACE_PATTERN.sub("\n", "".join(self._parts))
+        return BLANK_LINES_PATTERN.sub("\n\n", text).strip()
+
+
+def html_to_text(content: str, markdown: bool = False) -> str:
+    """Convert Teams message HTML into plain text, or markdown when requested."""
+    if "<" not in content and "&" not in content:
+        return content.strip()
+    parser = _HTMLToText(markdown)
+    parser.feed(content)
+    return parser.text()
+
+
+def truncate(text: str, max_chars: int) -> tuple[str, bool]:
+    """Cut text to a character budget, a budget of zero or less is unbounded."""
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text, False
+    cut = text[: max(0, max_chars - len(ELLIPSIS))]
+    # Prefer to cut on a word boundary when one is close enough
+    space = cut.rfind(" ")
+    if space > len(cut) * 0.8:
+        cut = cut[:space]
+    return cut.rstrip() + ELLIPSIS, True
+
+
+def truncate_bytes(text: str, max_bytes: int) -> str:
+    """Cut text to at most max_bytes UTF-8 bytes without splitting characters."""
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+    return encoded[:max_bytes].decode("utf-8", errors="ignore")
+
+
+def summarize(text: str, max_chars: int) -> tuple[str, bool]:
+    """Keep the first paragraph of a text within a character budget."""
+    paragraph, _, rest = text.partition("\n\n")
+    summary = " ".join(paragraph.split())
+    summary, truncated = truncate(summary, max_chars or SUMMARY_CHARS)
+    return summary, truncated or bool(rest.strip())
+
+
+class ContentRenderer:
+    """Render message bodies for a single tool response.
+
+    Each message is converted according to the content mode and cut to the per
+    message character budget. The renderer also tracks the UTF-8 size of the
+    content it returned, once the response budget is spent any further
+    content is truncated or left empty. It also carries the optional message
+    fields the response should include.
+    """
+
+    def __init__(
+        self,
+        mode: ContentMode = "raw",
+        max_chars: int = 0,
+        max_bytes: int = 0,
+        fields: Iterable[str] | None = None,
+    ):
+        """
+        Args:
+            mode: raw, text, markdown or summary
+            max_chars: Character budget per message, zero for no budget
+            max_bytes: Byte budget of all the content rendered, zero for no budget
+            fields: Optional message fields to include, such as sender or created
+        """
+        if mode not in CONTENT_MODES:
+            modes = ", ".join(CONTENT_MODES)
+            raise ValueError(f"Invalid content mode {mode}, expected one of {modes}")
+        self.fields = set(fields or ())
+        unknown = self.fields.difference(OPTIONAL_MESSAGE_FIELDS)
+        if unknown:
+            raise ValueError(
+                f"Invalid fields {', '.join(sorted(unknown))}, expected any of "
+                f"{', '.join(OPTIONAL_MESSAGE_FIELDS)}"
+            )
+        self.mode = mode
+        self.max_chars = max_chars
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+
+    def render(self, content: str | None) -> tuple[str, bool]:
+        """Render a message body.
+
+        Returns:
+            The rendered content and whether it was truncated
+        """
+        content = content or ""
+        if self.mode == SUMMARY:
+            content, truncated = summarize(html_to_text(content), self.max_chars)
+        else:
+            if self.mode in (TEXT, MARKDOWN):
+                content = html_to_text(content, markdown=self.mode == MARKDOWN)
+            content, truncated = truncate(content, self.max_chars)
+
+        if self.max_bytes > 0:
+            remaining = max(0, self.max_bytes - self.used_bytes)
+            size = len(content.encode("utf-8"))
+            if size > remaining:
+                content = truncate_bytes(content, remaining)
+                truncated = True
+                size = len(content.encode("utf-8"))
+            self.used_bytes += size
+        return content, truncated
+
+    @property
+    def exhausted(self) -> bool:
+        return self.max_bytes > 0 and self.used_bytes >= self.max_bytes
@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from botbuilder.schema.teams import TeamsChannelAccount
+
+from .singleflight import SingleFlight
+
+LOGGER = logging.getLogger(__name__)
+
+RosterLoader = Callable[[], Awaitable[list[TeamsChannelAccount]]]
+
+
+class TeamsRoster:
+    """Team member roster cached in memory with TTL expiry.
+
+    Members are indexed by name, email and member id so lookups do not scan the
+    whole roster. Once an entry is older than ``refresh_ahead * ttl`` it is still
+    served but a background reload is scheduled, so callers only wait for the
+    loader when the roster is empty or fully expired. Concurrent reloads share
+    a single call to the loader. A ``ttl`` of zero or less disables caching and
+    every lookup reloads the roster.
+    """
+
+    def __init__(
+        self, loader: RosterLoader, ttl: float = 300.0, refresh_ahead: float = 0.8
+    ):
+        self._loader = loader
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self._members: list[TeamsChannelAccount] = []
+        self._by_name: dict[str, TeamsChannelAccount] = {}
+        self._by_email: dict[str, TeamsChannelAccount] = {}
+        self._by_id: dict[str, TeamsChannelAccount] = {}
+        self._loaded_at: float | None = None
+        self.single_flight = SingleFlight()
+        self._refresh_task: asyncio.Task | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def _age(self) -> float | None:
+        if self._loaded_at is None:
+            return None
+        return time.monotonic() - self._loaded_at
+
+    def _is_fresh(self) -> bool:
+        age = self._age()
+        return self.ttl > 0 and age is not None and age < self.ttl
+
+    def _index(self, members: list[TeamsChannelAccount]):
+        by_name: dict[str, TeamsChannelAccount] = {}
+        by_email: dict[str, TeamsChannelAccount] = {}
+        by_id: dict[str, TeamsChannelAccount] = {}
+        for member in members:
+            if member.name:
+                by_name.setdefault(member.name, member)
+            if member.email:
+                by_email.setdefault(member.email.lower(), member)
+            if member.id:
+                by_id.setdefault(member.id, member)
+        self._members = members
+        self._by_name = by_name
+        self._by_email = by_email
+        self._by_id = by_id
+        self._loaded_at = time.monotonic()
+
+    async def _load(self):
+        members = await self._loader()
+        self._index(list(members))
+
+    async def _reload(self, force: bool = False):
+        if not force and self._is_fresh():
+            return
+        await self.single_flight.run(("team_members",), self._load)
+
+    async def _background_reload(self):
+        try:
+            await self._reload(force=True)
+        except Exception as e:
+            LOGGER.error(f"Error refreshing team roster: {str(e)}")
+
+    def _schedule_refresh(self):
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._background_reload())
+
+    async def _ensure(self):
+        if self._is_fresh():
+            self.hits += 1
+            age = self._age() or 0.0
+            if age >= self.ttl * self.refresh_ahead:
+                self._schedule_refresh()
+            return
+        self.misses += 1
+        await self._reload(force=self.ttl <= 0)
+
+    async def members(self) -> list[TeamsChannelAccount]:
+        """Return the full team roster."""
+        await self._ensure()
+        return self._members
+
+    async def get_by_name(self, name: str) -> TeamsChannelAccount | None:
+        await self._ensure()
+        return self._by_name.get(name)
+
+    async def get_by_email(self, email: str) -> TeamsChannelAccount | None:
+        await self._ensure()
+        return self._by_email.get(email.lower())
+
+    async def get_by_id(self, member_id: str) -> TeamsChannelAccount | None:
+        await self._ensure()
+        return self._by_id.get(member_id)
+
+    def invalidate(self):
+        """Drop the cached roster so the next lookup reloads it."""
+        self._loaded_at = None
+
+    def stats(self) -> dict[str, float | int | None]:
+        return {
+            "size": len(self._members),
+            "age": self._age(),
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.single_flight.coalesced["team_members"],
+        }
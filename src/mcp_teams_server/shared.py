@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SharedResource(Generic[T]):
+    """Resource built once and shared by every concurrent holder.
+
+    The first holder enters the context manager returned by ``factory`` and the
+    last one to leave exits it, so state held for the whole process, or by any
+    number of overlapping sessions, is created and torn down exactly once.
+    """
+
+    def __init__(self, factory: Callable[[], AbstractAsyncContextManager[T]]):
+        self._factory = factory
+        self._lock = asyncio.Lock()
+        self._holders = 0
+        self._stack: AsyncExitStack | None = None
+        self._value: T | None = None
+
+    @property
+    def holders(self) -> int:
+        return self._holders
+
+    async def _acquire(self) -> T:
+        async with self._lock:
+            if self._stack is None:
+                stack = AsyncExitStack()
+                self._value = await stack.enter_async_context(self._factory())
+                self._stack = stack
+            self._holders += 1
+            return self._value  # pyright: ignore
+
+    async def _release(self):
+        async with self._lock:
+            self._holders -= 1
+            if self._holders > 0 or self._stack is None:
+                return
+            stack, self._stack, self._value = self._stack, None, None
+            await stack.aclose()
+
+    @asynccontextmanager
+    async def hold(self) -> AsyncIterator[T]:
+        """Borrow the resource, building it when there is no other holder."""
+        value = await self._acquire()
+        try:
+            yield value
+        finally:
+            # Finish the teardown even if the holder is being cancelled
+            await asyncio.shield(self._release())
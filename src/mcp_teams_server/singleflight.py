@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers of the same key.
+
+    The first caller of a key starts the call as a task; callers arriving while
+    it runs await that same task and get its result or exception. The call is
+    shielded, so a caller that is cancelled does not cancel it for the others.
+    Keys are tuples whose first item names the operation, calls and coalesced
+    callers are counted per operation.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.calls: Counter[str] = Counter()
+        self.coalesced: Counter[str] = Counter()
+
+    @staticmethod
+    def _operation(key: Hashable) -> str:
+        return str(key[0] if isinstance(key, tuple) and key else key)
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        operation = SingleFlight._operation(key)
+        task = self._inflight.get(key)
+        if task is None:
+            self.calls[operation] += 1
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced[operation] += 1
+        return await asyncio.shield(task)
+
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            operation: {
+                "calls": self.calls[operation],
+                "coalesced": self.coalesced[operation],
+            }
+            for operation in sorted(self.calls.keys() | self.coalesced.keys())
+        }
+
+
+def merge_stats(*stats: dict[str, dict[str, Any]]) -> dict[str, dict[str, int]]:
+    """Sum the per operation counters of several single-flight groups."""
+    result: dict[str, dict[str, int]] = {}
+    for group in stats:
+        for operation, counters in group.items():
+            totals = result.setdefault(operation, {"calls": 0, "coalesced": 0})
+            for name, value in counters.items():
+                totals[name] = totals.get(name, 0) + value
+    return result
@@ -0,0 +1,432 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from .rendering import html_to_text
+
+LOGGER = logging.getLogger(__name__)
+
+# Sync watermark of callers that do not name themselves, and the one kept by
+# search refreshes so they do not consume changes of callers
+DEFAULT_SYNC_CONSUMER = "default"
+SEARCH_SYNC_CONSUMER = "search-index"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS messages (
+    team_id TEXT NOT NULL,
+    channel_id TEXT NOT NULL,
+    message_id TEXT NOT NULL,
+    thread_id TEXT NOT NULL,
+    content TEXT NOT NULL,
+    text TEXT NOT NULL,
+    created_at TEXT,
+    modified_at TEXT,
+    PRIMARY KEY (team_id, channel_id, message_id)
+);
+
+CREATE INDEX IF NOT EXISTS messages_created_at
+    ON messages (team_id, channel_id, created_at);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    text, content='messages', content_rowid='rowid', tokenize='unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, text) VALUES (new.rowid, new.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS messages_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text)
+    VALUES ('delete', old.rowid, old.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS messages_au AFTER UPDATE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text)
+    VALUES ('delete', old.rowid, old.text);
+    INSERT INTO messages_fts (rowid, text) VALUES (new.rowid, new.text);
+END;
+
+CREATE TABLE IF NOT EXISTS deliveries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    delivery_id TEXT NOT NULL UNIQUE,
+    team_id TEXT NOT NULL,
+    channel_id TEXT NOT NULL,
+    thread_id TEXT,
+    title TEXT,
+    content TEXT NOT NULL,
+    member_name TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    message_id TEXT,
+    due_at REAL NOT NULL,
+    lease_until REAL,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS deliveries_status ON deliveries (status, due_at);
+
+CREATE INDEX IF NOT EXISTS deliveries_thread
+    ON deliveries (team_id, channel_id, thread_id, status);
+
+CREATE TABLE IF NOT EXISTS sent_messages (
+    team_id TEXT NOT NULL,
+    channel_id TEXT NOT NULL,
+    message_id TEXT NOT NULL,
+    thread_id TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (team_id, channel_id, message_id)
+);
+"""
+
+PENDING = "pending"
+SENDING = "sending"
+DELIVERED = "delivered"
+FAILED = "failed"
+
+DELIVERY_COLUMNS = (
+    "delivery_id, team_id, channel_id, thread_id, title, content, member_name, "
+    "status, attempts, error, message_id, created_at, updated_at"
+)
+
+# Deliveries are claimed with UPDATE ... RETURNING, added in SQLite 3.35
+SUPPORTS_DELIVERIES = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def strip_html(content: str) -> str:
+    """HTML to single line text conversion used for indexing."""
+    return " ".join(html_to_text(content).split())
+
+
+def format_timestamp(value: datetime | None) -> str | None:
+    """Normalize timestamps to sortable UTC ISO 8601 strings."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def to_match_expression(query: str) -> str:
+    """Quote every term so user input never breaks FTS5 query syntax."""
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"' for term in terms if term)
+
+
+@dataclass
+class StoredMessage:
+    message_id: str
+    thread_id: str
+    content: str
+    created_at: datetime | None = None
+    modified_at: datetime | None = None
+    deleted: bool = False
+
+
+@dataclass
+class SearchHit:
+    message_id: str
+    thread_id: str
+    content: str
+    snippet: str
+    created_at: str | None
+    rank: float
+
+
+@dataclass
+class Delivery:
+    """Outbound message spooled for asynchronous delivery.
+
+    A delivery without thread ID starts a new thread, the thread ID is filled
+    in once it is delivered.
+    """
+
+    delivery_id: str
+    team_id: str
+    channel_id: str
+    thread_id: str | None
+    title: str | None
+    content: str
+    member_name: str | None = None
+    status: str = PENDING
+    attempts: int = 0
+    error: str | None = None
+    message_id: str | None = None
+    created_at: str | None = None
+    updated_at: str | None = None
+
+
+class TeamsStore:
+    """Local SQLite store for state that must survive restarts.
+
+    SQLite calls are blocking, so every public coroutine runs them in a worker
+    thread over a single connection guarded by a lock.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if self.path != ":memory:":
+                directory = os.path.dirname(os.path.abspath(self.path))
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> list[tuple]:
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                return connection.execute(sql, parameters).fetchall()
+
+    async def get_watermark(self, key: str) -> str | None:
+        rows = await asyncio.to_thread(
+            self._execute, "SELECT value FROM watermarks WHERE key = ?", (key,)
+        )
+        return rows[0][0] if rows else None
+
+    async def set_watermark(self, key: str, value: str):
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT INTO watermarks (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, "
+            "updated_at = CURRENT_TIMESTAMP",
+            (key, value),
+        )
+
+    async def delete_watermark(self, key: str):
+        await asyncio.to_thread(
+            self._execute, "DELETE FROM watermarks WHERE key = ?", (key,)
+        )
+
+    def _save_messages(
+        self, team_id: str, channel_id: str, messages: list[StoredMessage]
+    ):
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                for message in messages:
+                    if message.deleted:
+                        connection.execute(
+                            "DELETE FROM messages WHERE team_id = ? AND channel_id = ? "
+                            "AND message_id = ?",
+                            (team_id, channel_id, message.message_id),
+                        )
+                        continue
+                    connection.execute(
+                        "INSERT INTO messages (team_id, channel_id, message_id, "
+                        "thread_id, content, text, created_at, modified_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT(team_id, channel_id, message_id) DO UPDATE SET "
+                        "thread_id = excluded.thread_id, content = excluded.content, "
+                        "text = excluded.text, created_at = excluded.created_at, "
+                        "modified_at = excluded.modified_at "
+                        "WHERE excluded.modified_at IS NULL "
+                        "OR messages.modified_at IS NULL "
+                        "OR excluded.modified_at >= messages.modified_at",
+                        (
+                            team_id,
+                            channel_id,
+                            message.message_id,
+                            message.thread_id,
+                            message.content,
+                            strip_html(message.content),
+                            format_timestamp(message.created_at),
+                            format_timestamp(message.modified_at),
+                        ),
+                    )
+
+    async def save_messages(
+        self, team_id: str, channel_id: str, messages: list[StoredMessage]
+    ):
+        """Insert or refresh channel messages in the local search index."""
+        if messages:
+            await asyncio.to_thread(self._save_messages, team_id, channel_id, messages)
+
+    def _search(
+        self,
+        team_id: str,
+        channel_id: str,
+        query: str,
+        since: datetime | None,
+        until: datetime | None,
+        limit: int,
+        offset: int,
+    ) -> list[SearchHit]:
+        sql = (
+            "SELECT m.message_id, m.thread_id, m.content, "
+            "snippet(messages_fts, 0, '**', '**', '...', 16), m.created_at, "
+            "bm25(messages_fts) AS rank "
+            "FROM messages_fts JOIN messages m ON m.rowid = messages_fts.rowid "
+            "WHERE messages_fts MATCH ? AND m.team_id = ? AND m.channel_id = ?"
+        )
+        parameters: list = [to_match_expression(query), team_id, channel_id]
+        if since is not None:
+            sql += " AND m.created_at >= ?"
+            parameters.append(format_timestamp(since))
+        if until is not None:
+            sql += " AND m.created_at < ?"
+            parameters.append(format_timestamp(until))
+        sql += " ORDER BY rank LIMIT ? OFFSET ?"
+        parameters.extend([limit, offset])
+        rows = self._execute(sql, tuple(parameters))
+        return [SearchHit(*row) for row in rows]
+
+    async def search_messages(
+        self,
+        team_id: str,
+        channel_id: str,
+        query: str,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[SearchHit]:
+        """Full-text search over indexed messages, best matches first."""
+        if not to_match_expression(query):
+            return []
+        return await asyncio.to_thread(
+            self._search, team_id, channel_id, query, since, until, limit, offset
+        )
+
+    async def save_sent_message(
+        self, team_id: str, channel_id: str, message_id: str, thread_id: str
+    ):
+        """Remember a message posted by the server, so it can be edited later."""
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT OR REPLACE INTO sent_messages (team_id, channel_id, message_id, "
+            "thread_id) VALUES (?, ?, ?, ?)",
+            (team_id, channel_id, message_id, thread_id),
+        )
+
+    async def get_sent_message_thread(
+        self, team_id: str, channel_id: str, message_id: str
+    ) -> str | None:
+        """Thread of a message posted by the server, None for other messages."""
+        rows = await asyncio.to_thread(
+            self._execute,
+            "SELECT thread_id FROM sent_messages "
+            "WHERE team_id = ? AND channel_id = ? AND message_id = ?",
+            (team_id, channel_id, message_id),
+        )
+        return rows[0][0] if rows else None
+
+    async def add_delivery(self, delivery: Delivery, due_at: float):
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT INTO deliveries (delivery_id, team_id, channel_id, thread_id, "
+            "title, content, member_name, status, due_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                delivery.delivery_id,
+                delivery.team_id,
+                delivery.channel_id,
+                delivery.thread_id,
+                delivery.title,
+                delivery.content,
+                delivery.member_name,
+                PENDING,
+                due_at,
+            ),
+        )
+
+    async def claim_delivery(self, now: float, lease: float) -> Delivery | None:
+        """Lease the oldest delivery that is due, counting a new attempt.
+
+        Pending deliveries are due once their retry time has passed, and
+        deliveries being sent are due again when their lease expired, after the
+        process sending them died. A reply is only claimed when no earlier reply
+        to the same thread is still pending or being sent, so replies keep their
+        order. Claims are a single statement, safe across connections, which
+        requires SQLite 3.35 or later, see ``SUPPORTS_DELIVERIES``.
+        """
+        rows = await asyncio.to_thread(
+            self._execute,
+            "UPDATE deliveries SET status = ?, attempts = attempts + 1, "
+            "lease_until = ?, updated_at = CURRENT_TIMESTAMP "
+            "WHERE id = (SELECT d.id FROM deliveries d "
+            "WHERE ((d.status = ? AND d.due_at <= ?) "
+            "OR (d.status = ? AND d.lease_until <= ?)) "
+            "AND NOT EXISTS (SELECT 1 FROM deliveries e "
+            "WHERE d.thread_id IS NOT NULL AND e.team_id = d.team_id "
+            "AND e.channel_id = d.channel_id AND e.thread_id = d.thread_id "
+            "AND e.status IN (?, ?) AND e.id < d.id) "
+            f"ORDER BY d.id LIMIT 1) RETURNING {DELIVERY_COLUMNS}",
+            (SENDING, now + lease, PENDING, now, SENDING, now, PENDING, SENDING),
+        )
+        return Delivery(*rows[0]) if rows else None
+
+    async def complete_delivery(
+        self, delivery_id: str, thread_id: str, message_id: str
+    ):
+        await asyncio.to_thread(
+            self._execute,
+            "UPDATE deliveries SET status = ?, thread_id = ?, message_id = ?, "
+            "error = NULL, lease_until = NULL, updated_at = CURRENT_TIMESTAMP "
+            "WHERE delivery_id = ?",
+            (DELIVERED, thread_id, message_id, delivery_id),
+        )
+
+    async def fail_delivery(
+        self, delivery_id: str, error: str, retry_at: float | None = None
+    ):
+        """Record a failed attempt, retried at ``retry_at`` or failed for good."""
+        await asyncio.to_thread(
+            self._execute,
+            "UPDATE deliveries SET status = ?, error = ?, "
+            "due_at = COALESCE(?, due_at), lease_until = NULL, "
+            "updated_at = CURRENT_TIMESTAMP WHERE delivery_id = ?",
+            (PENDING if retry_at is not None else FAILED, error, retry_at, delivery_id),
+        )
+
+    async def has_unfinished_deliveries(self) -> bool:
+        """Whether any delivery is still pending or being sent."""
+        rows = await asyncio.to_thread(
+            self._execute,
+            "SELECT 1 FROM deliveries WHERE status IN (?, ?) LIMIT 1",
+            (PENDING, SENDING),
+        )
+        return bool(rows)
+
+    async def get_delivery(self, delivery_id: str) -> Delivery | None:
+        rows = await asyncio.to_thread(
+            self._execute,
+            f"SELECT {DELIVERY_COLUMNS} FROM deliveries WHERE delivery_id = ?",
+            (delivery_id,),
+        )
+        return Delivery(*rows[0]) if rows else None
+
+    async def purge_deliveries(self, max_age: float):
+        """Delete delivered and failed deliveries older than ``max_age`` seconds."""
+        await asyncio.to_thread(
+            self._execute,
+            "DELETE FROM deliveries WHERE status IN (?, ?) "
+            "AND updated_at < datetime('now', ?)",
+            (DELIVERED, FAILED, f"-{int(max_age)} seconds"),
+        )
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -1,9 +1,13 @@
 # SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import logging
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Hashable, Iterable
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
-from botbuilder.core import BotAdapter, TurnContext
-from botbuilder.core.teams import TeamsInfo
+from botbuilder.core import TurnContext
 from botbuilder.integration.aiohttp import CloudAdapter
 from botbuilder.schema import (
     Activity,
@@ -15,64 +19,80 @@ from botbuilder.schema import (
     TextFormatTypes,
 )
 from botbuilder.schema.teams import TeamsChannelAccount
-from botframework.connector.aio.operations_async import ConversationsOperations
+from kiota_abstractions.api_error import APIError
 from kiota_abstractions.base_request_configuration import RequestConfiguration
-from msgraph.generated.models.chat_message import ChatMessage
-from msgraph.generated.teams.item.channels.item.messages.item.chat_message_item_request_builder import (
-    ChatMessageItemRequestBuilder,
-)
-from msgraph.generated.teams.item.channels.item.messages.item.replies.replies_request_builder import (
-    RepliesRequestBuilder,
-)
-from msgraph.generated.teams.item.channels.item.messages.messages_request_builder import (
-    MessagesRequestBuilder,
-)
-from msgraph.graph_service_client import GraphServiceClient
-from pydantic import BaseModel, Field
-
-LOGGER = logging.getLogger(__name__)
 
+from .cache import ReadCache
+from .coalescing import EditDebouncer, UpdateCoalescer
+from .connector import DEFAULT_SERVICE_URL, ConnectorSession
+from .filters import MessageFilter, get_message_fields
+from .metrics import instrumented
+from .models import (
+    PagedTeamsMessages,
+    PagedTeamsSearchResults,
+    PagedTeamsThreads,
+    TeamsBulkPost,
+    TeamsBulkPostResult,
+    TeamsMember,
+    TeamsMessage,
+    TeamsSearchResult,
+    TeamsThread,
+    TeamsThreadReplies,
+    TeamsThreadWithReplies,
+)
+from .paging import prefetch_pages
+from .records import MessageRecord
+from .rendering import ContentMode, ContentRenderer
+from .roster import TeamsRoster
+from .singleflight import SingleFlight
+from .store import DEFAULT_SYNC_CONSUMER, StoredMessage, TeamsStore
+from .throttling import CONNECTOR, GRAPH, RequestScheduler
 
-class TeamsThread(BaseModel):
-    thread_id: str = Field(
-        description="Thread ID as a string in the format '1743086901347'"
+# The generated Graph models and request builders take seconds to import, they
+# are only imported for type checking here and lazily where requests are built
+if TYPE_CHECKING:
+    from msgraph.generated.models.chat_message import ChatMessage
+    from msgraph.generated.models.chat_message_collection_response import (
+        ChatMessageCollectionResponse,
     )
-    title: str = Field(description="Message title")
-    content: str = Field(description="Message content")
-
-
-class TeamsMessage(BaseModel):
-    thread_id: str = Field(
-        description="Thread ID as a string in the format '1743086901347'"
+    from msgraph.generated.teams.item.channels.item.messages.messages_request_builder import (
+        MessagesRequestBuilder,
     )
-    message_id: str = Field(description="Message ID")
-    content: str = Field(description="Message content")
-
+    from msgraph.graph_service_client import GraphServiceClient
 
-class TeamsMember(BaseModel):
-    name: str = Field(
-        description="Member name used in mentions and user information cards"
-    )
-    email: str = Field(description="Member email")
+LOGGER = logging.getLogger(__name__)
 
+# Messages posted by a client whose thread is remembered in memory, older ones
+# are looked up in the store
+SENT_MESSAGES_SIZE = 1000
 
-class PagedTeamsMessages(BaseModel):
-    cursor: str | None = Field(
-        description="Cursor to retrieve the next page of messages."
-    )
-    limit: int = Field(description="Page limit, maximum number of items to retrieve")
-    total: int = Field(description="Total items available for retrieval")
-    items: list[TeamsMessage] = Field(description="List of channel messages or threads")
+# Maximum number of requests accepted by a Graph JSON $batch call
+GRAPH_BATCH_SIZE = 20
 
 
 class TeamsClient:
     def __init__(
         self,
         adapter: CloudAdapter,
-        graph_client: GraphServiceClient,
+        graph_client: "GraphServiceClient",
         teams_app_id: str,
         team_id: str,
         teams_channel_id: str,
+        members_cache_ttl: float = 300.0,
+        service_url: str = DEFAULT_SERVICE_URL,
+        session: ConnectorSession | None = None,
+        store: TeamsStore | None = None,
+        scheduler: RequestScheduler | None = None,
+        roster: TeamsRoster | None = None,
+        content_mode: ContentMode = "raw",
+        max_content_chars: int = 0,
+        max_response_bytes: int = 0,
+        read_cache: ReadCache | None = None,
+        single_flight: SingleFlight | None = None,
+        coalesce_window: float = 0.0,
+        coalesce_max_messages: int = 20,
+        coalesce_max_chars: int = 20000,
+        edit_debounce: float = 0.0,
     ):
         self.adapter = adapter
         self.graph_client = graph_client
@@ -80,18 +100,71 @@ class TeamsClient:
         self.team_id = team_id
         self.teams_channel_id = teams_channel_id
         self.service_url = None
+        self.default_service_url = service_url
+        self.scheduler = scheduler or RequestScheduler()
+        # Sessions given by the caller are shared with other clients
+        self._owns_session = session is None
+        self.session = session or ConnectorSession(
+            adapter, teams_app_id, service_url, scheduler=self.scheduler
+        )
+        self.store = store
         self.adapter.on_turn_error = self.on_turn_error
+        self.roster = roster or TeamsRoster(
+            self._fetch_team_members, ttl=members_cache_ttl
+        )
+        self.content_mode: ContentMode = content_mode
+        self.max_content_chars = max_content_chars
+        self.max_response_bytes = max_response_bytes
+        # Caches given by the caller are shared with the clients of every
+        # channel, so their keys are scoped by team and channel
+        self.read_cache = read_cache or ReadCache()
+        # Concurrent identical reads share a single upstream call
+        self.single_flight = single_flight or SingleFlight()
+        self.coalescer: UpdateCoalescer[TeamsMessage] | None = None
+        if coalesce_window > 0:
+            self.coalescer = UpdateCoalescer(
+                self._send_reply,
+                coalesce_window,
+                max_messages=coalesce_max_messages,
+                max_chars=coalesce_max_chars,
+            )
+        self.edit_debouncer: EditDebouncer[TeamsMessage] = EditDebouncer(
+            self._send_edit, edit_debounce
+        )
+        # Thread of each message posted by this client, the ones it may edit
+        self._sent_messages: OrderedDict[str, str] = OrderedDict()
 
     def get_team_id(self):
         return self.team_id
 
+    def _key(self, operation: str, *args: Hashable) -> tuple[Hashable, ...]:
+        """Read cache and single-flight key of an operation on this channel."""
+        return (operation, self.team_id, self.teams_channel_id, *args)
+
+    def create_renderer(
+        self,
+        content_mode: ContentMode | None = None,
+        max_content_chars: int | None = None,
+        max_response_bytes: int | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> ContentRenderer:
+        """Create the content renderer of a response, defaulting to client settings."""
+        return ContentRenderer(
+            content_mode or self.content_mode,
+            self.max_content_chars if max_content_chars is None else max_content_chars,
+            self.max_response_bytes
+            if max_response_bytes is None
+            else max_response_bytes,
+            fields,
+        )
+
     @staticmethod
     async def on_turn_error(context: TurnContext, error: Exception):
         LOGGER.error(f"Error {str(error)}")
         # await context.send_activity("An error occurred in the bot, please try again later")
 
     def _create_conversation_reference(self) -> ConversationReference:
-        service_url = "https://smba.trafficmanager.net/emea/"
+        service_url = self.default_service_url
         if self.service_url is not None:
             service_url = self.service_url
         return ConversationReference(
@@ -106,18 +179,48 @@ class TeamsClient:
             ),
         )
 
-    async def _initialize(self):
+    @instrumented("client")
+    async def initialize(self):
+        """Resolve the Bot Framework service url of the channel, once."""
         if not self.service_url:
+            # The first concurrent requests resolve the service url only once
+            self.service_url = await self.single_flight.run(
+                self._key("initialize"), self._resolve_service_url
+            )
 
-            def context_callback(context: TurnContext):
-                self.service_url = context.activity.service_url
+    async def _resolve_service_url(self) -> str | None:
+        service_url = None
 
-            await self.adapter.continue_conversation(
-                bot_app_id=self.teams_app_id,
-                reference=self._create_conversation_reference(),
-                callback=context_callback,
-            )
+        async def context_callback(context: TurnContext):
+            nonlocal service_url
+            service_url = context.activity.service_url
 
+        await self.adapter.continue_conversation(
+            bot_app_id=self.teams_app_id,
+            reference=self._create_conversation_reference(),
+            callback=context_callback,
+        )
+        if service_url:
+            await self.session.set_service_url(service_url)
+        return service_url
+
+    @instrumented("client")
+    async def _fetch_team_members(self) -> list[TeamsChannelAccount]:
+        await self.initialize()
+        return await self.session.get_team_members(self.team_id)
+
+    @staticmethod
+    def _create_mention(member: TeamsChannelAccount) -> Mention:
+        return Mention(
+            text=f"<at>{member.name}</at>",
+            type="mention",
+            mentioned=ChannelAccount(id=member.id, name=member.name),
+        )
+
+    def _create_bot_account(self) -> TeamsChannelAccount:
+        return TeamsChannelAccount(id=self.teams_app_id, name="MCP Bot")
+
+    @instrumented("client")
     async def start_thread(
         self, title: str, content: str, member_name: str | None = None
     ) -> TeamsThread:
@@ -132,66 +235,61 @@ class TeamsClient:
             Created thread details including ID
         """
         try:
-            await self._initialize()
+            await self.initialize()
 
             result = TeamsThread(title=title, content=content, thread_id="")
 
-            async def start_thread_callback(context: TurnContext):
-                mention_member = None
-                if member_name is not None:
-                    members = await TeamsInfo.get_team_members(context, self.team_id)
-                    for member in members:
-                        if member.name == member_name:
-                            mention_member = member
-
-                mentions = []
-                if mention_member is not None:
-                    result.content = (
-                        f"# **{title}**\n<at>{mention_member.name}</at> {content}"
-                    )
-                    mention = Mention(
-                        text=f"<at>{mention_member.name}</at>",
-                        type="mention",
-                        mentioned=ChannelAccount(
-                            id=mention_member.id, name=mention_member.name
-                        ),
-                    )
-                    mentions.append(mention)
-
-                response = await context.send_activity(
-                    activity_or_text=Activity(
-                        type=ActivityTypes.message,
-                        topic_name=title,
-                        text=result.content,
-                        text_format=TextFormatTypes.markdown,
-                        entities=mentions,
-                    )
+            mention_member = None
+            if member_name is not None:
+                mention_member = await self.roster.get_by_name(member_name)
+
+            mentions = []
+            if mention_member is not None:
+                result.content = (
+                    f"# **{title}**\n<at>{mention_member.name}</at> {content}"
                 )
-                if response is not None:
-                    result.thread_id = response.id
+                mentions.append(TeamsClient._create_mention(mention_member))
 
-            await self.adapter.continue_conversation(
-                bot_app_id=self.teams_app_id,
-                reference=self._create_conversation_reference(),
-                callback=start_thread_callback,
+            activity = Activity(
+                type=ActivityTypes.message,
+                topic_name=title,
+                text=result.content,
+                text_format=TextFormatTypes.markdown,
+                entities=mentions,
+                channel_id=self.teams_channel_id,
+                service_url=self.session.service_url,
+                from_property=self._create_bot_account(),
+                conversation=ConversationAccount(
+                    id=self.teams_channel_id,
+                    is_group=True,
+                    conversation_type="channel",
+                ),
             )
+            conversations = await self.session.conversations()
+            response = await self.scheduler.run(
+                CONNECTOR,
+                lambda: conversations.send_to_conversation(
+                    conversation_id=self.teams_channel_id, activity=activity
+                ),
+            )
+            if response is not None:
+                result.thread_id = response.id  # pyright: ignore
+                await self._remember_sent(result.thread_id, result.thread_id)
 
             return result
         except Exception as e:
             LOGGER.error(f"Error creating thread: {str(e)}")
             raise
 
-    @staticmethod
-    def _get_conversation_operations(context: TurnContext) -> ConversationsOperations:
-        # Hack to get the connector client and reply to an existing activity
-        connector_client = context.turn_state[BotAdapter.BOT_CONNECTOR_CLIENT_KEY]
-        return connector_client.conversations  # pyright: ignore
-
+    @instrumented("client")
     async def update_thread(
         self, thread_id: str, content: str, member_name: str | None = None
     ) -> TeamsMessage:
         """Add a message to an existing thread, mentioning a user optionally.
 
+        With a coalescing window, updates to the same thread arriving within it
+        are posted as a single message whose ID is returned to every caller.
+
         Args:
             thread_id: Thread ID to update
             content: Message content to add
@@ -200,93 +298,344 @@ class TeamsClient:
         Returns:
             Updated thread details
         """
+        if self.coalescer is None:
+            return await self._send_reply(thread_id, content, member_name)
+        message = await self.coalescer.submit(thread_id, content, member_name)
+        return message.model_copy(update={"content": content})
+
+    async def _send_reply(
+        self, thread_id: str, content: str, member_name: str | None = None
+    ) -> TeamsMessage:
         try:
-            await self._initialize()
+            await self.initialize()
 
             result = TeamsMessage(thread_id=thread_id, content=content, message_id="")
+            result.content, mentions = await self._mention(content, member_name)
 
-            async def update_thread_callback(context: TurnContext):
-                mention_member = None
-                if member_name is not None:
-                    members = await TeamsInfo.get_team_members(context, self.team_id)
-                    for member in members:
-                        if member.name == member_name:
-                            mention_member = member
-
-                mentions = []
-                if mention_member is not None:
-                    result.content = f"<at>{mention_member.name}</at> {content}"
-                    mention = Mention(
-                        text=f"<at>{mention_member.name}</at>",
-                        type="mention",
-                        mentioned=ChannelAccount(
-                            id=mention_member.id, name=mention_member.name
-                        ),
-                    )
-                    mentions.append(mention)
-
-                reply = Activity(
-                    type=ActivityTypes.message,
-                    text=result.content,
-                    from_property=TeamsChannelAccount(
-                        id=self.teams_app_id, name="MCP Bot"
-                    ),
-                    conversation=ConversationAccount(id=thread_id),
-                    entities=mentions,
-                )
-                #
-                # Hack to get the connector client and reply to an existing activity
-                #
-                conversations = TeamsClient._get_conversation_operations(context)
-                #
-                # Hack to reply to conversation https://github.com/microsoft/botframework-sdk/issues/6626
-                #
-                conversation_id = (
-                    f"{context.activity.conversation.id};messageid={thread_id}"  # pyright: ignore
-                )
-                response = await conversations.send_to_conversation(
+            reply = Activity(
+                type=ActivityTypes.message,
+                text=result.content,
+                from_property=self._create_bot_account(),
+                conversation=ConversationAccount(id=thread_id),
+                entities=mentions,
+            )
+            conversations = await self.session.conversations()
+            #
+            # Hack to reply to conversation https://github.com/microsoft/botframework-sdk/issues/6626
+            #
+            conversation_id = f"{self.teams_channel_id};messageid={thread_id}"
+            response = await self.scheduler.run(
+                CONNECTOR,
+                lambda: conversations.send_to_conversation(
                     conversation_id=conversation_id, activity=reply
+                ),
+            )
+
+            if response is not None:
+                result.message_id = response.id  # pyright: ignore
+                await self._remember_sent(result.message_id, thread_id)
+            # Cached reply pages of the thread no longer include every reply
+            self.invalidate_reads(thread_id)
+
+            return result
+        except Exception as e:
+            LOGGER.error(f"Error updating thread: {str(e)}")
+            raise
+
+    async def _mention(
+        self, content: str, member_name: str | None
+    ) -> tuple[str, list[Mention]]:
+        """Content prefixed with the member mention, and the mention entities."""
+        if member_name is None:
+            return content, []
+        member = await self.roster.get_by_name(member_name)
+        if member is None:
+            return content, []
+        return f"<at>{member.name}</at> {content}", [
+            TeamsClient._create_mention(member)
+        ]
+
+    async def _remember_sent(self, message_id: str, thread_id: str):
+        self._sent_messages[message_id] = thread_id
+        self._sent_messages.move_to_end(message_id)
+        while len(self._sent_messages) > SENT_MESSAGES_SIZE:
+            self._sent_messages.popitem(last=False)
+        if self.store is not None:
+            try:
+                await self.store.save_sent_message(
+                    self.team_id, self.teams_channel_id, message_id, thread_id
                 )
+            except Exception as e:
+                # The message was posted, only later edits depend on the record
+                LOGGER.error(f"Error recording sent message: {str(e)}")
 
-                if response is not None:
-                    result.message_id = response.id  # pyright: ignore
+    async def _get_sent_thread(self, message_id: str) -> str | None:
+        thread_id = self._sent_messages.get(message_id)
+        if thread_id is None and self.store is not None:
+            thread_id = await self.store.get_sent_message_thread(
+                self.team_id, self.teams_channel_id, message_id
+            )
+        return thread_id
+
+    @instrumented("client")
+    async def edit_message(
+        self, message_id: str, content: str, member_name: str | None = None
+    ) -> TeamsMessage:
+        """Replace the content of a message posted by this server.
 
-            await self.adapter.continue_conversation(
-                bot_app_id=self.teams_app_id,
-                reference=self._create_conversation_reference(),
-                callback=update_thread_callback,
+        Edits of the same message within the debounce window are merged, only
+        the latest one is sent and returned to every caller.
+
+        Args:
+            message_id: ID of a thread or reply posted by this server
+            content: New message content
+            member_name: Member name to mention (optional)
+
+        Returns:
+            Edited message details
+        """
+        if await self._get_sent_thread(message_id) is None:
+            raise ValueError(f"Message {message_id} was not posted by this server")
+        return await self.edit_debouncer.submit(message_id, content, member_name)
+
+    async def _send_edit(
+        self, message_id: str, content: str, member_name: str | None = None
+    ) -> TeamsMessage:
+        try:
+            await self.initialize()
+
+            thread_id = await self._get_sent_thread(message_id) or message_id
+            result = TeamsMessage(
+                thread_id=thread_id, message_id=message_id, content=content
             )
+            result.content, mentions = await self._mention(content, member_name)
+
+            activity = Activity(
+                id=message_id,
+                type=ActivityTypes.message,
+                text=result.content,
+                from_property=self._create_bot_account(),
+                conversation=ConversationAccount(id=thread_id),
+                entities=mentions,
+            )
+            conversations = await self.session.conversations()
+            # Same thread addressing as replies, see update_thread
+            conversation_id = f"{self.teams_channel_id};messageid={thread_id}"
+            await self.scheduler.run(
+                CONNECTOR,
+                lambda: conversations.update_activity(
+                    conversation_id=conversation_id,
+                    activity_id=message_id,
+                    activity=activity,
+                ),
+            )
+            self.invalidate_reads(thread_id, message_id)
 
             return result
         except Exception as e:
-            LOGGER.error(f"Error updating thread: {str(e)}")
+            LOGGER.error(f"Error editing message: {str(e)}")
             raise
 
-    async def get_member_by_id(self, member_id: str) -> TeamsMember:
-        try:
-            await self._initialize()
+    @instrumented("client")
+    async def post_messages_bulk(
+        self, items: list[TeamsBulkPost], concurrency: int = 8
+    ) -> list[TeamsBulkPostResult]:
+        """Post many messages and threads concurrently.
 
-            result = TeamsMember(name="", email="")
+        Items addressed to the same thread are sent one after the other in
+        request order, different threads and new threads are sent in parallel
+        up to ``concurrency``. Outbound requests still go through the connector
+        rate limit, but not through the coalescing window, since replies to a
+        thread are awaited one by one. A failed item does not stop the others.
 
-            async def get_member_by_id_callback(context: TurnContext):
-                member = await TeamsInfo.get_team_member(
-                    context, self.team_id, member_id
-                )
-                result.name = member.name
-                result.email = member.email
+        Args:
+            items: Messages to post, replies when thread_id is set, new threads
+                otherwise
+            concurrency: Maximum number of threads posted to at the same time
 
-            await self.adapter.continue_conversation(
-                bot_app_id=self.teams_app_id,
-                reference=self._create_conversation_reference(),
-                callback=get_member_by_id_callback,
+        Returns:
+            One result per item, in request order
+        """
+        results = [
+            TeamsBulkPostResult(
+                index=index, thread_id=item.thread_id, message_id=None, error=None
             )
-            return result
+            for index, item in enumerate(items)
+        ]
+        groups: dict[str, list[int]] = {}
+        for index, item in enumerate(items):
+            key = f"thread:{item.thread_id}" if item.thread_id else f"new:{index}"
+            groups.setdefault(key, []).append(index)
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def post(index: int):
+            item = items[index]
+            result = results[index]
+            try:
+                if item.thread_id:
+                    message = await self._send_reply(
+                        item.thread_id, item.content, item.member_name
+                    )
+                    result.message_id = message.message_id
+                elif item.title:
+                    thread = await self.start_thread(
+                        item.title, item.content, item.member_name
+                    )
+                    result.thread_id = thread.thread_id
+                    result.message_id = thread.thread_id
+                else:
+                    result.error = "Either thread_id or title is required"
+            except Exception as e:
+                result.error = str(e)
+
+        async def post_group(indexes: list[int]):
+            async with semaphore:
+                for index in indexes:
+                    await post(index)
+
+        await asyncio.gather(*[post_group(indexes) for indexes in groups.values()])
+        return results
+
+    @instrumented("client")
+    async def get_member_by_id(self, member_id: str) -> TeamsMember:
+        try:
+            await self.initialize()
+
+            member = await self.roster.get_by_id(member_id)
+            if member is None:
+                member = await self.session.get_team_member(self.team_id, member_id)
+            return TeamsMember(name=member.name, email=member.email)
         except Exception as e:
             LOGGER.error(f"Error updating thread: {str(e)}")
             raise
 
+    def _messages_request_builder(self) -> "MessagesRequestBuilder":
+        return (
+            self.graph_client.teams.by_team_id(self.team_id)
+            .channels.by_channel_id(self.teams_channel_id)
+            .messages
+        )
+
+    async def _get_threads_page(
+        self, limit: int, cursor: str | None, expand: list[str] | None = None
+    ) -> "ChatMessageCollectionResponse | None":
+        from msgraph.generated.teams.item.channels.item.messages.messages_request_builder import (
+            MessagesRequestBuilder,
+        )
+
+        query = MessagesRequestBuilder.MessagesRequestBuilderGetQueryParameters(
+            top=limit, expand=expand
+        )
+        request = RequestConfiguration(query_parameters=query)
+        messages = self._messages_request_builder()
+        if cursor is not None:
+            messages = messages.with_url(cursor)
+        response = await self.scheduler.run(
+            GRAPH, lambda: messages.get(request_configuration=request)
+        )
+        if response is not None:
+            self._refresh_cached_messages(response.value)
+        return response
+
+    @staticmethod
+    def _render(
+        message: "ChatMessage", renderer: ContentRenderer | None
+    ) -> tuple[str, bool]:
+        content = message.body.content if message.body else None
+        if renderer is None:
+            return content, False  # pyright: ignore
+        return renderer.render(content)
+
+    @staticmethod
+    def _to_teams_message(
+        message: "ChatMessage",
+        thread_id: str | None,
+        renderer: ContentRenderer | None = None,
+    ) -> TeamsMessage:
+        content, truncated = TeamsClient._render(message, renderer)
+        fields = get_message_fields(message, renderer.fields) if renderer else {}
+        return TeamsMessage(
+            message_id=message.id,  # pyright: ignore
+            content=content,
+            thread_id=thread_id,  # pyright: ignore
+            truncated=truncated,
+            **fields,  # pyright: ignore
+        )
+
+    @staticmethod
+    def _to_message_record(
+        message: "ChatMessage",
+        thread_id: str | None,
+        renderer: ContentRenderer | None = None,
+    ) -> MessageRecord:
+        content, truncated = TeamsClient._render(message, renderer)
+        fields = get_message_fields(message, renderer.fields) if renderer else {}
+        return MessageRecord(
+            thread_id,  # pyright: ignore
+            message.id,  # pyright: ignore
+            content,
+            truncated,
+            **fields,  # pyright: ignore
+        )
+
+    @staticmethod
+    def _to_teams_thread(
+        message: "ChatMessage",
+        replies_limit: int | None = None,
+        renderer: ContentRenderer | None = None,
+    ) -> TeamsThreadWithReplies:
+        replies = message.replies or []
+        if replies_limit is not None:
+            replies = replies[:replies_limit]
+        content, truncated = TeamsClient._render(message, renderer)
+        fields = get_message_fields(message, renderer.fields) if renderer else {}
+        return TeamsThreadWithReplies(
+            message_id=message.id,  # pyright: ignore
+            content=content,
+            thread_id=message.id,  # pyright: ignore
+            truncated=truncated,
+            **fields,  # pyright: ignore
+            replies=[
+                TeamsClient._to_teams_message(reply, reply.reply_to_id, renderer)
+                for reply in replies
+            ],
+        )
+
+    @staticmethod
+    def _to_stored_message(message: "ChatMessage") -> StoredMessage:
+        return StoredMessage(
+            message_id=message.id,  # pyright: ignore
+            thread_id=message.reply_to_id or message.id,  # pyright: ignore
+            content=(message.body.content if message.body else None) or "",
+            created_at=message.created_date_time,
+            modified_at=message.last_modified_date_time,
+            deleted=message.deleted_date_time is not None,
+        )
+
+    async def _index_messages(self, messages: list["ChatMessage"]):
+        """Feed read messages, and any expanded replies, to the search index."""
+        if self.store is None or not messages:
+            return
+        stored = []
+        for message in messages:
+            stored.append(TeamsClient._to_stored_message(message))
+            stored.extend(
+                TeamsClient._to_stored_message(reply) for reply in message.replies or []
+            )
+        try:
+            await self.store.save_messages(self.team_id, self.teams_channel_id, stored)
+        except Exception as e:
+            # The index is best effort, never fail a read because of it
+            LOGGER.error(f"Error indexing messages: {str(e)}")
+
+    @instrumented("client")
     async def read_threads(
-        self, limit: int = 50, cursor: str | None = None
+        self,
+        limit: int = 50,
+        cursor: str | None = None,
+        renderer: ContentRenderer | None = None,
+        message_filter: MessageFilter | None = None,
     ) -> PagedTeamsMessages:
         """Read all threads in configured teams channel.
 
@@ -295,27 +644,16 @@ class TeamsClient:
 
             limit: The pagination page size
 
+            renderer: Content renderer, defaults to the client settings
+
+            message_filter: Criteria threads must match, applied to each page
+
         Returns:
             Paged team channel messages containing
         """
+        renderer = renderer or self.create_renderer()
         try:
-            query = MessagesRequestBuilder.MessagesRequestBuilderGetQueryParameters(
-                top=limit
-            )
-            request = RequestConfiguration(query_parameters=query)
-            if cursor is not None:
-                response = (
-                    await self.graph_client.teams.by_team_id(self.team_id)
-                    .channels.by_channel_id(self.teams_channel_id)
-                    .messages.with_url(cursor)
-                    .get(request_configuration=request)
-                )
-            else:
-                response = (
-                    await self.graph_client.teams.by_team_id(self.team_id)
-                    .channels.by_channel_id(self.teams_channel_id)
-                    .messages.get(request_configuration=request)
-                )
+            response = await self._get_threads_page(limit, cursor)
 
             result = PagedTeamsMessages(
                 cursor=response.odata_next_link,  # pyright: ignore
@@ -325,21 +663,402 @@ class TeamsClient:
             )
             if response.value is not None:  # pyright: ignore
                 for message in response.value:  # pyright: ignore
+                    if message_filter is not None and not message_filter.matches(
+                        message
+                    ):
+                        continue
                     result.items.append(
-                        TeamsMessage(
-                            message_id=message.id,  # pyright: ignore
-                            content=message.body.content,  # pyright: ignore
-                            thread_id=message.id,  # pyright: ignore
-                        )
+                        TeamsClient._to_teams_message(message, message.id, renderer)
                     )
+                await self._index_messages(response.value)  # pyright: ignore
 
             return result
         except Exception as e:
             LOGGER.error(f"Error reading thread: {str(e)}")
             raise
 
+    @instrumented("client")
+    async def read_threads_with_replies(
+        self,
+        limit: int = 50,
+        cursor: str | None = None,
+        replies_limit: int = 50,
+        renderer: ContentRenderer | None = None,
+        message_filter: MessageFilter | None = None,
+    ) -> PagedTeamsThreads:
+        """Read a page of threads together with their replies.
+
+        Replies are requested inline with ``$expand=replies``. Threads whose
+        expanded replies are incomplete are fetched again through Graph JSON
+        ``$batch`` requests, up to 20 threads per batch, so a whole page costs a
+        handful of round trips instead of one request per thread.
+
+        Args:
+            limit: The pagination page size
+            cursor: The pagination cursor
+            replies_limit: Maximum number of replies returned per thread
+            renderer: Content renderer, defaults to the client settings
+            message_filter: Criteria the root message of threads must match
+
+        Returns:
+            Paged channel threads including their replies
+        """
+        renderer = renderer or self.create_renderer()
+        try:
+            response = await self._get_threads_page(limit, cursor, expand=["replies"])
+
+            result = PagedTeamsThreads(
+                cursor=None,
+                limit=limit,
+                total=0,
+                items=[],
+            )
+            if response is None:
+                return result
+            result.cursor = response.odata_next_link
+            await self._index_messages(response.value or [])
+
+            incomplete: list[TeamsThreadWithReplies] = []
+            for message in response.value or []:
+                if message_filter is not None and not message_filter.matches(message):
+                    continue
+                replies = message.replies or []
+                thread = TeamsClient._to_teams_thread(message, replies_limit, renderer)
+                additional_data = message.additional_data or {}
+                if (
+                    additional_data.get("replies@odata.nextLink")
+                    and len(replies) < replies_limit
+                ):
+                    incomplete.append(thread)
+                result.items.append(thread)
+
+            for start in range(0, len(incomplete), GRAPH_BATCH_SIZE):
+                await self._batch_read_replies(
+                    incomplete[start : start + GRAPH_BATCH_SIZE],
+                    replies_limit,
+                    renderer,
+                )
+
+            result.total = (
+                response.odata_count
+                if response.odata_count is not None
+                else len(result.items)
+            )
+            return result
+        except Exception as e:
+            LOGGER.error(f"Error reading threads with replies: {str(e)}")
+            raise
+
+    async def _batch_read_replies(
+        self,
+        threads: list[TeamsThreadWithReplies],
+        replies_limit: int,
+        renderer: ContentRenderer | None = None,
+    ):
+        from msgraph.generated.models.chat_message_collection_response import (
+            ChatMessageCollectionResponse,
+        )
+        from msgraph.generated.teams.item.channels.item.messages.item.replies.replies_request_builder import (
+            RepliesRequestBuilder,
+        )
+        from msgraph_core.requests.batch_request_content import BatchRequestContent
+        from msgraph_core.requests.batch_request_item import BatchRequestItem
+        from msgraph_core.requests.batch_response_content import BatchResponseContent
+
+        params = RepliesRequestBuilder.RepliesRequestBuilderGetQueryParameters(
+            top=replies_limit
+        )
+        request = RequestConfiguration(query_parameters=params)
+        items: dict[str, TeamsThreadWithReplies] = {}
+        batch_items: dict[str, BatchRequestItem] = {}
+        for thread in threads:
+            request_information = (
+                self._messages_request_builder()
+                .by_chat_message_id(thread.thread_id)
+                .replies.to_get_request_information(request_configuration=request)
+            )
+            item = BatchRequestItem(request_information=request_information)
+            items[item.id] = thread
+            batch_items[item.id] = item
+
+        batch = BatchRequestContent(batch_items)  # pyright: ignore
+        response = await self.scheduler.run(
+            GRAPH, lambda: self.graph_client.batch.post(batch_request_content=batch)
+        )
+        # A single batch request is answered with a single batch response
+        if not isinstance(response, BatchResponseContent):
+            return
+        for request_id, thread in items.items():
+            # Keep the expanded replies for threads whose batch request failed
+            item = response.get_response_by_id(request_id)
+            if item is None or item.status is None or item.status >= 400:
+                status = item.status if item is not None else None
+                LOGGER.error(f"Error reading replies of {thread.thread_id}: {status}")
+                continue
+            try:
+                page = response.response_body(request_id, ChatMessageCollectionResponse)
+            except Exception as e:
+                LOGGER.error(f"Error reading replies of {thread.thread_id}: {str(e)}")
+                continue
+            if page is None:
+                continue
+            self._cache_replies_page(thread.thread_id, replies_limit, None, page)
+            await self._index_messages(page.value or [])
+            thread.replies = [
+                TeamsClient._to_teams_message(reply, reply.reply_to_id, renderer)
+                for reply in page.value or []
+            ]
+            thread.replies_cursor = page.odata_next_link
+
+    @instrumented("client")
+    async def sync_channel(
+        self,
+        since: datetime | None = None,
+        reset: bool = False,
+        renderer: ContentRenderer | None = None,
+        consumer: str = DEFAULT_SYNC_CONSUMER,
+    ) -> PagedTeamsThreads:
+        """Return threads and replies created or changed since the last sync.
+
+        Built on the channel messages delta query. The delta link returned by
+        Graph is persisted in the local store, so later calls, even after a
+        restart, only download what changed. Every consumer keeps its own delta
+        link, so callers syncing the same channel do not consume each other's
+        changes. Concurrent syncs of a consumer with the same arguments share a
+        single delta walk and its changes.
+
+        Args:
+            since: Lower bound for the initial sync when no watermark is stored
+            reset: Drop the stored watermark and run a full sync
+            renderer: Content renderer, defaults to the client settings
+            consumer: Name of the caller whose previous sync is continued
+
+        Returns:
+            Changed channel threads including their replies
+        """
+        if self.store is None:
+            raise ValueError("sync_channel requires a local store")
+
+        store = self.store
+        try:
+            messages = await self.single_flight.run(
+                self._key("sync", consumer, since, reset),
+                lambda: self._sync_delta(store, consumer, since, reset),
+            )
+            renderer = renderer or self.create_renderer()
+            items = [
+                TeamsClient._to_teams_thread(message, renderer=renderer)
+                for message in messages
+            ]
+            return PagedTeamsThreads(
+                cursor=None, limit=len(items), total=len(items), items=items
+            )
+        except Exception as e:
+            LOGGER.error(f"Error syncing channel: {str(e)}")
+            raise
+
+    async def _sync_delta(
+        self, store: TeamsStore, consumer: str, since: datetime | None, reset: bool
+    ) -> list["ChatMessage"]:
+        """Read the changes since the consumer's watermark and advance it."""
+        key = f"delta:{self.team_id}:{self.teams_channel_id}:{consumer}"
+        if reset:
+            await store.delete_watermark(key)
+        link = await store.get_watermark(key)
+        try:
+            messages, delta_link = await self._read_delta(link, since)
+        except APIError as e:
+            # Expired or invalid delta tokens answer 410 Gone, resync from scratch
+            if link is None or e.response_status_code != 410:
+                raise
+            LOGGER.info(f"Delta token expired for {key}, running a full sync")
+            await store.delete_watermark(key)
+            messages, delta_link = await self._read_delta(None, since)
+
+        self._refresh_cached_messages(messages)
+        await self._index_messages(messages)
+        if delta_link:
+            await store.set_watermark(key, delta_link)
+        return messages
+
+    async def _read_delta(
+        self, link: str | None, since: datetime | None
+    ) -> tuple[list["ChatMessage"], str | None]:
+        from msgraph.generated.teams.item.channels.item.messages.delta.delta_request_builder import (
+            DeltaRequestBuilder,
+        )
+
+        delta = self._messages_request_builder().delta
+        messages: list[ChatMessage] = []
+        while True:
+            if link is not None:
+                delta_page = delta.with_url(link)
+                response = await self.scheduler.run(GRAPH, delta_page.get)
+            else:
+                query = DeltaRequestBuilder.DeltaRequestBuilderGetQueryParameters(
+                    expand=["replies"]
+                )
+                query.filter = MessageFilter(since=since).delta_filter()
+                request = RequestConfiguration(query_parameters=query)
+                response = await self.scheduler.run(
+                    GRAPH, lambda: delta.get(request_configuration=request)
+                )
+            if response is None:
+                return messages, None
+            messages.extend(response.value or [])
+            if response.odata_next_link:
+                link = response.odata_next_link
+                continue
+            return messages, response.odata_delta_link
+
+    @instrumented("client")
+    async def stream_threads(
+        self,
+        page_size: int = 50,
+        max_items: int | None = None,
+        since: datetime | None = None,
+        prefetch: int = 1,
+        renderer: ContentRenderer | None = None,
+        message_filter: MessageFilter | None = None,
+    ) -> AsyncGenerator[MessageRecord, None]:
+        """Stream every thread in the configured channel.
+
+        The next Graph page is fetched while the current one is consumed, with at
+        most ``prefetch`` pages buffered. Threads are yielded as lean records,
+        meant to be serialized as they arrive. Graph lists the most recently
+        active threads first but does not document a strict order, so ``since``
+        filters every thread and the stream stops after the first page where
+        every thread is older.
+
+        Args:
+            page_size: Graph page size
+            max_items: Stop after yielding this many threads
+            since: Only yield threads modified at or after this timestamp
+            prefetch: Number of pages fetched ahead of the consumer
+            renderer: Content renderer, defaults to the client settings
+            message_filter: Criteria threads must match
+
+        Returns:
+            Async iterator over channel threads
+        """
+        renderer = renderer or self.create_renderer()
+        if since is None and message_filter is not None:
+            since = message_filter.since
+
+        async def fetch_page(cursor: str | None):
+            response = await self._get_threads_page(page_size, cursor)
+            if response is None:
+                return [], None
+            await self._index_messages(response.value or [])
+            return response.value or [], response.odata_next_link
+
+        if since is not None and since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        count = 0
+        pages = prefetch_pages(fetch_page, prefetch=prefetch)
+        try:
+            async for page in pages:
+                recent = False
+                for message in page:
+                    if since is not None:
+                        modified = (
+                            message.last_modified_date_time or message.created_date_time
+                        )
+                        if modified is None or modified < since:
+                            continue
+                    recent = True
+                    if message_filter is not None and not message_filter.matches(
+                        message
+                    ):
+                        continue
+                    yield TeamsClient._to_message_record(message, message.id, renderer)
+                    count += 1
+                    if max_items is not None and count >= max_items:
+                        return
+                if since is not None and not recent:
+                    return
+        except Exception as e:
+            LOGGER.error(f"Error streaming threads: {str(e)}")
+            raise
+        finally:
+            # Stop prefetching as soon as the stream ends
+            await pages.aclose()
+
+    def invalidate_reads(self, thread_id: str, message_id: str | None = None):
+        """Drop cached reply pages of a thread and, optionally, a cached message."""
+        self.read_cache.invalidate_prefix(*self._key("replies", thread_id))
+        if message_id is not None:
+            self.read_cache.invalidate(self._key("message", message_id))
+
+    def _cache_replies_page(
+        self,
+        thread_id: str,
+        limit: int,
+        cursor: str | None,
+        page: "ChatMessageCollectionResponse | None",
+    ):
+        self.read_cache.put(self._key("replies", thread_id, limit, cursor), page)
+        self._refresh_cached_messages(page.value if page is not None else None)
+
+    def _refresh_cached_messages(self, messages: list["ChatMessage"] | None):
+        """Replace cached messages with the newer copies returned by list reads."""
+        for message in messages or []:
+            key = self._key("message", message.id)
+            if key in self.read_cache:
+                self.read_cache.put(key, message)
+            self._refresh_cached_messages(message.replies)
+
+    async def _get_replies_page(
+        self, thread_id: str, limit: int, cursor: str | None
+    ) -> "ChatMessageCollectionResponse | None":
+        """Read a page of replies, served from the read cache when fresh.
+
+        Concurrent reads of a page share the same request.
+        """
+        key = self._key("replies", thread_id, limit, cursor)
+        entry = self.read_cache.get(key)
+        if entry is not None:
+            return entry.value
+        return await self.single_flight.run(
+            key, lambda: self._load_replies_page(thread_id, limit, cursor)
+        )
+
+    async def _load_replies_page(
+        self, thread_id: str, limit: int, cursor: str | None
+    ) -> "ChatMessageCollectionResponse | None":
+        page = await self._fetch_replies_page(thread_id, limit, cursor)
+        self._cache_replies_page(thread_id, limit, cursor, page)
+        if page is not None:
+            await self._index_messages(page.value or [])
+        return page
+
+    async def _fetch_replies_page(
+        self, thread_id: str, limit: int, cursor: str | None
+    ) -> "ChatMessageCollectionResponse | None":
+        from msgraph.generated.teams.item.channels.item.messages.item.replies.replies_request_builder import (
+            RepliesRequestBuilder,
+        )
+
+        params = RepliesRequestBuilder.RepliesRequestBuilderGetQueryParameters(
+            top=limit
+        )
+        request = RequestConfiguration(query_parameters=params)
+        replies = self._messages_request_builder().by_chat_message_id(thread_id).replies
+        if cursor is not None:
+            replies = replies.with_url(cursor)
+        return await self.scheduler.run(
+            GRAPH, lambda: replies.get(request_configuration=request)
+        )
+
+    @instrumented("client")
     async def read_thread_replies(
-        self, thread_id: str, limit: int = 50, cursor: str | None = None
+        self,
+        thread_id: str,
+        limit: int = 50,
+        cursor: str | None = None,
+        renderer: ContentRenderer | None = None,
+        message_filter: MessageFilter | None = None,
     ) -> PagedTeamsMessages:
         """Read all replies in a thread.
 
@@ -347,69 +1066,265 @@ class TeamsClient:
             thread_id: Thread ID to read
             cursor: The pagination cursor
             limit: The pagination page size
+            renderer: Content renderer, defaults to the client settings
+            message_filter: Criteria replies must match, applied to each page
 
         Returns:
             List of thread messages
         """
+        renderer = renderer or self.create_renderer()
         try:
-            params = RepliesRequestBuilder.RepliesRequestBuilderGetQueryParameters(
-                top=limit
+            replies = await self._get_replies_page(thread_id, limit, cursor)
+            return TeamsClient._to_replies_page(
+                replies, limit, renderer, message_filter
             )
-            request = RequestConfiguration(query_parameters=params)
-
-            if cursor is not None:
-                replies = (
-                    await self.graph_client.teams.by_team_id(self.team_id)
-                    .channels.by_channel_id(self.teams_channel_id)
-                    .messages.by_chat_message_id(thread_id)
-                    .replies.with_url(cursor)
-                    .get(request_configuration=request)
-                )
-            else:
-                replies = (
-                    await self.graph_client.teams.by_team_id(self.team_id)
-                    .channels.by_channel_id(self.teams_channel_id)
-                    .messages.by_chat_message_id(thread_id)
-                    .replies.get(request_configuration=request)
-                )
+        except Exception as e:
+            LOGGER.error(f"Error reading thread: {str(e)}")
+            raise
 
-            result = PagedTeamsMessages(
-                cursor=cursor,
-                limit=limit,
-                total=replies.odata_count,  # pyright: ignore
-                items=[],
-            )
+    @staticmethod
+    def _to_replies_page(
+        replies: "ChatMessageCollectionResponse | None",
+        limit: int,
+        renderer: ContentRenderer,
+        message_filter: MessageFilter | None = None,
+    ) -> PagedTeamsMessages:
+        result = PagedTeamsMessages(
+            cursor=None,
+            limit=limit,
+            total=0,
+            items=[],
+        )
 
-            if replies is not None and replies.value is not None:
+        if replies is not None:
+            result.cursor = replies.odata_next_link
+            if replies.value is not None:
                 for reply in replies.value:
+                    if message_filter is not None and not message_filter.matches(reply):
+                        continue
                     result.items.append(
-                        TeamsMessage(
-                            message_id=reply.id,  # pyright: ignore
-                            content=reply.body.content,  # pyright: ignore
-                            thread_id=reply.reply_to_id,  # pyright: ignore
+                        TeamsClient._to_teams_message(
+                            reply, reply.reply_to_id, renderer
                         )
                     )
+            result.total = (
+                replies.odata_count
+                if replies.odata_count is not None
+                else len(result.items)
+            )
+
+        return result
+
+    @instrumented("client")
+    async def read_threads_replies(
+        self,
+        thread_ids: list[str],
+        limit: int = 50,
+        renderer: ContentRenderer | None = None,
+        message_filter: MessageFilter | None = None,
+        concurrency: int = 8,
+    ) -> list[TeamsThreadReplies]:
+        """Read the first page of replies of many threads concurrently.
+
+        Up to ``concurrency`` threads are read at the same time, and the Graph
+        concurrency limit of the scheduler, shared with every other Graph
+        request of the server, still applies. A failed thread does not stop
+        the others. Pages are rendered once every read finished, in request
+        order, so the renderer response budget goes to the first threads.
+
+        Args:
+            thread_ids: Thread IDs to read
+            limit: The pagination page size of each thread
+            renderer: Content renderer, defaults to the client settings
+            message_filter: Criteria replies must match, applied to each page
+            concurrency: Maximum number of threads read at the same time
+
+        Returns:
+            One result per thread, in request order
+        """
+        renderer = renderer or self.create_renderer()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def read(
+            thread_id: str,
+        ) -> "ChatMessageCollectionResponse | Exception | None":
+            async with semaphore:
+                try:
+                    return await self._get_replies_page(thread_id, limit, None)
+                except Exception as e:
+                    LOGGER.error(f"Error reading thread {thread_id}: {str(e)}")
+                    return e
+
+        pages = await asyncio.gather(*[read(thread_id) for thread_id in thread_ids])
+        results = []
+        for thread_id, page in zip(thread_ids, pages):
+            if isinstance(page, Exception):
+                results.append(
+                    TeamsThreadReplies(
+                        thread_id=thread_id, replies=None, error=str(page)
+                    )
+                )
+                continue
+            replies = TeamsClient._to_replies_page(
+                page, limit, renderer, message_filter
+            )
+            results.append(
+                TeamsThreadReplies(thread_id=thread_id, replies=replies, error=None)
+            )
+        return results
+
+    @instrumented("client")
+    async def stream_thread_replies(
+        self,
+        thread_id: str,
+        page_size: int = 50,
+        max_items: int | None = None,
+        prefetch: int = 1,
+        renderer: ContentRenderer | None = None,
+        message_filter: MessageFilter | None = None,
+    ) -> AsyncGenerator[MessageRecord, None]:
+        """Stream every reply in a thread, as lean records.
+
+        Args:
+            thread_id: Thread ID to read
+            page_size: Graph page size
+            max_items: Stop after yielding this many replies
+            prefetch: Number of pages fetched ahead of the consumer
+            renderer: Content renderer, defaults to the client settings
+            message_filter: Criteria replies must match
+
+        Returns:
+            Async iterator over thread replies
+        """
+        renderer = renderer or self.create_renderer()
+
+        async def fetch_page(cursor: str | None):
+            response = await self._get_replies_page(thread_id, page_size, cursor)
+            if response is None:
+                return [], None
+            return response.value or [], response.odata_next_link
+
+        count = 0
+        pages = prefetch_pages(fetch_page, prefetch=prefetch)
+        try:
+            async for page in pages:
+                for reply in page:
+                    if message_filter is not None and not message_filter.matches(reply):
+                        continue
+                    yield TeamsClient._to_message_record(
+                        reply, reply.reply_to_id, renderer
+                    )
+                    count += 1
+                    if max_items is not None and count >= max_items:
+                        return
+        except Exception as e:
+            LOGGER.error(f"Error streaming thread replies: {str(e)}")
+            raise
+        finally:
+            # Stop prefetching as soon as the stream ends
+            await pages.aclose()
+
+    @instrumented("client")
+    async def search_messages(
+        self,
+        query: str,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+        renderer: ContentRenderer | None = None,
+    ) -> PagedTeamsSearchResults:
+        """Search channel messages in the local full-text index.
+
+        The index is fed by every thread and reply read through this client and
+        by ``sync_channel``, so searches never reach Graph.
 
+        Args:
+            query: Search terms, all of them must match
+            since: Only match messages created at or after this timestamp
+            until: Only match messages created before this timestamp
+            limit: The pagination page size
+            cursor: The pagination cursor
+            renderer: Content renderer, defaults to the client settings
+
+        Returns:
+            Paged matching messages, best matches first
+        """
+        if self.store is None:
+            raise ValueError("search_messages requires a local store")
+        renderer = renderer or self.create_renderer()
+
+        try:
+            offset = int(cursor) if cursor else 0
+            hits = await self.store.search_messages(
+                self.team_id,
+                self.teams_channel_id,
+                query,
+                since=since,
+                until=until,
+                limit=limit + 1,
+                offset=offset,
+            )
+            result = PagedTeamsSearchResults(
+                cursor=str(offset + limit) if len(hits) > limit else None,
+                limit=limit,
+                items=[],
+            )
+            for hit in hits[:limit]:
+                content, truncated = renderer.render(hit.content)
+                result.items.append(
+                    TeamsSearchResult(
+                        message_id=hit.message_id,
+                        thread_id=hit.thread_id,
+                        content=content,
+                        truncated=truncated,
+                        snippet=hit.snippet,
+                        created=hit.created_at,
+                    )
+                )
             return result
         except Exception as e:
-            LOGGER.error(f"Error reading thread: {str(e)}")
+            LOGGER.error(f"Error searching messages: {str(e)}")
             raise
 
-    async def read_message(self, message_id: str) -> ChatMessage | None:
+    @instrumented("client")
+    async def read_message(self, message_id: str) -> "ChatMessage | None":
+        """Read a single channel message, served from the read cache when fresh.
+
+        Cached messages are also refreshed by any thread or reply page read that
+        returns them. Concurrent reads of the same message share one request.
+        """
+        key = self._key("message", message_id)
+        entry = self.read_cache.get(key)
+        if entry is not None:
+            return entry.value
+
         try:
-            query = ChatMessageItemRequestBuilder.ChatMessageItemRequestBuilderGetQueryParameters()
-            request = RequestConfiguration(query_parameters=query)
-            response = (
-                await self.graph_client.teams.by_team_id(self.team_id)
-                .channels.by_channel_id(self.teams_channel_id)
-                .messages.by_chat_message_id(chat_message_id=message_id)
-                .get(request_configuration=request)
+            return await self.single_flight.run(
+                key, lambda: self._fetch_message(message_id)
             )
-            return response
         except Exception as e:
             LOGGER.error(f"Error reading thread: {str(e)}")
             raise
 
+    async def _fetch_message(self, message_id: str) -> "ChatMessage | None":
+        from msgraph.generated.teams.item.channels.item.messages.item.chat_message_item_request_builder import (
+            ChatMessageItemRequestBuilder,
+        )
+
+        query = ChatMessageItemRequestBuilder.ChatMessageItemRequestBuilderGetQueryParameters()
+        request = RequestConfiguration(query_parameters=query)
+        message = self._messages_request_builder().by_chat_message_id(
+            chat_message_id=message_id
+        )
+        response = await self.scheduler.run(
+            GRAPH, lambda: message.get(request_configuration=request)
+        )
+        if response is not None:
+            self.read_cache.put(self._key("message", message_id), response)
+        return response
+
+    @instrumented("client")
     async def list_members(self) -> list[TeamsMember]:
         """List all members in the configured team.
 
@@ -417,26 +1332,23 @@ class TeamsClient:
             List of team member details
         """
         try:
-            await self._initialize()
-            result = []
-
-            async def list_members_callback(context: TurnContext):
-                members = await TeamsInfo.get_team_members(context, self.team_id)
-                for member in members:
-                    result.append(TeamsMember(name=member.name, email=member.email))
-
-            await self.adapter.continue_conversation(
-                bot_app_id=self.teams_app_id,
-                reference=self._create_conversation_reference(),
-                callback=list_members_callback,
-            )
-            return result
+            members = await self.roster.members()
+            return [
+                TeamsMember(name=member.name, email=member.email) for member in members
+            ]
         except Exception as e:
             LOGGER.error(f"Error listing members: {str(e)}")
             raise
 
+    @instrumented("client")
     async def get_member_by_name(self, name: str) -> TeamsMember | None:
-        members = await self.list_members()
-        for member in members:
-            if member.name == name:
-                return member
+        member = await self.roster.get_by_name(name)
+        if member is not None:
+            return TeamsMember(name=member.name, email=member.email)
+
+    async def close(self):
+        if self.coalescer is not None:
+            await self.coalescer.close()
+        await self.edit_debouncer.close()
+        if self._owns_session:
+            await self.session.close()
@@ -0,0 +1,267 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+
+from .metrics import METRICS
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Endpoint classes sharing a rate limit and a concurrency cap
+GRAPH = "graph"
+CONNECTOR = "connector"
+
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+
+def get_status_code(error: BaseException) -> int | None:
+    """Extract the HTTP status code from Graph (kiota) or Bot Connector errors."""
+    status = getattr(error, "response_status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is None:
+        status = getattr(error, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def get_retry_after(error: BaseException) -> float | None:
+    """Read the Retry-After header, in seconds or as an HTTP date, from an error."""
+    headers = getattr(error, "response_headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    value = None
+    for key in headers:
+        if str(key).lower() == "retry-after":
+            value = headers[key]
+            break
+    if isinstance(value, list | tuple | set):
+        value = next(iter(value), None)
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Token bucket whose rate backs off when the server throttles.
+
+    A throttled response halves the rate and pauses the bucket for the server
+    provided delay, successes then recover the rate step by step.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = rate / 16
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    async def acquire(self):
+        if self.max_rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def throttled(self, delay: float):
+        if self.max_rate <= 0:
+            return
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def succeeded(self):
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class EndpointStats:
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failures = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.wait_count = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "failures": self.failures,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "average_wait_time": self.wait_time / self.wait_count
+            if self.wait_count
+            else 0.0,
+            "max_wait_time": self.max_wait_time,
+        }
+
+
+class RequestScheduler:
+    """Client side scheduler for outbound Graph and Bot Connector requests.
+
+    Each endpoint class gets a token bucket and a concurrency cap. Requests
+    failing with a throttling or transient status are retried, honouring the
+    Retry-After header when present and using jittered exponential backoff
+    otherwise, so bursts queue up locally instead of surfacing as errors.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[float, int]] | None = None,
+        max_retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+    ):
+        """
+        Args:
+            limits: Requests per second and concurrency cap per endpoint class,
+                a rate of zero disables rate limiting for that class
+            max_retries: Retries before giving up on a request
+            base_delay: Backoff delay of the first retry, in seconds
+            max_delay: Upper bound of backoff and Retry-After delays, in seconds
+        """
+        limits = limits or {GRAPH: (20.0, 8), CONNECTOR: (10.0, 8)}
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._buckets = {name: TokenBucket(rate) for name, (rate, _) in limits.items()}
+        self._semaphores = {
+            name: asyncio.Semaphore(max(1, concurrency))
+            for name, (_, concurrency) in limits.items()
+        }
+        self._stats = {name: EndpointStats() for name in limits}
+
+    def _ensure_endpoint(self, endpoint: str):
+        if endpoint not in self._buckets:
+            self._buckets[endpoint] = TokenBucket(0)
+            self._semaphores[endpoint] = asyncio.Semaphore(8)
+            self._stats[endpoint] = EndpointStats()
+
+    @asynccontextmanager
+    async def slot(self, endpoint: str):
+        """Wait for a rate limit token and a concurrency slot of an endpoint."""
+        self._ensure_endpoint(endpoint)
+        stats = self._stats[endpoint]
+        stats.queue_depth += 1
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+        start = time.monotonic()
+        acquired = False
+        try:
+            await self._semaphores[endpoint].acquire()
+            acquired = True
+            await self._buckets[endpoint].acquire()
+        except BaseException:
+            if acquired:
+                self._semaphores[endpoint].release()
+            raise
+        finally:
+            stats.queue_depth -= 1
+        waited = time.monotonic() - start
+        stats.wait_count += 1
+        stats.wait_time += waited
+        stats.max_wait_time = max(stats.max_wait_time, waited)
+        try:
+            yield
+        finally:
+            self._semaphores[endpoint].release()
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    async def run(self, endpoint: str, operation: Callable[[], Awaitable[T]]) -> T:
+        """Run an outbound request under the endpoint limits, retrying throttling.
+
+        Args:
+            endpoint: Endpoint class, GRAPH or CONNECTOR
+            operation: Coroutine factory issuing the request, called once per try
+
+        Returns:
+            The operation result
+        """
+        self._ensure_endpoint(endpoint)
+        stats = self._stats[endpoint]
+        attempt = 0
+        while True:
+            status = None
+            retry_after = None
+            async with self.slot(endpoint):
+                stats.requests += 1
+                start = time.perf_counter()
+                try:
+                    result = await operation()
+                    METRICS.observe("outbound", endpoint, time.perf_counter() - start)
+                    METRICS.count_request(endpoint, "success")
+                    self._buckets[endpoint].succeeded()
+                    return result
+                except Exception as e:
+                    status = get_status_code(e)
+                    METRICS.observe(
+                        "outbound", endpoint, time.perf_counter() - start, e
+                    )
+                    METRICS.count_request(endpoint, str(status or "error"))
+                    if status not in RETRYABLE_STATUS_CODES:
+                        raise
+                    if attempt >= self.max_retries:
+                        stats.failures += 1
+                        raise
+                    retry_after = get_retry_after(e)
+            delay = (
+                min(self.max_delay, retry_after)
+                if retry_after is not None
+                else self._backoff(attempt)
+            )
+            if status == 429 or retry_after is not None:
+                stats.throttled += 1
+                self._buckets[endpoint].throttled(delay)
+            stats.retries += 1
+            attempt += 1
+            LOGGER.info(
+                f"Retrying {endpoint} request after status {status} in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict[str, dict[str, float | int]]:
+        result = {}
+        for name, stats in self._stats.items():
+            result[name] = stats.as_dict()
+            result[name]["rate"] = self._buckets[name].rate
+        return result
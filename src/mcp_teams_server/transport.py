@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import logging
+
+import aiohttp
+import httpx
+from azure.core.credentials_async import AsyncTokenCredential
+from kiota_authentication_azure.azure_identity_authentication_provider import (
+    AzureIdentityAuthenticationProvider,
+)
+from kiota_http.middleware.options.retry_handler_option import RetryHandlerOption
+from msgraph.graph_request_adapter import GraphRequestAdapter
+from msgraph.graph_service_client import GraphServiceClient
+from msgraph_core import GraphClientFactory
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CountingTransport(httpx.AsyncHTTPTransport):
+    """HTTP transport counting the requests sent and those awaiting a response."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requests = 0
+        self.in_flight = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.in_flight += 1
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            # Failed and cancelled requests are no longer in flight either
+            self.in_flight -= 1
+
+
+class SharedTransport:
+    """HTTP connection pools shared by the Graph client and token acquisition.
+
+    Graph traffic goes through a single httpx client with a bounded, keep-alive
+    connection pool speaking HTTP/2, and Azure identity token requests reuse
+    one aiohttp session with DNS caching. Both are created lazily, inside the
+    running event loop, and closed together.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 100,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
+        dns_cache_ttl: int = 300,
+    ):
+        self.pool_size = pool_size
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.dns_cache_ttl = dns_cache_ttl
+        self._http_transport: CountingTransport | None = None
+        self._http_client: httpx.AsyncClient | None = None
+        self._session: aiohttp.ClientSession | None = None
+
+    def http_client(self) -> httpx.AsyncClient:
+        """Return the pooled httpx client used for Graph requests."""
+        if self._http_client is None:
+            self._http_transport = CountingTransport(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+            )
+            self._http_client = httpx.AsyncClient(
+                transport=self._http_transport,
+                timeout=httpx.Timeout(30.0, connect=10.0),
+            )
+        return self._http_client
+
+    def aiohttp_session(self) -> aiohttp.ClientSession:
+        """Return the aiohttp session used by Azure identity credentials."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_expiry,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def create_graph_client(
+        self,
+        credentials: AsyncTokenCredential,
+        scopes: list[str],
+        base_url: str | None = None,
+    ) -> GraphServiceClient:
+        """Build a GraphServiceClient whose requests use the shared pool.
+
+        Args:
+            credentials: Credentials requesting Graph tokens
+            scopes: Graph scopes requested
+            base_url: Graph endpoint, the global v1.0 endpoint by default
+        """
+        auth_provider = AzureIdentityAuthenticationProvider(credentials, scopes=scopes)
+        # Throttled and failed requests are retried by the request scheduler, the
+        # default retry middleware would hide them and multiply the retries
+        retries = RetryHandlerOption(max_retries=0, should_retry=False)
+        http_client = GraphClientFactory.create_with_default_middleware(
+            client=self.http_client(), options={retries.get_key(): retries}
+        )
+        request_adapter = GraphRequestAdapter(auth_provider, client=http_client)
+        if base_url is not None:
+            request_adapter.base_url = base_url.rstrip("/")
+        return GraphServiceClient(request_adapter=request_adapter)
+
+    def stats(self) -> dict[str, dict[str, int | float]]:
+        graph: dict[str, int | float] = {
+            "max_connections": self.pool_size,
+            "requests": self._http_transport.requests if self._http_transport else 0,
+            "in_flight": self._http_transport.in_flight if self._http_transport else 0,
+        }
+        # httpcore keeps the pool behind a private attribute, report it if present
+        pool = getattr(self._http_transport, "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is not None:
+            idle = sum(1 for connection in connections if connection.is_idle())
+            graph["connections"] = len(connections)
+            graph["idle_connections"] = idle
+            graph["utilisation"] = (len(connections) - idle) / self.pool_size
+        identity: dict[str, int | float] = {"max_connections": self.pool_size}
+        connector = self._session.connector if self._session is not None else None
+        if connector is not None:
+            acquired = getattr(connector, "_acquired", None)
+            if acquired is not None:
+                identity["connections"] = len(acquired)
+        return {"graph": graph, "identity": identity}
+
+    async def close(self):
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._http_transport = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
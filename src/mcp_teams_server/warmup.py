@@ -0,0 +1,250 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import base64
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from azure.core.credentials_async import AsyncTokenCredential
+
+    from .connector import ConnectorSession
+    from .teams import TeamsClient
+
+LOGGER = logging.getLogger(__name__)
+
+GRAPH_TOKEN = "graph_token"
+BOT_TOKEN = "bot_token"
+SERVICE_URL = "service_url"
+ROSTER = "roster"
+
+STARTING = "starting"
+READY = "ready"
+DEGRADED = "degraded"
+
+
+class Readiness:
+    """Startup readiness of the server, tracked as one check per warm-up step."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.state = STARTING
+        self.checks: dict[str, dict[str, Any]] = {}
+        self.started_at = time.time()
+        self.ready_at: float | None = None
+
+    def record(
+        self, name: str, seconds: float, error: BaseException | str | None = None
+    ):
+        self.checks[name] = {
+            "ok": error is None,
+            "seconds": seconds,
+            "error": str(error) if error is not None else None,
+            "checked_at": time.time(),
+        }
+        if self.state != STARTING:
+            self._update_state()
+
+    def finish(self):
+        self._update_state()
+        if self.ready_at is None:
+            self.ready_at = time.time()
+
+    def _update_state(self):
+        failed = any(not check["ok"] for check in self.checks.values())
+        self.state = DEGRADED if failed else READY
+
+    @property
+    def ready(self) -> bool:
+        return self.state == READY
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "startup_seconds": self.ready_at - self.started_at
+            if self.ready_at is not None
+            else None,
+            "checks": self.checks,
+        }
+
+
+READINESS = Readiness()
+
+
+def get_token_expiry(token: str) -> float | None:
+    """Read the expiry, as a UNIX timestamp, of a JWT access token."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        expiry = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (IndexError, ValueError):
+        return None
+    return float(expiry) if isinstance(expiry, int | float) else None
+
+
+class TokenStats:
+    def __init__(self):
+        self.refreshes = 0
+        self.failures = 0
+        self.expires_on: float | None = None
+
+    def as_dict(self) -> dict[str, float | int]:
+        result: dict[str, float | int] = {
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+        }
+        if self.expires_on is not None:
+            result["expires_in"] = max(0.0, self.expires_on - time.time())
+        return result
+
+
+class TokenWarmer:
+    """Acquire Graph and Bot Connector tokens ahead of the first request.
+
+    The warm-up resolves the Bot Connector service url, fetches both access
+    tokens and optionally loads the member roster of the default channel, so
+    the first tool call does not pay for them. Tokens are then refreshed in the
+    background shortly before they expire.
+    """
+
+    def __init__(
+        self,
+        credentials: "AsyncTokenCredential",
+        scopes: list[str],
+        session: "ConnectorSession",
+        refresh_margin: float = 240.0,
+        retry_interval: float = 30.0,
+        readiness: Readiness = READINESS,
+    ):
+        """
+        Args:
+            credentials: Credentials of the Graph client
+            scopes: Graph scopes requested by the Graph client
+            session: Connector session whose bot token is kept warm
+            refresh_margin: Seconds before expiry a token is renewed, it should
+                stay below the five minutes in which Azure identity and MSAL
+                stop serving a cached token
+            retry_interval: Seconds between attempts after a failed refresh
+            readiness: Readiness the warm-up steps are recorded in
+        """
+        self.credentials = credentials
+        self.scopes = scopes
+        self.session = session
+        self.refresh_margin = refresh_margin
+        self.retry_interval = retry_interval
+        self.readiness = readiness
+        self._stats = {GRAPH_TOKEN: TokenStats(), BOT_TOKEN: TokenStats()}
+        self._tasks: list[asyncio.Task] = []
+
+    async def _acquire_graph_token(self) -> float | None:
+        token = await self.credentials.get_token(*self.scopes)
+        return float(token.expires_on)
+
+    async def _acquire_bot_token(self) -> float | None:
+        # The session may have been rebound to another service url, always
+        # refresh the credentials of the current connector client
+        client = await self.session.get_client()
+        credentials = client.config.credentials
+        # MSAL token acquisition is blocking
+        token = await asyncio.to_thread(credentials.get_access_token)
+        return get_token_expiry(token)
+
+    async def _check(
+        self, name: str, operation: Callable[[], Awaitable[float | None]]
+    ) -> bool:
+        start = time.perf_counter()
+        try:
+            expires_on = await operation()
+        except Exception as e:
+            LOGGER.error(f"Error warming up {name}: {str(e)}")
+            self.readiness.record(name, time.perf_counter() - start, e)
+            return False
+        if name in self._stats:
+            self._stats[name].expires_on = expires_on
+        self.readiness.record(name, time.perf_counter() - start)
+        return True
+
+    async def _warm_connector(self, client: "TeamsClient", warm_roster: bool):
+        async def resolve_service_url() -> None:
+            await client.initialize()
+
+        async def load_roster() -> None:
+            await client.roster.members()
+
+        # The service url rebinds the connector session, resolve it first so
+        # the bot token is acquired by the client that is kept
+        await self._check(SERVICE_URL, resolve_service_url)
+        await self._check(BOT_TOKEN, self._acquire_bot_token)
+        if warm_roster:
+            await self._check(ROSTER, load_roster)
+
+    async def warm_up(
+        self, client: "TeamsClient", warm_roster: bool = False, timeout: float = 30.0
+    ):
+        """Run the warm-up steps and mark the server ready.
+
+        Failed or timed out steps leave the server degraded but running, the
+        work they skipped is done lazily on the first request instead.
+
+        Args:
+            client: Client of the default channel
+            warm_roster: Load the team member roster too
+            timeout: Upper bound of the whole warm-up, in seconds
+        """
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    self._check(GRAPH_TOKEN, self._acquire_graph_token),
+                    self._warm_connector(client, warm_roster),
+                ),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            LOGGER.error(f"Warm-up did not finish in {timeout}s")
+            self.readiness.record(
+                "warmup", time.perf_counter() - start, f"Timed out after {timeout}s"
+            )
+        self.readiness.finish()
+        LOGGER.info(
+            f"Warm-up finished in {time.perf_counter() - start:.2f}s "
+            f"with state {self.readiness.state}"
+        )
+
+    async def _refresh(self, name: str, acquire: Callable[[], Awaitable[float | None]]):
+        stats = self._stats[name]
+        while True:
+            if stats.expires_on is None:
+                delay = self.retry_interval
+            else:
+                delay = stats.expires_on - time.time() - self.refresh_margin
+            await asyncio.sleep(max(self.retry_interval / 10, delay))
+            if await self._check(name, acquire):
+                stats.refreshes += 1
+                LOGGER.debug(f"Refreshed {name}")
+            else:
+                stats.failures += 1
+                stats.expires_on = None
+
+    def start(self):
+        """Start refreshing both tokens in the background."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._refresh(GRAPH_TOKEN, self._acquire_graph_token)),
+            asyncio.create_task(self._refresh(BOT_TOKEN, self._acquire_bot_token)),
+        ]
+
+    def stats(self) -> dict[str, dict[str, float | int]]:
+        return {name: stats.as_dict() for name, stats in self._stats.items()}
+
+    async def close(self):
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from botbuilder.integration.aiohttp import (
+    CloudAdapter,
+    ConfigurationBotFrameworkAuthentication,
+)
+
+from mcp_teams_server.teams import TeamsClient
+from mcp_teams_server.transport import SharedTransport
+
+from .mock_botframework import (
+    AnonymousConfiguration,
+    StaticCredential,
+    create_app,
+    start,
+)
+
+MOCK_TEAM_ID = "team"
+MOCK_CHANNEL_ID = "19:channel@thread.tacv2"
+
+
+@pytest.fixture()
+def mock_options() -> dict[str, Any]:
+    """Arguments of the mock backend, overridden by tests needing another shape."""
+    return {"threads": 12, "replies": 7}
+
+
+# Async fixtures default to the session loop, the backend must serve on the test loop
+@pytest_asyncio.fixture(loop_scope="function")
+async def mock_backend(mock_options) -> AsyncIterator[tuple[web.Application, str]]:
+    app = create_app(**mock_options)
+    runner, url = await start(app)
+    try:
+        yield app, url
+    finally:
+        await runner.cleanup()
+
+
+@pytest_asyncio.fixture(loop_scope="function")
+async def mock_client_factory(
+    mock_backend,
+) -> AsyncIterator[Callable[..., TeamsClient]]:
+    """Build Teams clients talking to the mock backend over a shared transport."""
+    _, url = mock_backend
+    adapter = CloudAdapter(
+        ConfigurationBotFrameworkAuthentication(AnonymousConfiguration())
+    )
+    transport = SharedTransport(http2=False)
+    graph_client = transport.create_graph_client(
+        StaticCredential(),  # pyright: ignore
+        ["https://graph.microsoft.com/.default"],
+        base_url=f"{url}v1.0",
+    )
+    clients: list[TeamsClient] = []
+
+    def create_client(**kwargs: Any) -> TeamsClient:
+        client = TeamsClient(
+            adapter,
+            graph_client,
+            "",
+            MOCK_TEAM_ID,
+            MOCK_CHANNEL_ID,
+            service_url=url,
+            **kwargs,
+        )
+        clients.append(client)
+        return client
+
+    try:
+        yield create_client
+    finally:
+        for client in clients:
+            await client.close()
+        await transport.close()
+
+
+@pytest.fixture()
+def mock_client(mock_client_factory) -> TeamsClient:
+    return mock_client_factory()
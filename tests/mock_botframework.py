@@ -0,0 +1,388 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+"""Deterministic local stand-in for the Bot Framework connector and Graph APIs.
+
+The Bot Connector side answers message posts and team member lookups, the
+Graph side serves the channel messages, replies, delta and ``$batch``
+endpoints used by the server, under ``/v1.0``. Both share one in-memory
+channel, so messages posted through the connector show up in Graph reads.
+Every response can be delayed, and every n-th request throttled with a 429
+and a Retry-After header.
+"""
+
+import asyncio
+import itertools
+import json
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit
+
+from aiohttp import web
+from azure.core.credentials import AccessToken
+
+THREAD_MARKER = ";messageid="
+
+GRAPH_ROUTES = [
+    (
+        re.compile(r"^/teams/(?P<team>[^/]+)/channels/(?P<channel>[^/]+)/messages$"),
+        "messages",
+    ),
+    (
+        re.compile(
+            r"^/teams/(?P<team>[^/]+)/channels/(?P<channel>[^/]+)/messages/delta(?:\(\))?$"
+        ),
+        "delta",
+    ),
+    (
+        re.compile(
+            r"^/teams/(?P<team>[^/]+)/channels/(?P<channel>[^/]+)"
+            r"/messages/(?P<message>[^/]+)/replies$"
+        ),
+        "replies",
+    ),
+    (
+        re.compile(
+            r"^/teams/(?P<team>[^/]+)/channels/(?P<channel>[^/]+)"
+            r"/messages/(?P<message>[^/]+)$"
+        ),
+        "message",
+    ),
+]
+
+
+class AnonymousConfiguration:
+    """Bot Framework settings for the mock connector, which skips authentication."""
+
+    APP_ID = ""
+    APP_PASSWORD = ""
+    APP_TYPE = "MultiTenant"
+    APP_TENANTID = ""
+
+
+class StaticCredential:
+    """Hand out a fixed token, the mock Graph service does not check it."""
+
+    async def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        return AccessToken("mock-token", int(time.time()) + 3600)
+
+    async def close(self):
+        pass
+
+
+class MockChannel:
+    """In-memory channel of threads and replies with deterministic content.
+
+    Timestamps come from a logical clock, a minute apart for the seeded
+    messages and a second apart for later changes, so runs are reproducible.
+    Reply reads of the threads in ``failing`` answer with a server error.
+    """
+
+    def __init__(
+        self,
+        threads: int = 100,
+        replies: int = 20,
+        members: int = 10,
+        expanded_replies: int = 5,
+    ):
+        self.expanded_replies = expanded_replies
+        self.members = [
+            {
+                "id": f"29:member-{i}",
+                "name": f"Member {i}",
+                "email": f"member{i}@example.com",
+                "userPrincipalName": f"member{i}@example.com",
+            }
+            for i in range(members)
+        ]
+        self._clock = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        self._ids = itertools.count(1743086901347)
+        self.version = 0
+        self.threads: dict[str, dict[str, Any]] = {}
+        self.replies: dict[str, list[dict[str, Any]]] = {}
+        self._versions: dict[str, int] = {}
+        self.failing: set[str] = set()
+        for i in range(threads):
+            thread = self.post(None, f"Thread {i} about topic {i % 7}", step=60)
+            for j in range(replies):
+                self.post(thread["id"], f"Reply {j} to thread {i}", step=60)
+
+    def _tick(self, step: int) -> str:
+        self._clock += timedelta(seconds=step)
+        return self._clock.isoformat().replace("+00:00", "Z")
+
+    def post(self, thread_id: str | None, text: str, step: int = 1) -> dict[str, Any]:
+        """Add a thread, or a reply when a thread ID is given."""
+        timestamp = self._tick(step)
+        self.version += 1
+        message_id = str(next(self._ids))
+        member = self.members[self.version % len(self.members)] if self.members else {}
+        message = {
+            "id": message_id,
+            "replyToId": thread_id,
+            "etag": str(self.version),
+            "messageType": "message",
+            "createdDateTime": timestamp,
+            "lastModifiedDateTime": timestamp,
+            "deletedDateTime": None,
+            "importance": "normal",
+            "body": {"contentType": "html", "content": f"<p>{text}</p>"},
+            "from": {
+                "user": {
+                    "id": member.get("id"),
+                    "displayName": member.get("name"),
+                    "userIdentityType": "aadUser",
+                }
+            },
+            "mentions": [],
+        }
+        if thread_id is None or thread_id not in self.threads:
+            message["replyToId"] = None
+            self.threads[message_id] = message
+            self.replies[message_id] = []
+            self._versions[message_id] = self.version
+        else:
+            # Newest first, like Graph lists replies
+            self.replies[thread_id].insert(0, message)
+            self.threads[thread_id]["lastModifiedDateTime"] = timestamp
+            self._versions[thread_id] = self.version
+        return message
+
+    def edit(self, message_id: str, text: str) -> dict[str, Any] | None:
+        """Replace the content of a thread or reply, None when it does not exist."""
+        message = self.find(message_id)
+        if message is None:
+            return None
+        timestamp = self._tick(1)
+        self.version += 1
+        message["etag"] = str(self.version)
+        message["lastModifiedDateTime"] = timestamp
+        message["body"] = {"contentType": "html", "content": f"<p>{text}</p>"}
+        thread_id = message["replyToId"] or message_id
+        self.threads[thread_id]["lastModifiedDateTime"] = timestamp
+        self._versions[thread_id] = self.version
+        return message
+
+    def recent_threads(self, since_version: int = 0) -> list[dict[str, Any]]:
+        threads = [
+            thread
+            for thread_id, thread in self.threads.items()
+            if self._versions[thread_id] > since_version
+        ]
+        return sorted(
+            threads, key=lambda thread: thread["lastModifiedDateTime"], reverse=True
+        )
+
+    def find(self, message_id: str) -> dict[str, Any] | None:
+        if message_id in self.threads:
+            return self.threads[message_id]
+        for replies in self.replies.values():
+            for reply in replies:
+                if reply["id"] == message_id:
+                    return reply
+        return None
+
+
+class MockGraph:
+    """Graph endpoints over a mock channel, callable directly or through $batch."""
+
+    def __init__(self, channel: MockChannel, base_url: str):
+        self.channel = channel
+        self.base_url = base_url.rstrip("/")
+
+    def _link(self, path: str, query: dict[str, str]) -> str:
+        return f"{self.base_url}{path}?{urlencode(query)}"
+
+    def _page(
+        self, path: str, query: dict[str, str], items: list[Any]
+    ) -> dict[str, Any]:
+        top = int(query.get("$top") or 50)
+        offset = int(query.get("$skiptoken") or 0)
+        body: dict[str, Any] = {
+            "@odata.count": len(items),
+            "value": items[offset : offset + top],
+        }
+        if offset + top < len(items):
+            body["@odata.nextLink"] = self._link(
+                path, {**query, "$skiptoken": str(offset + top)}
+            )
+        return body
+
+    def _expand(self, thread: dict[str, Any], path: str) -> dict[str, Any]:
+        replies = self.channel.replies[thread["id"]]
+        expanded = dict(thread, replies=replies[: self.channel.expanded_replies])
+        if len(replies) > self.channel.expanded_replies:
+            expanded["replies@odata.nextLink"] = self._link(
+                f"{path}/{thread['id']}/replies",
+                {"$skiptoken": str(self.channel.expanded_replies)},
+            )
+        return expanded
+
+    def get(self, path: str, query: dict[str, str]) -> tuple[int, dict[str, Any]]:
+        for pattern, name in GRAPH_ROUTES:
+            match = pattern.match(path)
+            if match is not None:
+                break
+        else:
+            return 404, {"error": {"code": "NotFound", "message": path}}
+
+        if name == "messages":
+            threads = self.channel.recent_threads()
+            if "replies" in query.get("$expand", ""):
+                threads = [self._expand(thread, path) for thread in threads]
+            return 200, self._page(path, query, threads)
+        if name == "delta":
+            since = int(query.get("$deltatoken") or 0)
+            messages_path = path.rsplit("/", 1)[0]
+            threads = [
+                self._expand(thread, messages_path)
+                for thread in self.channel.recent_threads(since)
+            ]
+            body = self._page(path, query, threads)
+            if "@odata.nextLink" not in body:
+                body["@odata.deltaLink"] = self._link(
+                    path, {"$deltatoken": str(self.channel.version)}
+                )
+            return 200, body
+        if name == "replies":
+            if match["message"] in self.channel.failing:
+                return 500, {"error": {"code": "InternalServerError"}}
+            replies = self.channel.replies.get(match["message"])
+            if replies is None:
+                return 404, {"error": {"code": "NotFound"}}
+            return 200, self._page(path, query, replies)
+        message = self.channel.find(match["message"])
+        if message is None:
+            return 404, {"error": {"code": "NotFound"}}
+        return 200, message
+
+    def batch(self, body: dict[str, Any]) -> dict[str, Any]:
+        responses = []
+        for request in body.get("requests", []):
+            url = urlsplit(request["url"])
+            path = unquote(url.path)
+            if path.startswith("/v1.0"):
+                path = path[len("/v1.0") :]
+            status, response = self.get(path, dict(parse_qsl(url.query)))
+            responses.append(
+                {
+                    "id": request["id"],
+                    "status": status,
+                    "headers": {"Content-Type": "application/json"},
+                    "body": response,
+                }
+            )
+        return {"responses": responses}
+
+
+# Application keys of the seeded channel and the request counters
+CHANNEL = web.AppKey("channel", MockChannel)
+STATS = web.AppKey("stats", dict[str, int])
+
+
+def create_app(
+    latency: float = 0.0,
+    members: int = 10,
+    threads: int = 100,
+    replies: int = 20,
+    throttle_every: int = 0,
+    retry_after: int = 0,
+) -> web.Application:
+    """Build the mock connector and Graph application.
+
+    Args:
+        latency: Seconds added to every response
+        members: Number of fake team members returned by member endpoints
+        threads: Number of threads the channel is seeded with
+        replies: Number of replies seeded per thread
+        throttle_every: Answer every n-th request with 429, zero disables it
+        retry_after: Seconds sent in the Retry-After header of throttled requests
+    """
+    channel = MockChannel(threads=threads, replies=replies, members=members)
+    counter = itertools.count(1)
+    stats = {"requests": 0, "throttled": 0}
+
+    @web.middleware
+    async def delay_and_throttle(request: web.Request, handler):
+        stats["requests"] += 1
+        if latency > 0:
+            await asyncio.sleep(latency)
+        if throttle_every > 0 and next(counter) % throttle_every == 0:
+            stats["throttled"] += 1
+            return web.json_response(
+                {"error": {"code": "TooManyRequests"}},
+                status=429,
+                headers={"Retry-After": str(retry_after)},
+            )
+        return await handler(request)
+
+    def graph(request: web.Request) -> MockGraph:
+        return MockGraph(channel, f"{request.scheme}://{request.host}/v1.0")
+
+    async def send_to_conversation(request: web.Request) -> web.Response:
+        activity = json.loads(await request.read() or b"{}")
+        conversation_id = request.match_info["conversation_id"]
+        _, _, thread_id = conversation_id.partition(THREAD_MARKER)
+        message = channel.post(thread_id or None, activity.get("text") or "")
+        return web.json_response({"id": message["id"]})
+
+    async def update_activity(request: web.Request) -> web.Response:
+        activity = json.loads(await request.read() or b"{}")
+        activity_id = request.match_info["activity_id"]
+        if channel.edit(activity_id, activity.get("text") or "") is None:
+            return web.json_response({"error": {"code": "NotFound"}}, status=404)
+        return web.json_response({"id": activity_id})
+
+    async def get_paged_members(request: web.Request) -> web.Response:
+        return web.json_response(
+            {"members": channel.members, "continuationToken": None}
+        )
+
+    async def get_member(request: web.Request) -> web.Response:
+        member_id = request.match_info["member_id"]
+        for member in channel.members:
+            if member["id"] == member_id:
+                return web.json_response(member)
+        return web.json_response({"error": {"code": "NotFound"}}, status=404)
+
+    async def graph_get(request: web.Request) -> web.Response:
+        path = "/" + unquote(request.match_info["path"])
+        status, body = graph(request).get(path, dict(request.query))
+        return web.json_response(body, status=status)
+
+    async def graph_batch(request: web.Request) -> web.Response:
+        return web.json_response(graph(request).batch(await request.json()))
+
+    app = web.Application(middlewares=[delay_and_throttle])
+    app[CHANNEL] = channel
+    app[STATS] = stats
+    app.router.add_post(
+        "/v3/conversations/{conversation_id}/activities", send_to_conversation
+    )
+    app.router.add_put(
+        "/v3/conversations/{conversation_id}/activities/{activity_id}",
+        update_activity,
+    )
+    app.router.add_get(
+        "/v3/conversations/{conversation_id}/pagedmembers", get_paged_members
+    )
+    app.router.add_get(
+        "/v3/conversations/{conversation_id}/members/{member_id}", get_member
+    )
+    app.router.add_post("/v1.0/$batch", graph_batch)
+    app.router.add_get("/v1.0/{path:.*}", graph_get)
+    return app
+
+
+async def start(
+    app: web.Application, host: str = "127.0.0.1", port: int = 0
+) -> tuple[web.AppRunner, str]:
+    """Start the application and return its runner and base url."""
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    sockets = site._server.sockets  # pyright: ignore
+    bound_port = sockets[0].getsockname()[1]
+    return runner, f"http://{host}:{bound_port}/"
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from mcp_teams_server import cache
+from mcp_teams_server.cache import ReadCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_cache_should_serve_fresh_entries(clock):
+    read_cache = ReadCache(ttl=10)
+    read_cache.put(("message", "1"), "value")
+
+    entry = read_cache.get(("message", "1"))
+
+    assert entry is not None and entry.value == "value"
+    assert read_cache.get(("message", "2")) is None
+    assert read_cache.stats()["hits"] == 1
+    assert read_cache.stats()["misses"] == 1
+
+
+def test_cache_should_drop_expired_entries(clock):
+    read_cache = ReadCache(ttl=10)
+    read_cache.put(("message", "1"), "value")
+    clock[0] += 10
+
+    assert read_cache.get(("message", "1")) is None
+    assert ("message", "1") not in read_cache
+    assert read_cache.stats()["misses"] == 1
+
+
+def test_cache_should_evict_least_recently_used(clock):
+    read_cache = ReadCache(max_size=2, ttl=10)
+    read_cache.put("a", 1)
+    read_cache.put("b", 2)
+    read_cache.get("a")
+    read_cache.put("c", 3)
+
+    assert "a" in read_cache
+    assert "b" not in read_cache
+    assert read_cache.stats()["evictions"] == 1
+
+
+def test_cache_should_invalidate_by_prefix(clock):
+    read_cache = ReadCache(ttl=10)
+    read_cache.put(("replies", "thread-1", 50, None), "first")
+    read_cache.put(("replies", "thread-1", 50, "cursor"), "second")
+    read_cache.put(("replies", "thread-2", 50, None), "other")
+
+    read_cache.invalidate_prefix("replies", "thread-1")
+
+    assert ("replies", "thread-2", 50, None) in read_cache
+    assert read_cache.stats()["entries"] == 1
+    assert read_cache.stats()["invalidations"] == 2
+
+
+def test_cache_should_be_disabled_with_zero_size(clock):
+    read_cache = ReadCache(max_size=0)
+    read_cache.put("a", 1)
+
+    assert not read_cache.enabled
+    assert read_cache.get("a") is None
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+
+import pytest
+
+from mcp_teams_server.coalescing import EditDebouncer, UpdateCoalescer
+
+
+def _sender(sent: list):
+    async def send(thread_id, content, member_name):
+        sent.append((thread_id, content, member_name))
+        return f"message-{len(sent)}"
+
+    return send
+
+
+@pytest.mark.asyncio
+async def test_coalescer_should_merge_updates_within_window():
+    sent = []
+    coalescer = UpdateCoalescer(_sender(sent), window=0.05)
+
+    results = await asyncio.gather(
+        coalescer.submit("1", "step 1"),
+        coalescer.submit("1", "step 2"),
+        coalescer.submit("2", "other"),
+        coalescer.submit("1", "step 3"),
+    )
+
+    assert sorted(sent) == [
+        ("1", "step 1\n\nstep 2\n\nstep 3", None),
+        ("2", "other", None),
+    ]
+    assert results[0] == results[1] == results[3]
+    assert results[2] != results[0]
+    assert coalescer.stats() == {
+        "updates": 4,
+        "messages": 2,
+        "early_flushes": 0,
+        "pending": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_coalescer_should_split_batches_at_size_caps_in_order():
+    sent = []
+    coalescer = UpdateCoalescer(_sender(sent), window=0.05, max_messages=2, max_chars=8)
+
+    await asyncio.gather(
+        coalescer.submit("1", "a"),
+        coalescer.submit("1", "b"),
+        coalescer.submit("1", "c"),
+        coalescer.submit("1", "long line"),
+        coalescer.submit("1", "d", member_name="Bob"),
+    )
+
+    assert sent == [
+        ("1", "a\n\nb", None),
+        ("1", "c", None),
+        ("1", "long line", None),
+        ("1", "d", "Bob"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coalescer_should_share_errors_and_flush_on_close():
+    sent = []
+
+    async def fail(thread_id, content, member_name):
+        raise RuntimeError("throttled")
+
+    failing = UpdateCoalescer(fail, window=0.01)
+    results = await asyncio.gather(
+        failing.submit("1", "a"), failing.submit("1", "b"), return_exceptions=True
+    )
+    assert [str(result) for result in results] == ["throttled", "throttled"]
+
+    coalescer = UpdateCoalescer(_sender(sent), window=60)
+    update = asyncio.ensure_future(coalescer.submit("1", "last words"))
+    await asyncio.sleep(0)
+    await coalescer.close()
+
+    assert await update == "message-1"
+    assert sent == [("1", "last words", None)]
+
+
+@pytest.mark.asyncio
+async def test_debouncer_should_send_latest_edit_only():
+    sent = []
+    debouncer = EditDebouncer(_sender(sent), window=0.05)
+
+    results = await asyncio.gather(
+        debouncer.submit("1", "10%"),
+        debouncer.submit("1", "50%"),
+        debouncer.submit("2", "other"),
+        debouncer.submit("1", "90%", member_name="Bob"),
+    )
+    await debouncer.submit("1", "100%")
+
+    assert sorted(sent[:2]) == [("1", "90%", "Bob"), ("2", "other", None)]
+    assert sent[2] == ("1", "100%", None)
+    assert results[0] == results[1] == results[3]
+    assert debouncer.stats()["superseded"] == 2
+
+
+@pytest.mark.asyncio
+async def test_debouncer_should_send_first_edit_at_once():
+    sent = []
+    debouncer = EditDebouncer(_sender(sent), window=10)
+
+    first = await asyncio.wait_for(debouncer.submit("1", "10%"), timeout=1)
+    held = asyncio.ensure_future(debouncer.submit("1", "50%"))
+    await asyncio.sleep(0.05)
+    assert sent == [("1", "10%", None)]
+    await debouncer.close()
+
+    assert first == "message-1"
+    assert await held == "message-2"
+    assert sent == [("1", "10%", None), ("1", "50%", None)]
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mcp_teams_server.delivery import DeliveryQueue
+from mcp_teams_server.pool import TeamsClientPool
+from mcp_teams_server.store import Delivery, TeamsStore
+
+
+class FakeClient:
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.sent: list[tuple[str | None, str]] = []
+
+    async def start_thread(self, title, content, member_name=None):
+        self.sent.append((None, content))
+        return SimpleNamespace(thread_id=f"thread-{len(self.sent)}")
+
+    async def update_thread(self, thread_id, content, member_name=None):
+        if self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError("throttled")
+        # Let other workers run between replies
+        await asyncio.sleep(0.01)
+        self.sent.append((thread_id, content))
+        return SimpleNamespace(thread_id=thread_id, message_id=f"m-{content}")
+
+
+def _pool(client: FakeClient) -> MagicMock:
+    pool = MagicMock(spec=TeamsClientPool)
+    pool.get = AsyncMock(return_value=client)
+    return pool
+
+
+@pytest.fixture()
+def store(tmp_path):
+    store = TeamsStore(str(tmp_path / "store.db"))
+    yield store
+    store.close()
+
+
+async def _wait_for(queue: DeliveryQueue, delivery_id: str, status: str) -> Delivery:
+    for _ in range(200):
+        delivery = await queue.get(delivery_id)
+        if delivery is not None and delivery.status == status:
+            return delivery
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Delivery {delivery_id} is not {status}")
+
+
+@pytest.mark.asyncio
+async def test_queue_should_send_replies_in_order(store):
+    client = FakeClient()
+    pool = _pool(client)
+    queue = DeliveryQueue(store, pool, workers=4, poll_interval=0.05)
+    queue.start()
+    try:
+        deliveries = [
+            await queue.enqueue("team", "channel", "1", None, str(index))
+            for index in range(5)
+        ]
+        thread = await queue.enqueue("team", "channel", None, "Title", "new")
+        for delivery in deliveries:
+            await _wait_for(queue, delivery.delivery_id, "delivered")
+        delivered = await _wait_for(queue, thread.delivery_id, "delivered")
+        first = await _wait_for(queue, deliveries[0].delivery_id, "delivered")
+    finally:
+        await queue.close()
+
+    replies = [content for thread_id, content in client.sent if thread_id == "1"]
+    assert replies == ["0", "1", "2", "3", "4"]
+    assert delivered.thread_id == delivered.message_id
+    assert first.message_id == "m-0"
+    assert {call.args[0] for call in pool.get.await_args_list} == {"team/channel"}
+    assert queue.stats()["delivered"] == 6
+
+
+@pytest.mark.asyncio
+async def test_queue_should_retry_then_fail(store):
+    client = FakeClient(failures=10)
+    queue = DeliveryQueue(
+        store, _pool(client), max_attempts=3, retry_delay=0.01, poll_interval=0.01
+    )
+    queue.start()
+    try:
+        delivery = await queue.enqueue("team", "channel", "1", None, "progress")
+        failed = await _wait_for(queue, delivery.delivery_id, "failed")
+    finally:
+        await queue.close()
+
+    assert failed.attempts == 3
+    assert failed.error == "throttled"
+    assert queue.stats()["retried"] == 2
+    assert queue.stats()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_should_send_deliveries_spooled_before_start(store):
+    client = FakeClient()
+    spooled = DeliveryQueue(store, _pool(client))
+    delivery = await spooled.enqueue("team", "channel", "1", None, "kept")
+
+    queue = DeliveryQueue(store, _pool(client), poll_interval=0.01)
+    queue.start()
+    try:
+        await _wait_for(queue, delivery.delivery_id, "delivered")
+    finally:
+        await queue.close()
+
+    assert client.sent == [("1", "kept")]
@@ -0,0 +1,170 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from botbuilder.integration.aiohttp import CloudAdapter
+from botbuilder.schema import Activity, ChannelAccount, ConversationAccount
+
+from mcp_teams_server.events import (
+    EventBuffer,
+    EventReceiver,
+    activity_to_event,
+    notification_to_event,
+)
+from mcp_teams_server.models import TeamsEvent
+
+CHANNEL_ID = "19:channel@thread.tacv2"
+
+
+def _event(channel_id=CHANNEL_ID, message_id="1") -> TeamsEvent:
+    return TeamsEvent(
+        event_id="",
+        source="activity",
+        change_type="created",
+        channel_id=channel_id,
+        thread_id="1",
+        message_id=message_id,
+        received="2025-03-01T00:00:00+00:00",
+    )
+
+
+def _notification(client_state="secret", reply="1743086950000"):
+    return {
+        "clientState": client_state,
+        "changeType": "created",
+        "resource": f"teams('team')/channels('{CHANNEL_ID}')"
+        f"/messages('1743086901347')/replies('{reply}')",
+    }
+
+
+def test_activity_to_event():
+    activity = Activity(
+        type="message",
+        id="1743086950000",
+        text="Hello <at>Bot</at>",
+        conversation=ConversationAccount(id=f"{CHANNEL_ID};messageid=1743086901347"),
+        channel_data={"team": {"id": "team"}, "channel": {"id": CHANNEL_ID}},
+        from_property=ChannelAccount(name="Jane Doe"),
+    )
+
+    event = activity_to_event(activity)
+
+    assert event is not None
+    assert event.change_type == "created"
+    assert event.channel_id == CHANNEL_ID
+    assert event.thread_id == "1743086901347"
+    assert event.message_id == "1743086950000"
+    assert event.sender == "Jane Doe"
+
+
+def test_activity_to_event_should_skip_other_activities():
+    activity = Activity(type="conversationUpdate")
+
+    assert activity_to_event(activity) is None
+
+
+def test_notification_to_event():
+    event = notification_to_event(_notification())
+
+    assert event is not None
+    assert event.source == "notification"
+    assert event.channel_id == CHANNEL_ID
+    assert event.thread_id == "1743086901347"
+    assert event.message_id == "1743086950000"
+    assert event.content is None
+
+
+@pytest.mark.asyncio
+async def test_buffer_should_return_events_after_cursor():
+    buffer = EventBuffer()
+    for message_id in ("1", "2", "3"):
+        await buffer.publish(_event(message_id=message_id))
+
+    result = await buffer.wait("1", timeout=0)
+
+    assert [event.message_id for event in result.items] == ["2", "3"]
+    assert result.cursor == "3"
+    assert not result.missed
+
+
+@pytest.mark.asyncio
+async def test_buffer_should_wake_up_waiting_readers():
+    buffer = EventBuffer()
+    readers = [asyncio.create_task(buffer.wait(timeout=5)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+
+    await buffer.publish(_event())
+    results = await asyncio.gather(*readers)
+
+    assert all(len(result.items) == 1 for result in results)
+    assert buffer.stats()["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_buffer_should_time_out_without_events():
+    buffer = EventBuffer()
+
+    result = await buffer.wait(timeout=0.01)
+
+    assert result.items == []
+    assert result.cursor == "0"
+
+
+@pytest.mark.asyncio
+async def test_buffer_should_filter_limit_and_report_missed_events():
+    buffer = EventBuffer(max_size=3)
+    for message_id in ("1", "2", "3", "4"):
+        await buffer.publish(_event(message_id=message_id))
+    await buffer.publish(_event(channel_id="other", message_id="5"))
+
+    result = await buffer.wait("0", timeout=0, limit=1, channel_id=CHANNEL_ID)
+
+    assert [event.message_id for event in result.items] == ["3"]
+    assert result.cursor == "3"
+    assert result.missed
+    assert buffer.stats()["dropped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_receiver_should_reject_invalid_client_state():
+    receiver = EventReceiver()
+    receiver.start(MagicMock(spec=CloudAdapter), client_state="secret")
+
+    published = await receiver.process_notifications(
+        {"value": [_notification(), _notification(client_state="forged")]}
+    )
+
+    assert published == 1
+    assert receiver.stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_receiver_should_publish_unverified_activities():
+    receiver = EventReceiver()
+    receiver.start(MagicMock(spec=CloudAdapter), verify_activities=False)
+
+    await receiver.process_activity(
+        {
+            "type": "message",
+            "id": "1743086950000",
+            "text": "Hello",
+            "conversation": {"id": f"{CHANNEL_ID};messageid=1743086901347"},
+            "channelData": {"channel": {"id": CHANNEL_ID}},
+            "from": {"id": "29:user", "name": "Jane Doe"},
+        },
+        "",
+    )
+    result = await receiver.buffer.wait("0", timeout=0)
+
+    assert [event.content for event in result.items] == ["Hello"]
+
+
+def test_receiver_should_be_enabled_until_stopped():
+    receiver = EventReceiver()
+
+    receiver.start(MagicMock(spec=CloudAdapter))
+    assert receiver.enabled
+    receiver.stop()
+    assert not receiver.enabled
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+from datetime import datetime, timezone
+
+import pytest
+from msgraph.generated.models.chat_message import ChatMessage
+from msgraph.generated.models.chat_message_from_identity_set import (
+    ChatMessageFromIdentitySet,
+)
+from msgraph.generated.models.chat_message_importance import ChatMessageImportance
+from msgraph.generated.models.chat_message_mention import ChatMessageMention
+from msgraph.generated.models.identity import Identity
+
+from mcp_teams_server.filters import MessageFilter, get_message_fields
+
+
+def _message(
+    name="Jane Doe",
+    user_id="user-1",
+    modified=datetime(2025, 3, 1, tzinfo=timezone.utc),
+    mentions=(),
+    importance="normal",
+) -> ChatMessage:
+    return ChatMessage(
+        from_=ChatMessageFromIdentitySet(user=Identity(display_name=name, id=user_id)),
+        created_date_time=modified,
+        last_modified_date_time=modified,
+        mentions=[ChatMessageMention(mention_text=text) for text in mentions],
+        importance=ChatMessageImportance(importance),
+    )
+
+
+def test_empty_filter_matches_everything():
+    message_filter = MessageFilter()
+
+    assert message_filter.empty
+    assert message_filter.matches(_message())
+
+
+def test_filter_by_since():
+    message_filter = MessageFilter(since=datetime(2025, 2, 1))
+
+    assert message_filter.matches(_message())
+    assert not message_filter.matches(
+        _message(modified=datetime(2025, 1, 1, tzinfo=timezone.utc))
+    )
+    expected = "lastModifiedDateTime gt 2025-02-01T00:00:00Z"
+    assert message_filter.delta_filter() == expected
+
+
+def test_filter_by_sender_name_or_id():
+    assert MessageFilter(sender="jane doe").matches(_message())
+    assert MessageFilter(sender="USER-1").matches(_message())
+    assert not MessageFilter(sender="John").matches(_message())
+
+
+def test_filter_by_mentions_and_importance():
+    mentioned = _message(mentions=["John"], importance="urgent")
+
+    assert MessageFilter(has_mention=True).matches(mentioned)
+    assert not MessageFilter(has_mention=False).matches(mentioned)
+    assert MessageFilter(importance="urgent").matches(mentioned)
+    assert not MessageFilter(importance="high").matches(mentioned)
+
+
+def test_invalid_importance():
+    with pytest.raises(ValueError):
+        MessageFilter(importance="critical")  # pyright: ignore
+
+
+def test_get_message_fields():
+    fields = get_message_fields(
+        _message(mentions=["John"]),
+        {"sender", "importance", "mentions"},
+    )
+
+    assert fields == {
+        "sender": "Jane Doe",
+        "importance": "normal",
+        "mentions": ["John"],
+    }
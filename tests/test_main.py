@@ -1,13 +1,17 @@
 # SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
 # SPDX-License-Identifier: Apache-2.0
 import os
+import subprocess
 import sys
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+from botbuilder.integration.aiohttp import CloudAdapter
+from starlette.testclient import TestClient
 
 import mcp_teams_server
 from mcp_teams_server import main
+from mcp_teams_server.events import RECEIVER
 
 
 def test_main_should_exit_error_on_missing_env_vars():
@@ -29,3 +33,59 @@ async def test_list_tools():
     tools = await mcp_teams_server.mcp.list_tools()
 
     assert tools is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "tool",
+    [
+        "wait_for_messages",
+        "get_delivery_status",
+        "edit_message",
+        "read_threads_replies",
+    ],
+)
+async def test_list_tools_should_include(tool):
+    tools = await mcp_teams_server.mcp.list_tools()
+
+    assert tool in [listed.name for listed in tools]
+
+
+@pytest.mark.asyncio
+async def test_list_resources_should_include_metrics():
+    resources = await mcp_teams_server.mcp.list_resources()
+
+    assert "metrics://teams" in [str(resource.uri) for resource in resources]
+
+
+@pytest.mark.asyncio
+async def test_list_resources_should_include_readiness():
+    resources = await mcp_teams_server.mcp.list_resources()
+
+    assert "readiness://teams" in [str(resource.uri) for resource in resources]
+
+
+def test_import_should_defer_heavy_dependencies():
+    code = (
+        "import sys, mcp_teams_server; "
+        "print(sorted(m for m in ('botbuilder', 'msgraph', 'azure.identity') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize("path", ["/api/messages", "/api/notifications"])
+@pytest.mark.parametrize("body", ["{not json", "[]"])
+def test_event_endpoints_should_reject_malformed_bodies(path, body):
+    RECEIVER.start(MagicMock(spec=CloudAdapter), verify_activities=False)
+    try:
+        with TestClient(mcp_teams_server.mcp.sse_app()) as client:
+            response = client.post(path, content=body)
+    finally:
+        RECEIVER.stop()
+
+    assert response.status_code == 400
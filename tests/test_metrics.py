@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from mcp_teams_server.metrics import METRICS, instrumented
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    METRICS.reset()
+    yield
+    METRICS.reset()
+
+
+@instrumented("client")
+async def _operation(fail: bool):
+    if fail:
+        raise ValueError("boom")
+    return "ok"
+
+
+@pytest.mark.asyncio
+async def test_instrumented_should_count_calls_and_errors():
+    await _operation(False)
+    with pytest.raises(ValueError):
+        await _operation(True)
+
+    operation = METRICS.snapshot()["operations"]["client"]["operation"]
+    assert operation["calls"] == 2
+    assert operation["errors"] == {"ValueError": 1}
+    assert operation["latency"]["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_instrumented_should_close_generators_closed_early():
+    closed = []
+
+    @instrumented("client", "items")
+    async def items():
+        try:
+            for item in range(10):
+                yield item
+        finally:
+            closed.append(True)
+
+    generator = items()
+    assert await anext(generator) == 0
+    await generator.aclose()
+
+    operation = METRICS.snapshot()["operations"]["client"]["items"]
+    assert closed == [True]
+    assert (operation["calls"], operation["errors"]) == (1, {})
+
+
+@pytest.mark.asyncio
+async def test_render_prometheus_should_expose_histograms_and_requests():
+    await _operation(False)
+    METRICS.count_request("graph", "429")
+
+    text = METRICS.render_prometheus()
+
+    assert 'mcp_teams_latency_seconds_count{kind="client",name="operation"} 1' in text
+    assert 'mcp_teams_requests_total{endpoint="graph",status="429"} 1' in text
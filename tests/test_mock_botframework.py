@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from mcp_teams_server.store import TeamsStore
+
+from .mock_botframework import CHANNEL, STATS
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mock_options", [{"threads": 3, "replies": 7}])
+async def test_mock_backend_should_serve_every_client_operation(
+    tmp_path, mock_backend, mock_client_factory
+):
+    app, _ = mock_backend
+    channel = app[CHANNEL]
+    thread_id = next(iter(channel.threads))
+    reply_id = channel.replies[thread_id][0]["id"]
+    store = TeamsStore(str(tmp_path / "store.db"))
+    client = mock_client_factory(store=store)
+    try:
+        members = await client.list_members()
+        member = await client.get_member_by_id(channel.members[0]["id"])
+        threads = await client.read_threads(10)
+        expanded = await client.read_threads_with_replies(10, replies_limit=10)
+        synced = await client.sync_channel()
+        replies = await client.read_thread_replies(thread_id, 10)
+        batched = await client.read_threads_replies(list(channel.threads), 10)
+        message = await client.read_message(reply_id)
+        thread = await client.start_thread("Smoke", "Smoke test thread")
+        reply = await client.update_thread(thread_id, "Smoke test reply")
+    finally:
+        store.close()
+
+    assert len(members) == len(channel.members)
+    assert member.email == channel.members[0]["email"]
+    assert threads.total == 3
+    assert len(expanded.items[0].replies) == 7
+    assert len(synced.items) == 3
+    assert replies.total == 7
+    assert [result.thread_id for result in batched] == list(channel.threads)[:3]
+    assert all(result.error is None for result in batched)
+    assert message is not None and message.id == reply_id
+    assert thread.thread_id in channel.threads
+    assert channel.replies[thread_id][0]["id"] == reply.message_id
+    assert app[STATS]["throttled"] == 0
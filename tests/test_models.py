@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import jsonschema
+
+from mcp_teams_server.models import PagedTeamsSearchResults, TeamsSearchResult
+
+
+def test_search_results_should_match_their_schema_without_created():
+    page = PagedTeamsSearchResults(
+        cursor=None,
+        limit=1,
+        items=[
+            TeamsSearchResult(
+                thread_id="t1", message_id="m1", content="Hello", snippet="<b>He</b>"
+            )
+        ],
+    )
+
+    data = page.model_dump()
+
+    assert "created" not in data["items"][0]
+    jsonschema.validate(data, PagedTeamsSearchResults.model_json_schema())
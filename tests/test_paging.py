@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from mcp_teams_server.paging import prefetch_pages
+
+
+def _fetcher(pages: list[list[int]], requested: list):
+    async def fetch_page(cursor: str | None):
+        index = int(cursor or 0)
+        requested.append(index)
+        next_cursor = str(index + 1) if index + 1 < len(pages) else None
+        return pages[index], next_cursor
+
+    return fetch_page
+
+
+@pytest.mark.asyncio
+async def test_prefetch_pages_should_follow_cursors():
+    requested = []
+    pages = [[1, 2], [3], [4, 5]]
+
+    result = [page async for page in prefetch_pages(_fetcher(pages, requested))]
+
+    assert result == pages
+    assert requested == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_pages_should_stop_fetching_when_closed():
+    requested = []
+    pages = [[i] for i in range(100)]
+
+    async for page in prefetch_pages(_fetcher(pages, requested), prefetch=2):
+        if page == [1]:
+            break
+
+    assert len(requested) < len(pages)
+
+
+@pytest.mark.asyncio
+async def test_prefetch_pages_should_raise_fetch_errors():
+    async def fetch_page(cursor: str | None):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        async for _ in prefetch_pages(fetch_page):
+            pass
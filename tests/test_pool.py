@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from mcp_teams_server.config import parse_channel
+from mcp_teams_server.pool import TeamsClientPool
+
+
+class FakeClient:
+    def __init__(self, team_id: str, channel_id: str):
+        self.team_id = team_id
+        self.teams_channel_id = channel_id
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def test_parse_channel_should_resolve_defaults():
+    assert parse_channel(None, "team", "channel") == ("team", "channel")
+    assert parse_channel("other", "team", "channel") == ("team", "other")
+    assert parse_channel("t2/c2", "team", "channel") == ("t2", "c2")
+    with pytest.raises(ValueError):
+        parse_channel("/c2", "team", "channel")
+
+
+@pytest.mark.asyncio
+async def test_pool_should_reuse_and_evict_clients():
+    created: list[FakeClient] = []
+
+    def factory(team_id: str, channel_id: str):
+        created.append(FakeClient(team_id, channel_id))
+        return created[-1]
+
+    pool = TeamsClientPool(factory, "team", "channel", max_size=2)  # pyright: ignore
+
+    default = await pool.get()
+    assert await pool.get("channel") is default
+    assert default is created[0]
+    await pool.get("a")
+    await pool.get("b")
+
+    assert pool.stats()["evictions"] == 1
+    assert created[0].closed
+    assert (await pool.get("a")).teams_channel_id == "a"
+    assert len(created) == 3
+
+
+@pytest.mark.asyncio
+async def test_pool_should_reject_channels_not_allowed():
+    pool = TeamsClientPool(
+        FakeClient,  # pyright: ignore
+        "team",
+        "channel",
+        allowed_channels={("team", "allowed")},
+    )
+
+    assert (await pool.get("allowed")).teams_channel_id == "allowed"
+    assert (await pool.get()).teams_channel_id == "channel"
+    with pytest.raises(ValueError):
+        await pool.get("other/forbidden")
@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import json
+
+from mcp_teams_server.models import PagedTeamsMessages
+from mcp_teams_server.records import MessageRecord, dump_messages_page
+
+
+def _records() -> list[MessageRecord]:
+    return [
+        MessageRecord("t1", "m1", "Hello"),
+        MessageRecord(
+            "t1",
+            "m2",
+            'Reply with "quotes" and ñ',
+            truncated=True,
+            sender="Ana",
+            created="2025-01-01T00:00:00Z",
+            importance="high",
+            mentions=["Luis"],
+        ),
+    ]
+
+
+def test_message_record_should_serialize_like_teams_message():
+    for record in _records():
+        model = record.to_model()
+
+        assert record.to_dict() == model.model_dump()
+        assert json.loads(record.to_json()) == json.loads(model.model_dump_json())
+
+
+def test_dump_messages_page_should_match_paged_teams_messages():
+    records = _records()
+
+    page = dump_messages_page([record.to_json() for record in records], limit=10)
+
+    expected = PagedTeamsMessages(
+        cursor=None,
+        limit=10,
+        total=2,
+        items=[record.to_model() for record in records],
+    )
+    assert json.loads(page) == expected.model_dump()
+
+
+def test_dump_messages_page_should_handle_empty_pages():
+    page = dump_messages_page([], limit=5, cursor="next")
+
+    assert json.loads(page) == {"cursor": "next", "limit": 5, "total": 0, "items": []}
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from mcp_teams_server.rendering import ContentRenderer, html_to_text, truncate
+
+MESSAGE = (
+    '<p>Hello <at id="0">Jane Doe</at>, see <a href="https://example.com">the doc'
+    "</a> &amp; <strong>this</strong></p><ul><li>one</li><li>two</li></ul>"
+    '<attachment id="1"></attachment><p>Second <emoji id="smile" alt="🙂"></emoji>'
+    "</p><pre>code\n  indented</pre><script>ignored()</script>"
+)
+
+
+def test_html_to_text():
+    assert html_to_text(MESSAGE) == (
+        "Hello @Jane Doe, see the doc & this\n\n- one\n- two\n[attachment]\n\n"
+        "Second 🙂\n\ncode\n  indented"
+    )
+
+
+def test_html_to_markdown():
+    markdown = html_to_text(MESSAGE, markdown=True)
+
+    assert "[the doc](https://example.com)" in markdown
+    assert "**this**" in markdown
+    assert "```\ncode\n  indented\n```" in markdown
+
+
+def test_plain_content_is_returned_as_is():
+    assert html_to_text("  plain text ") == "plain text"
+
+
+def test_truncate_on_word_boundary():
+    assert truncate("hello world this is long", 12) == ("hello world…", True)
+    assert truncate("short", 12) == ("short", False)
+    assert truncate("unbounded", 0) == ("unbounded", False)
+
+
+def test_summary_keeps_first_paragraph():
+    renderer = ContentRenderer("summary", max_chars=30)
+
+    assert renderer.render(MESSAGE) == ("Hello @Jane Doe, see the doc…", True)
+
+
+def test_raw_mode_keeps_html():
+    renderer = ContentRenderer("raw")
+
+    assert renderer.render(MESSAGE) == (MESSAGE, False)
+    assert renderer.render(None) == ("", False)
+
+
+def test_response_byte_budget():
+    renderer = ContentRenderer("text", max_bytes=10)
+
+    assert renderer.render("<p>ñandú ñandú</p>") == ("ñandú ñ", True)
+    assert renderer.exhausted
+    assert renderer.render("<p>more</p>") == ("", True)
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        ContentRenderer("html")  # pyright: ignore
+
+
+def test_invalid_fields():
+    with pytest.raises(ValueError):
+        ContentRenderer("raw", fields=["reactions"])
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+
+import pytest
+from botbuilder.schema.teams import TeamsChannelAccount
+
+from mcp_teams_server.roster import TeamsRoster
+
+
+def _loader(calls: list):
+    async def load():
+        calls.append(1)
+        return [
+            TeamsChannelAccount(id="1", name="Alice", email="Alice@example.com"),
+            TeamsChannelAccount(id="2", name="Bob", email="bob@example.com"),
+        ]
+
+    return load
+
+
+@pytest.mark.asyncio
+async def test_roster_should_index_members_and_count_hits():
+    calls = []
+    roster = TeamsRoster(_loader(calls), ttl=60)
+
+    bob = await roster.get_by_name("Bob")
+    alice = await roster.get_by_email("alice@example.com")
+    assert bob is not None and bob.id == "2"
+    assert alice is not None and alice.name == "Alice"
+    assert await roster.get_by_id("1") is alice
+    assert await roster.get_by_name("Carol") is None
+
+    assert len(calls) == 1
+    assert roster.misses == 1
+    assert roster.hits == 3
+
+
+@pytest.mark.asyncio
+async def test_roster_should_reload_after_invalidate():
+    calls = []
+    roster = TeamsRoster(_loader(calls), ttl=60)
+
+    await roster.members()
+    roster.invalidate()
+    await roster.members()
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_roster_should_not_cache_with_zero_ttl():
+    calls = []
+    roster = TeamsRoster(_loader(calls), ttl=0)
+
+    await roster.members()
+    await roster.members()
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_roster_should_coalesce_concurrent_loads():
+    calls = []
+    roster = TeamsRoster(_loader(calls), ttl=0)
+
+    await asyncio.gather(*[roster.members() for _ in range(5)])
+
+    assert len(calls) == 1
+    assert roster.stats()["coalesced"] == 4
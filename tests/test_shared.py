@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from mcp_teams_server.shared import SharedResource
+
+
+def _resource(events: list[str]) -> SharedResource[int]:
+    @asynccontextmanager
+    async def factory():
+        events.append("enter")
+        # Let concurrent holders arrive while the resource is being built
+        await asyncio.sleep(0.01)
+        try:
+            yield len(events)
+        finally:
+            events.append("exit")
+
+    return SharedResource(factory)
+
+
+@pytest.mark.asyncio
+async def test_shared_resource_should_be_built_once_for_overlapping_holders():
+    events: list[str] = []
+    resource = _resource(events)
+    values: list[int] = []
+
+    async def hold(delay: float):
+        async with resource.hold() as value:
+            values.append(value)
+            await asyncio.sleep(delay)
+
+    await asyncio.gather(hold(0.01), hold(0.03), hold(0.02))
+
+    assert values == [1, 1, 1]
+    assert events == ["enter", "exit"]
+    assert resource.holders == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_resource_should_be_rebuilt_after_the_last_holder():
+    events: list[str] = []
+    resource = _resource(events)
+
+    async with resource.hold():
+        pass
+    async with resource.hold():
+        pass
+
+    assert events == ["enter", "exit", "enter", "exit"]
@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+
+import pytest
+
+from mcp_teams_server.singleflight import SingleFlight, merge_stats
+
+
+def _call(calls: list, result="value", error: Exception | None = None):
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        if error is not None:
+            raise error
+        return result
+
+    return call
+
+
+@pytest.mark.asyncio
+async def test_single_flight_should_share_concurrent_calls():
+    calls = []
+    single_flight = SingleFlight()
+
+    results = await asyncio.gather(
+        *[single_flight.run(("message", "1"), _call(calls)) for _ in range(5)]
+    )
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert single_flight.stats() == {"message": {"calls": 1, "coalesced": 4}}
+    assert single_flight.inflight() == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_should_not_share_different_keys_or_later_calls():
+    calls = []
+    single_flight = SingleFlight()
+
+    await asyncio.gather(
+        single_flight.run(("message", "1"), _call(calls)),
+        single_flight.run(("message", "2"), _call(calls)),
+    )
+    await single_flight.run(("message", "1"), _call(calls))
+
+    assert len(calls) == 3
+    assert single_flight.stats()["message"]["coalesced"] == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_should_share_errors():
+    calls = []
+    single_flight = SingleFlight()
+
+    results = await asyncio.gather(
+        *[
+            single_flight.run(("replies",), _call(calls, error=ValueError("boom")))
+            for _ in range(3)
+        ],
+        return_exceptions=True,
+    )
+
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_should_survive_cancelled_caller():
+    calls = []
+    single_flight = SingleFlight()
+
+    first = asyncio.create_task(single_flight.run(("initialize",), _call(calls)))
+    second = asyncio.create_task(single_flight.run(("initialize",), _call(calls)))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "value"
+    assert len(calls) == 1
+
+
+def test_merge_stats():
+    merged = merge_stats(
+        {"message": {"calls": 2, "coalesced": 1}},
+        {"message": {"calls": 1, "coalesced": 3}, "initialize": {"calls": 1}},
+    )
+
+    assert merged == {
+        "message": {"calls": 3, "coalesced": 4},
+        "initialize": {"calls": 1, "coalesced": 0},
+    }
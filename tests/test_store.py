@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+from datetime import datetime
+
+import pytest
+
+from mcp_teams_server.store import Delivery, StoredMessage, TeamsStore
+
+
+@pytest.fixture()
+def store(tmp_path):
+    store = TeamsStore(str(tmp_path / "store.db"))
+    yield store
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_watermark_should_persist_across_connections(store, tmp_path):
+    await store.set_watermark("delta:team:channel", "link-1")
+    await store.set_watermark("delta:team:channel", "link-2")
+    store.close()
+
+    reopened = TeamsStore(str(tmp_path / "store.db"))
+    assert await reopened.get_watermark("delta:team:channel") == "link-2"
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_watermark_should_be_deleted(store):
+    await store.set_watermark("delta:team:channel", "link")
+    await store.delete_watermark("delta:team:channel")
+
+    assert await store.get_watermark("delta:team:channel") is None
+
+
+@pytest.mark.asyncio
+async def test_search_messages_should_rank_and_filter(store):
+    await store.save_messages(
+        "team",
+        "channel",
+        [
+            StoredMessage("1", "1", "<p>Payment outage</p>", datetime(2025, 1, 1)),
+            StoredMessage("2", "1", "<p>Payment restored</p>", datetime(2025, 2, 1)),
+            StoredMessage("3", "3", "<p>Deploy done</p>", datetime(2025, 2, 1)),
+        ],
+    )
+
+    hits = await store.search_messages("team", "channel", "payment outage")
+    assert [hit.message_id for hit in hits] == ["1"]
+
+    hits = await store.search_messages(
+        "team", "channel", "payment", since=datetime(2025, 1, 15)
+    )
+    assert [hit.message_id for hit in hits] == ["2"]
+
+
+@pytest.mark.asyncio
+async def test_search_messages_should_drop_deleted_messages(store):
+    await store.save_messages(
+        "team", "channel", [StoredMessage("1", "1", "payment outage")]
+    )
+    await store.save_messages(
+        "team", "channel", [StoredMessage("1", "1", "", deleted=True)]
+    )
+
+    assert await store.search_messages("team", "channel", "payment") == []
+
+
+@pytest.mark.asyncio
+async def test_claim_delivery_should_keep_replies_in_order(store):
+    await store.add_delivery(Delivery("a", "team", "channel", "1", None, "x"), 0)
+    await store.add_delivery(Delivery("b", "team", "channel", "1", None, "y"), 0)
+    await store.add_delivery(Delivery("c", "team", "channel", None, "T", "z"), 0)
+
+    first = await store.claim_delivery(10, lease=60)
+    second = await store.claim_delivery(10, lease=60)
+    assert (first.delivery_id, first.status, first.attempts) == ("a", "sending", 1)
+    assert second.delivery_id == "c"
+    assert await store.claim_delivery(10, lease=60) is None
+
+    await store.fail_delivery("a", "throttled", retry_at=20)
+    assert await store.claim_delivery(10, lease=60) is None
+    retried = await store.claim_delivery(20, lease=60)
+    assert (retried.delivery_id, retried.attempts) == ("a", 2)
+
+    await store.complete_delivery("a", "1", "m1")
+    assert (await store.claim_delivery(20, lease=60)).delivery_id == "b"
+    assert (await store.get_delivery("a")).message_id == "m1"
+
+
+@pytest.mark.asyncio
+async def test_claim_delivery_should_reclaim_expired_leases(store, tmp_path):
+    await store.add_delivery(Delivery("a", "team", "channel", "1", None, "x"), 0)
+    assert await store.claim_delivery(10, lease=60)
+    store.close()
+
+    reopened = TeamsStore(str(tmp_path / "store.db"))
+    assert await reopened.claim_delivery(30, lease=60) is None
+    delivery = await reopened.claim_delivery(70, lease=60)
+    assert delivery is not None
+    assert (delivery.delivery_id, delivery.attempts) == ("a", 2)
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_has_unfinished_deliveries_should_ignore_finished_ones(store):
+    assert not await store.has_unfinished_deliveries()
+    await store.add_delivery(Delivery("a", "team", "channel", "1", None, "x"), 0)
+    assert await store.has_unfinished_deliveries()
+
+    await store.claim_delivery(10, lease=60)
+    await store.complete_delivery("a", "1", "m1")
+    assert not await store.has_unfinished_deliveries()
+
+
+@pytest.mark.asyncio
+async def test_sent_messages_should_map_to_their_thread(store):
+    await store.save_sent_message("team", "channel", "2", "1")
+
+    assert await store.get_sent_message_thread("team", "channel", "2") == "1"
+    assert await store.get_sent_message_thread("team", "other", "2") is None
@@ -1,8 +1,10 @@
 # SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import logging
 import os
 import sys
+from datetime import datetime
 
 import pytest
 from azure.identity.aio import ClientSecretCredential
@@ -13,8 +15,13 @@ from botbuilder.integration.aiohttp import (
 from dotenv import load_dotenv
 from msgraph.graph_service_client import GraphServiceClient
 
+from mcp_teams_server.cache import ReadCache
 from mcp_teams_server.config import BotConfiguration
-from mcp_teams_server.teams import TeamsClient
+from mcp_teams_server.singleflight import SingleFlight
+from mcp_teams_server.store import SEARCH_SYNC_CONSUMER, TeamsStore
+from mcp_teams_server.teams import TeamsBulkPost, TeamsClient
+
+from .mock_botframework import CHANNEL, STATS
 
 load_dotenv()
 
@@ -109,3 +116,436 @@ async def test_list_members(setup_teams_client):
     result = await setup_teams_client.list_members()
     print(f"Result {result}\n")
     assert result is not None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_stream_threads(setup_teams_client):
+    result = [
+        thread async for thread in setup_teams_client.stream_threads(max_items=120)
+    ]
+    print(f"Result {result}\n")
+    assert len(result) <= 120
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_read_thread_replies_should_return_next_cursor(
+    setup_teams_client, thread_id
+):
+    first = await setup_teams_client.read_thread_replies(thread_id, 1)
+    print(f"Result {first}\n")
+    if first.cursor is not None:
+        second = await setup_teams_client.read_thread_replies(
+            thread_id, 1, first.cursor
+        )
+        assert second.items != first.items
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_stream_thread_replies(setup_teams_client, thread_id):
+    result = [
+        reply async for reply in setup_teams_client.stream_thread_replies(thread_id)
+    ]
+    print(f"Result {result}\n")
+    assert result is not None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_read_threads_with_replies(setup_teams_client):
+    result = await setup_teams_client.read_threads_with_replies(20, replies_limit=10)
+    print(f"Result {result}\n")
+    assert all(len(thread.replies) <= 10 for thread in result.items)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_sync_channel(setup_teams_client, tmp_path):
+    setup_teams_client.store = TeamsStore(str(tmp_path / "store.db"))
+    first = await setup_teams_client.sync_channel()
+    second = await setup_teams_client.sync_channel()
+    print(f"Result {first}\n{second}\n")
+    assert second.total <= first.total
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_search_messages(setup_teams_client, tmp_path):
+    setup_teams_client.store = TeamsStore(str(tmp_path / "store.db"))
+    threads = await setup_teams_client.read_threads(10)
+    result = await setup_teams_client.search_messages("thread")
+    print(f"Result {result}\n")
+    assert len(result.items) <= max(len(threads.items), 20)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_post_messages_bulk(setup_teams_client, thread_id):
+    result = await setup_teams_client.post_messages_bulk(
+        [
+            TeamsBulkPost(thread_id=thread_id, content="First bulk reply"),
+            TeamsBulkPost(thread_id=thread_id, content="Second bulk reply"),
+            TeamsBulkPost(title="Bulk thread", content="Bulk thread content"),
+            TeamsBulkPost(content="Missing thread and title"),
+        ]
+    )
+    print(f"Result {result}\n")
+    assert [item.index for item in result] == [0, 1, 2, 3]
+    assert result[3].error is not None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_read_thread_replies_should_use_read_cache(setup_teams_client, thread_id):
+    first = await setup_teams_client.read_thread_replies(thread_id, 10)
+    second = await setup_teams_client.read_thread_replies(thread_id, 10)
+    assert [item.message_id for item in second.items] == [
+        item.message_id for item in first.items
+    ]
+    assert setup_teams_client.read_cache.stats()["hits"] >= 1
+
+    await setup_teams_client.update_thread(thread_id, "Reply after cached read")
+    assert setup_teams_client.read_cache.stats()["invalidations"] >= 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_edit_message(setup_teams_client, thread_id):
+    posted = await setup_teams_client.update_thread(thread_id, "Status: starting")
+    result = await setup_teams_client.edit_message(posted.message_id, "Status: done")
+    print(f"Result {result}\n")
+    assert result.message_id == posted.message_id
+    assert result.thread_id == thread_id
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_read_threads_replies(setup_teams_client, thread_id):
+    result = await setup_teams_client.read_threads_replies([thread_id, "0"], 10)
+    print(f"Result {result}\n")
+    assert [item.thread_id for item in result] == [thread_id, "0"]
+    assert result[0].error is None
+    assert result[1].error is not None
+
+
+@pytest.mark.asyncio
+async def test_initialize_should_resolve_service_url(mock_backend, mock_client, caplog):
+    _, url = mock_backend
+
+    with caplog.at_level(logging.ERROR):
+        await mock_client.initialize()
+
+    assert mock_client.service_url == url
+    assert not caplog.records
+
+
+@pytest.mark.asyncio
+async def test_stream_threads_should_follow_graph_pages(mock_backend, mock_client):
+    app, _ = mock_backend
+    expected = [thread["id"] for thread in app[CHANNEL].recent_threads()]
+
+    result = [
+        thread.message_id async for thread in mock_client.stream_threads(page_size=5)
+    ]
+
+    assert result == expected
+    assert app[STATS]["requests"] == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_threads_should_stop_at_max_items(mock_backend, mock_client):
+    app, _ = mock_backend
+
+    result = [
+        thread async for thread in mock_client.stream_threads(page_size=5, max_items=7)
+    ]
+
+    assert len(result) == 7
+    assert app[STATS]["requests"] <= 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mock_options", [{"threads": 30, "replies": 0}])
+async def test_stream_threads_should_stop_after_older_page(mock_backend, mock_client):
+    app, _ = mock_backend
+    recent = app[CHANNEL].recent_threads()
+    since = datetime.fromisoformat(recent[3]["lastModifiedDateTime"][:-1] + "+00:00")
+
+    result = [
+        thread.message_id
+        async for thread in mock_client.stream_threads(page_size=3, since=since)
+    ]
+
+    assert result == [thread["id"] for thread in recent[:4]]
+    # The second page holds the oldest match, the third none, prefetch adds one
+    assert app[STATS]["requests"] <= 4
+
+
+@pytest.mark.asyncio
+async def test_read_thread_replies_should_follow_cursor(mock_backend, mock_client):
+    app, _ = mock_backend
+    thread_id = next(iter(app[CHANNEL].threads))
+    expected = [reply["id"] for reply in app[CHANNEL].replies[thread_id]]
+
+    pages = [await mock_client.read_thread_replies(thread_id, 3)]
+    while pages[-1].cursor is not None:
+        pages.append(
+            await mock_client.read_thread_replies(thread_id, 3, pages[-1].cursor)
+        )
+
+    assert [len(page.items) for page in pages] == [3, 3, 1]
+    assert [item.message_id for page in pages for item in page.items] == expected
+    assert all(page.total == len(expected) for page in pages)
+
+
+@pytest.mark.asyncio
+async def test_stream_thread_replies_should_read_every_page(mock_backend, mock_client):
+    app, _ = mock_backend
+    thread_id = next(iter(app[CHANNEL].threads))
+    expected = [reply["id"] for reply in app[CHANNEL].replies[thread_id]]
+
+    result = [
+        reply.message_id
+        async for reply in mock_client.stream_thread_replies(thread_id, page_size=2)
+    ]
+
+    assert result == expected
+
+
+@pytest.mark.asyncio
+async def test_read_threads_with_replies_should_keep_expanded_replies_of_failed_reads(
+    mock_backend, mock_client
+):
+    app, _ = mock_backend
+    channel = app[CHANNEL]
+    thread_ids = [thread["id"] for thread in channel.recent_threads()[:3]]
+    channel.failing.add(thread_ids[1])
+
+    result = await mock_client.read_threads_with_replies(3, replies_limit=10)
+
+    assert [thread.thread_id for thread in result.items] == thread_ids
+    assert [len(thread.replies) for thread in result.items] == [
+        7,
+        channel.expanded_replies,
+        7,
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mock_options", [{"threads": 2, "replies": 0, "latency": 0.005}]
+)
+async def test_post_messages_bulk_should_keep_thread_order(mock_backend, mock_client):
+    app, _ = mock_backend
+    channel = app[CHANNEL]
+    first, second = channel.threads
+    items = [
+        TeamsBulkPost(thread_id=thread_id, content=f"Reply {index}")
+        for index in range(3)
+        for thread_id in (first, second)
+    ]
+    items.append(TeamsBulkPost(title="Bulk thread", content="New thread"))
+    items.append(TeamsBulkPost(content="Missing thread and title"))
+
+    result = await mock_client.post_messages_bulk(items, concurrency=4)
+
+    assert [item.index for item in result] == list(range(len(items)))
+    assert all(item.error is None for item in result[:-1])
+    assert result[-1].error is not None
+    for thread_id in (first, second):
+        posted = [item.message_id for item in result if item.thread_id == thread_id]
+        # Replies are listed newest first
+        received = [reply["id"] for reply in reversed(channel.replies[thread_id])]
+        assert received == posted
+    assert result[-2].thread_id in channel.threads
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mock_options", [{"threads": 3, "replies": 2}])
+async def test_read_threads_replies_should_report_failed_threads(
+    mock_backend, mock_client
+):
+    app, _ = mock_backend
+    channel = app[CHANNEL]
+    thread_ids = list(channel.threads)
+    channel.failing.add(thread_ids[1])
+
+    result = await mock_client.read_threads_replies(thread_ids, 10, concurrency=2)
+
+    assert [item.thread_id for item in result] == thread_ids
+    assert result[1].replies is None
+    assert result[1].error is not None
+    for item in (result[0], result[2]):
+        assert item.error is None
+        assert item.replies is not None and item.replies.total == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mock_options", [{"threads": 3, "replies": 2}])
+async def test_read_threads_replies_should_spend_budget_in_request_order(
+    mock_backend, mock_client
+):
+    app, _ = mock_backend
+    channel = app[CHANNEL]
+    thread_ids = list(channel.threads)
+    # Enough for the replies of the first thread only
+    budget = sum(
+        len(reply["body"]["content"].encode())
+        for reply in channel.replies[thread_ids[0]]
+    )
+    renderer = mock_client.create_renderer(max_response_bytes=budget)
+
+    result = await mock_client.read_threads_replies(
+        thread_ids, 10, renderer=renderer, concurrency=3
+    )
+
+    pages = [item.replies for item in result if item.replies is not None]
+    assert len(pages) == 3
+    assert not any(reply.truncated for reply in pages[0].items)
+    assert all(
+        reply.truncated and reply.content == ""
+        for page in pages[1:]
+        for reply in page.items
+    )
+
+
+@pytest.mark.asyncio
+async def test_edit_message_should_send_first_edit_at_once(
+    mock_backend, mock_client_factory
+):
+    app, _ = mock_backend
+    channel = app[CHANNEL]
+    client = mock_client_factory(edit_debounce=10)
+    reply = await client.update_thread(next(iter(channel.threads)), "Progress 0%")
+
+    def content() -> str:
+        message = channel.find(reply.message_id)
+        assert message is not None
+        return message["body"]["content"]
+
+    await asyncio.wait_for(client.edit_message(reply.message_id, "Progress 10%"), 5)
+    first = content()
+    later = [
+        asyncio.ensure_future(client.edit_message(reply.message_id, f"Progress {p}%"))
+        for p in (50, 90)
+    ]
+    await asyncio.sleep(0.05)
+    held = content()
+    await client.edit_debouncer.close()
+    results = await asyncio.gather(*later)
+
+    assert first == "<p>Progress 10%</p>"
+    assert held == first
+    assert content() == "<p>Progress 90%</p>"
+    assert [result.content for result in results] == ["Progress 90%"] * 2
+    assert client.edit_debouncer.stats()["messages"] == 2
+
+
+@pytest.mark.asyncio
+async def test_read_thread_replies_should_serve_cached_pages(
+    mock_backend, mock_client_factory
+):
+    app, _ = mock_backend
+    thread_id = next(iter(app[CHANNEL].threads))
+    read_cache = ReadCache(ttl=60)
+    client = mock_client_factory(read_cache=read_cache)
+
+    first = await client.read_thread_replies(thread_id, 10)
+    requests = app[STATS]["requests"]
+    second = await client.read_thread_replies(thread_id, 10)
+
+    assert second == first
+    assert app[STATS]["requests"] == requests
+    assert read_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_read_thread_replies_should_share_reads_between_clients(
+    mock_backend, mock_client_factory
+):
+    app, _ = mock_backend
+    thread_id = next(iter(app[CHANNEL].threads))
+    read_cache = ReadCache(ttl=60)
+    single_flight = SingleFlight()
+    # Clients of two sessions on the same channel, built over the shared state
+    first, second = (
+        mock_client_factory(read_cache=read_cache, single_flight=single_flight)
+        for _ in range(2)
+    )
+
+    requests = app[STATS]["requests"]
+    pages = await asyncio.gather(
+        first.read_thread_replies(thread_id, 10),
+        second.read_thread_replies(thread_id, 10),
+        first.read_thread_replies(thread_id, 10),
+        second.read_thread_replies(thread_id, 10),
+    )
+
+    assert all(page == pages[0] for page in pages)
+    assert app[STATS]["requests"] == requests + 1
+    assert single_flight.stats()["replies"] == {"calls": 1, "coalesced": 3}
+
+
+@pytest.mark.asyncio
+async def test_read_thread_replies_should_read_expired_pages_again(
+    mock_backend, mock_client_factory
+):
+    app, _ = mock_backend
+    channel = app[CHANNEL]
+    thread_id = next(iter(channel.threads))
+    read_cache = ReadCache(ttl=60)
+    client = mock_client_factory(read_cache=read_cache)
+
+    await client.read_thread_replies(thread_id, 10)
+    read_cache.ttl = 0.000001
+    requests = app[STATS]["requests"]
+    channel.post(thread_id, "Reply after expiry")
+    expired = await client.read_thread_replies(thread_id, 10)
+
+    assert app[STATS]["requests"] == requests + 1
+    assert expired.items[0].content == "<p>Reply after expiry</p>"
+    assert read_cache.stats()["misses"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mock_options", [{"threads": 3, "replies": 2}])
+async def test_sync_channel_should_keep_a_watermark_per_consumer(
+    tmp_path, mock_backend, mock_client_factory
+):
+    app, _ = mock_backend
+    channel = app[CHANNEL]
+    store = TeamsStore(str(tmp_path / "store.db"))
+    client = mock_client_factory(store=store)
+    try:
+        first = await client.sync_channel()
+        unchanged = await client.sync_channel()
+        channel.post(next(iter(channel.threads)), "Reply after sync")
+        changed = await client.sync_channel()
+        other = await client.sync_channel(consumer=SEARCH_SYNC_CONSUMER)
+    finally:
+        store.close()
+
+    assert len(first.items) == 3
+    assert unchanged.items == []
+    assert len(changed.items) == 1
+    assert len(other.items) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mock_options", [{"threads": 3, "replies": 2}])
+async def test_sync_channel_should_share_concurrent_delta_walks(
+    tmp_path, mock_backend, mock_client_factory
+):
+    app, _ = mock_backend
+    store = TeamsStore(str(tmp_path / "store.db"))
+    client = mock_client_factory(store=store)
+    try:
+        results = await asyncio.gather(*(client.sync_channel() for _ in range(5)))
+    finally:
+        store.close()
+
+    assert [len(result.items) for result in results] == [3] * 5
+    assert app[STATS]["requests"] == 1
+    assert client.single_flight.stats()["sync"] == {"calls": 1, "coalesced": 4}
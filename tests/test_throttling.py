@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+
+import pytest
+
+from mcp_teams_server.throttling import (
+    GRAPH,
+    RequestScheduler,
+    get_retry_after,
+    get_status_code,
+)
+
+from .mock_botframework import STATS
+
+
+class ThrottledError(Exception):
+    def __init__(self, status: int, headers: dict | None = None):
+        super().__init__(f"status {status}")
+        self.response_status_code = status
+        self.response_headers = headers or {}
+
+
+def test_should_read_status_and_retry_after_from_errors():
+    error = ThrottledError(429, {"Retry-After": "3"})
+
+    assert get_status_code(error) == 429
+    assert get_retry_after(error) == 3.0
+    assert get_retry_after(ThrottledError(503)) is None
+
+
+@pytest.mark.asyncio
+async def test_scheduler_should_retry_throttled_requests():
+    scheduler = RequestScheduler({GRAPH: (100, 2)}, base_delay=0.01)
+    calls = []
+
+    async def operation():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ThrottledError(429, {"Retry-After": "0.01"})
+        return "ok"
+
+    assert await scheduler.run(GRAPH, operation) == "ok"
+    stats = scheduler.stats()[GRAPH]
+    assert stats["retries"] == 2
+    assert stats["throttled"] == 2
+
+
+@pytest.mark.asyncio
+async def test_scheduler_should_not_retry_client_errors():
+    scheduler = RequestScheduler({GRAPH: (100, 2)})
+    calls = []
+
+    async def operation():
+        calls.append(1)
+        raise ThrottledError(404)
+
+    with pytest.raises(ThrottledError):
+        await scheduler.run(GRAPH, operation)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_scheduler_should_cap_concurrency():
+    scheduler = RequestScheduler({GRAPH: (0, 2)})
+    running = []
+    peak = []
+
+    async def operation():
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+
+    await asyncio.gather(*[scheduler.run(GRAPH, operation) for _ in range(10)])
+
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mock_options", [{"threads": 4, "replies": 2, "throttle_every": 2}]
+)
+async def test_scheduler_should_see_graph_throttling(mock_backend, mock_client_factory):
+    app, _ = mock_backend
+    scheduler = RequestScheduler(base_delay=0.01)
+    client = mock_client_factory(scheduler=scheduler)
+
+    # The second request is throttled by the mock and retried by the scheduler
+    results = [await client.read_threads(4) for _ in range(2)]
+
+    assert [len(result.items) for result in results] == [4, 4]
+    assert scheduler.stats()[GRAPH]["throttled"] == 1
+    assert app[STATS]["throttled"] == 1
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import httpx
+import pytest
+
+from mcp_teams_server.transport import SharedTransport
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_shared():
+    transport = SharedTransport(pool_size=4, keepalive_expiry=5.0, http2=False)
+    try:
+        client = transport.http_client()
+        assert transport.http_client() is client
+        assert transport.stats()["graph"]["max_connections"] == 4
+        assert transport.stats()["graph"]["in_flight"] == 0
+    finally:
+        await transport.close()
+    assert transport.http_client() is not client
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_session_is_shared():
+    transport = SharedTransport(pool_size=4)
+    session = transport.aiohttp_session()
+    assert transport.aiohttp_session() is session
+    await transport.close()
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_should_not_stay_in_flight():
+    transport = SharedTransport(http2=False)
+    try:
+        with pytest.raises(httpx.ConnectError):
+            # Nothing listens on port 9 of the loopback interface
+            await transport.http_client().get("http://127.0.0.1:9/")
+        assert transport.stats()["graph"]["requests"] == 1
+        assert transport.stats()["graph"]["in_flight"] == 0
+    finally:
+        await transport.close()
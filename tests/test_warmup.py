@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2025 INDUSTRIA DE DISEÑO TEXTIL, S.A. (INDITEX, S.A.)
+# SPDX-License-Identifier: Apache-2.0
+import base64
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mcp_teams_server.warmup import (
+    BOT_TOKEN,
+    DEGRADED,
+    GRAPH_TOKEN,
+    READY,
+    ROSTER,
+    SERVICE_URL,
+    STARTING,
+    Readiness,
+    TokenWarmer,
+    get_token_expiry,
+)
+
+
+def _jwt(expiry: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": expiry}).encode())
+    return f"header.{payload.decode().rstrip('=')}.signature"
+
+
+def _warmer(readiness: Readiness, graph_error: Exception | None = None):
+    expiry = time.time() + 3600
+    credentials = MagicMock()
+    credentials.get_token = AsyncMock(
+        side_effect=graph_error, return_value=SimpleNamespace(expires_on=expiry)
+    )
+    bot_credentials = MagicMock()
+    bot_credentials.get_access_token.return_value = _jwt(expiry)
+    session = MagicMock()
+    session.get_client = AsyncMock(
+        return_value=SimpleNamespace(
+            config=SimpleNamespace(credentials=bot_credentials)
+        )
+    )
+    client = MagicMock()
+    client.initialize = AsyncMock()
+    client.roster.members = AsyncMock(return_value=[])
+    warmer = TokenWarmer(credentials, ["scope"], session, readiness=readiness)
+    return warmer, client
+
+
+def test_get_token_expiry():
+    assert get_token_expiry(_jwt(1700000000)) == 1700000000
+    assert get_token_expiry("not a token") is None
+
+
+def test_readiness_starts_until_finished():
+    readiness = Readiness()
+    readiness.record(GRAPH_TOKEN, 0.1)
+
+    assert readiness.state == STARTING
+    readiness.finish()
+    assert readiness.ready
+    assert readiness.as_dict()["startup_seconds"] is not None
+
+
+@pytest.mark.asyncio
+async def test_warm_up_runs_every_step():
+    readiness = Readiness()
+    warmer, client = _warmer(readiness)
+
+    await warmer.warm_up(client, warm_roster=True)
+
+    assert readiness.state == READY
+    assert set(readiness.checks) == {GRAPH_TOKEN, BOT_TOKEN, SERVICE_URL, ROSTER}
+    client.initialize.assert_awaited_once()
+    assert warmer.stats()[BOT_TOKEN]["expires_in"] > 3000
+
+
+@pytest.mark.asyncio
+async def test_warm_up_failure_degrades_readiness():
+    readiness = Readiness()
+    warmer, client = _warmer(readiness, graph_error=RuntimeError("denied"))
+
+    await warmer.warm_up(client)
+
+    assert readiness.state == DEGRADED
+    assert readiness.checks[GRAPH_TOKEN]["error"] == "denied"
+    assert readiness.checks[BOT_TOKEN]["ok"]
+
+    # A later successful refresh recovers the state
+    get_token = warmer.credentials.get_token
+    assert isinstance(get_token, AsyncMock)
+    get_token.side_effect = None
+    await warmer._check(GRAPH_TOKEN, warmer._acquire_graph_token)
+    assert readiness.state == READY